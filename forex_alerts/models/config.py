@@ -5,8 +5,10 @@ Configuration data model for the Forex Alert System.
 from dataclasses import dataclass, field
 from typing import List, Optional, Dict, Any
 
+_VALID_METHODS = frozenset({"console", "email", "desktop"})
 
-@dataclass
+
+@dataclass(slots=True)
 class Config:
     """
     Configuration settings for the Forex Alert System.
@@ -37,10 +39,12 @@ class Config:
         if self.data_retention_hours <= 0:
             raise ValueError(f"Invalid data_retention_hours: {self.data_retention_hours}. Must be positive")
         
-        valid_methods = ["console", "email", "desktop"]
-        for method in self.notification_methods:
-            if method not in valid_methods:
-                raise ValueError(f"Invalid notification method: {method}. Must be one of {valid_methods}")
+        invalid_methods = [m for m in self.notification_methods if m not in _VALID_METHODS]
+        if invalid_methods:
+            raise ValueError(
+                f"Invalid notification methods: {invalid_methods}. "
+                f"Must be one of {sorted(_VALID_METHODS)}"
+            )
     
     def validate_for_monitoring(self):
         """Validate configuration is ready for monitoring (requires symbols)."""
@@ -2,11 +2,14 @@
 Market data model for forex price information.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
+from typing import Any, Dict, List
 
+OHLCV_COLUMNS = ['Open', 'High', 'Low', 'Close', 'Volume']
 
-@dataclass
+
+@dataclass(slots=True)
 class MarketData:
     """
     Represents market data for a forex symbol at a specific time.
@@ -19,6 +22,8 @@ class MarketData:
         low: Lowest price
         close: Closing price
         volume: Trading volume
+        typical_price: Typical price (HLC/3), computed on initialization
+        weighted_price: Typical price times volume, computed on initialization
     """
     symbol: str
     timestamp: datetime
@@ -27,21 +32,28 @@ class MarketData:
     low: float
     close: float
     volume: int
+    typical_price: float = field(init=False, repr=False, compare=False)
+    weighted_price: float = field(init=False, repr=False, compare=False)
     
     def __post_init__(self):
         """Validate market data after initialization."""
         if not self.symbol:
             raise ValueError("Symbol cannot be empty")
         
-        prices = [self.open, self.high, self.low, self.close]
-        if any(price <= 0 for price in prices):
+        if self.open <= 0 or self.high <= 0 or self.low <= 0 or self.close <= 0:
             raise ValueError("All prices must be positive")
         
-        if self.high < max(self.open, self.close) or self.low > min(self.open, self.close):
+        body_high = self.open if self.open > self.close else self.close
+        body_low = self.open if self.open < self.close else self.close
+        if self.high < body_high or self.low > body_low:
             raise ValueError("High/Low prices are inconsistent with Open/Close")
         
         if self.volume < 0:
             raise ValueError("Volume cannot be negative")
+        
+        # Derived prices are computed once rather than on every access
+        self.typical_price = (self.high + self.low + self.close) / 3
+        self.weighted_price = self.typical_price * self.volume
     
     def to_dict(self) -> dict:
         """Convert market data to dictionary representation."""
@@ -55,12 +67,93 @@ class MarketData:
             'volume': self.volume
         }
     
-    @property
-    def typical_price(self) -> float:
-        """Calculate typical price (HLC/3)."""
-        return (self.high + self.low + self.close) / 3
+    @classmethod
+    def from_dataframe(cls, df: Any, symbol: str) -> List['MarketData']:
+        """
+        Build MarketData objects for every row of an OHLCV DataFrame.
+        
+        Validation runs once over whole columns instead of per row, and
+        instances are created without re-running __post_init__.
+        
+        Args:
+            df: DataFrame with Open/High/Low/Close/Volume columns and a
+                datetime index
+            symbol: The forex symbol the rows belong to
+            
+        Returns:
+            List[MarketData]: One object per row, in index order
+            
+        Raises:
+            ValueError: If any row fails MarketData validation
+        """
+        if not symbol:
+            raise ValueError("Symbol cannot be empty")
+        
+        columns = cls.to_soa(df)
+        arr = columns['ohlcv']
+        
+        if (arr[:, :4] <= 0).any():
+            raise ValueError("All prices must be positive")
+        
+        body = arr[:, [0, 3]]
+        if ((arr[:, 1] < body.max(axis=1)) | (arr[:, 2] > body.min(axis=1))).any():
+            raise ValueError("High/Low prices are inconsistent with Open/Close")
+        
+        if (arr[:, 4] < 0).any():
+            raise ValueError("Volume cannot be negative")
+        
+        rows = zip(columns['timestamp'], arr[:, :4].tolist(),
+                   arr[:, 4].astype('int64').tolist(),
+                   columns['typical_price'].tolist(), columns['weighted_price'].tolist())
+        
+        result = []
+        for timestamp, (open_, high, low, close), volume, typical, weighted in rows:
+            instance = object.__new__(cls)
+            instance.symbol = symbol
+            instance.timestamp = timestamp
+            instance.open = open_
+            instance.high = high
+            instance.low = low
+            instance.close = close
+            instance.volume = volume
+            instance.typical_price = typical
+            instance.weighted_price = weighted
+            result.append(instance)
+        
+        return result
     
-    @property
-    def weighted_price(self) -> float:
-        """Calculate volume-weighted price for VWAP calculations."""
-        return self.typical_price * self.volume
\ No newline at end of file
+    @staticmethod
+    def to_soa(df: Any) -> Dict[str, Any]:
+        """
+        Convert an OHLCV DataFrame to a structure-of-arrays representation.
+        
+        Args:
+            df: DataFrame with Open/High/Low/Close/Volume columns and a
+                datetime index
+            
+        Returns:
+            Dict[str, Any]: NumPy arrays keyed by lower-case field name,
+            including derived typical_price and weighted_price columns and
+            the combined 2D 'ohlcv' array; 'timestamp' holds the index values
+            
+        Raises:
+            ValueError: If required columns are missing
+        """
+        missing_columns = [col for col in OHLCV_COLUMNS if col not in df.columns]
+        if missing_columns:
+            raise ValueError(f"Missing required columns: {missing_columns}")
+        
+        arr = df[OHLCV_COLUMNS].to_numpy(dtype='float64')
+        typical_price = (arr[:, 1] + arr[:, 2] + arr[:, 3]) / 3
+        
+        return {
+            'timestamp': list(df.index),
+            'open': arr[:, 0],
+            'high': arr[:, 1],
+            'low': arr[:, 2],
+            'close': arr[:, 3],
+            'volume': arr[:, 4],
+            'typical_price': typical_price,
+            'weighted_price': typical_price * arr[:, 4],
+            'ohlcv': arr
+        }
@@ -2,8 +2,21 @@
 Service classes for the Forex Alert System.
 """
 
-from .config_manager import ConfigManager
-from .data_fetcher import DataFetcher
-from .data_storage import DataStorage
+import importlib
 
-__all__ = ['ConfigManager', 'DataFetcher', 'DataStorage']
\ No newline at end of file
+# Services are imported on first attribute access so that importing one
+# submodule (e.g. config_manager) does not pull in pandas via the others.
+_SERVICE_MODULES = {
+    'ConfigManager': '.config_manager',
+    'DataFetcher': '.data_fetcher',
+    'DataStorage': '.data_storage',
+}
+
+__all__ = ['ConfigManager', 'DataFetcher', 'DataStorage']
+
+
+def __getattr__(name):
+    if name in _SERVICE_MODULES:
+        module = importlib.import_module(_SERVICE_MODULES[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
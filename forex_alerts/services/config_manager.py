@@ -2,12 +2,48 @@
 Configuration management service for the Forex Alert System.
 """
 
+import copy
 import json
+import mmap
 import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import fields, replace
+from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Any, Optional
-import yfinance as yf
+from typing import Dict, List, Any, Optional, Tuple
 from ..models.config import Config
+from ..utils.symbols import is_valid_symbol
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _dumps(data: Dict[str, Any]) -> bytes:
+    """Serialize configuration data to indented UTF-8 JSON bytes."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def _loads(data: bytes) -> Dict[str, Any]:
+    """Deserialize JSON bytes into configuration data."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Config field names in constructor order, for positional construction
+_CONFIG_FIELDS = tuple(f.name for f in fields(Config))
+_CONFIG_FIELD_SET = frozenset(_CONFIG_FIELDS)
+
+
+# Six-letter forex pair with an optional (any-case) =X suffix and surrounding whitespace
+_FOREX_PAIR_RE = re.compile(r'\s*([A-Za-z]{6})(?:=[Xx])?\s*')
 
 
 class ConfigManager:
@@ -21,6 +57,21 @@ class ConfigManager:
     DEFAULT_CONFIG_DIR = Path.home() / ".forex_alerts"
     DEFAULT_CONFIG_FILE = "config.json"
     CONFIG_VERSION = "1.0"
+    MAX_VALIDATION_WORKERS = 16
+    MMAP_THRESHOLD_BYTES = 64 * 1024  # Smaller files are cheaper to read()
+    
+    # Serialized default configuration; treat as read-only and copy mutable values
+    DEFAULT_CONFIG_DATA: Dict[str, Any] = {
+        'symbols': [],  # Will be populated by user input
+        'ema_length': 15,
+        'update_frequency': 60,
+        'notification_methods': ["console"],
+        'email_config': None,
+        'data_retention_hours': 24,
+    }
+    
+    # Validated default Config, built on first use and copied for each caller
+    _default_config: Optional[Config] = None
     
     def __init__(self, config_path: Optional[str] = None):
         """
@@ -41,6 +92,9 @@ class ConfigManager:
         
         # Ensure config directory exists
         self.config_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        # Last loaded config keyed by the file's mtime (ns)
+        self._cached: Optional[Tuple[int, Config]] = None
     
     def load_config(self) -> Config:
         """
@@ -57,39 +111,72 @@ class ConfigManager:
             # Create default config file
             default_config = self.get_default_config()
             self.save_config(default_config)
+            self._cache_config(default_config)
             return default_config
         
+        # Reuse the parsed config if the file hasn't changed since last load;
+        # callers get their own copy so mutations can't leak into the cache
+        stat = self.config_path.stat()
+        if self._cached is not None and self._cached[0] == stat.st_mtime_ns:
+            return copy.deepcopy(self._cached[1])
+        
         try:
-            with open(self.config_path, 'r', encoding='utf-8') as f:
-                config_data = json.load(f)
+            config_data = _loads(self._read_config_bytes(stat.st_size))
             
-            # Handle migration if needed
+            # Migrate, merge with defaults and split off metadata in one pass
             original_version = config_data.get('_version', '0.0')
-            config_data = self._migrate_config(config_data)
-            
-            # Merge with defaults to ensure all fields are present
-            config_data = self._merge_with_defaults(config_data)
+            config_fields, metadata = self._normalize(config_data)
             
-            # Filter out metadata fields before creating Config object
-            config_fields = {k: v for k, v in config_data.items() 
-                           if not k.startswith('_')}
+            # Validate and create Config object; positional args skip kwarg
+            # dispatch and ignore any keys that aren't config fields
+            config = Config(*[config_fields[name] for name in _CONFIG_FIELDS])
             
-            # Validate and create Config object
-            config = Config.from_dict(config_fields)
-            
-            # Save back to file if migration occurred or if merging added new fields
-            if original_version == '0.0' or len(config_data) > len(config_fields):
+            # Save back to file only if migration occurred or defaults filled gaps
+            added_defaults = any(key not in config_data for key in config_fields)
+            if original_version == '0.0' or added_defaults:
                 # Preserve metadata when saving
-                metadata = {k: v for k, v in config_data.items() if k.startswith('_')}
                 self.save_config(config, preserve_metadata=metadata)
             
+            self._cache_config(config)
             return config
-            
+        
         except json.JSONDecodeError as e:
+            # Also covers orjson.JSONDecodeError, which subclasses it
             raise ValueError(f"Invalid JSON in configuration file: {e}")
         except Exception as e:
             raise ValueError(f"Error loading configuration: {e}")
     
+    def _read_config_bytes(self, size: int) -> bytes:
+        """
+        Read the raw configuration file contents.
+        
+        Large files are memory-mapped with MAP_POPULATE (where supported) so
+        the kernel prefaults every page at once; small files use one read().
+        
+        Args:
+            size: Size of the configuration file in bytes
+            
+        Returns:
+            bytes: File contents
+        """
+        if size < self.MMAP_THRESHOLD_BYTES or not hasattr(mmap, 'MAP_POPULATE'):
+            # Single read() of the whole file instead of buffered text reads
+            return self.config_path.read_bytes()
+        
+        with open(self.config_path, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, flags=mmap.MAP_SHARED | mmap.MAP_POPULATE,
+                           prot=mmap.PROT_READ) as mm:
+                return bytes(mm)
+    
+    def _cache_config(self, config: Config) -> None:
+        """
+        Remember a copy of a loaded config against the config file's current mtime.
+        
+        Args:
+            config: Configuration object matching the file on disk
+        """
+        self._cached = (self.config_path.stat().st_mtime_ns, copy.deepcopy(config))
+    
     def save_config(self, config: Config, preserve_metadata: Dict[str, Any] = None) -> None:
         """
         Save configuration to file with version information.
@@ -101,6 +188,9 @@ class ConfigManager:
         Raises:
             IOError: If configuration cannot be saved
         """
+        # Any write invalidates the cached config
+        self._cached = None
+        
         try:
             config_data = config.to_dict()
             
@@ -112,14 +202,37 @@ class ConfigManager:
             
             # Set version and timestamps
             config_data['_version'] = self.CONFIG_VERSION
-            config_data['_created'] = config_data.get('_created', self._get_timestamp())
-            config_data['_updated'] = self._get_timestamp()
+            timestamp = self._get_timestamp()
+            config_data.setdefault('_created', timestamp)
+            config_data['_updated'] = timestamp
             
-            with open(self.config_path, 'w', encoding='utf-8') as f:
-                json.dump(config_data, f, indent=2, ensure_ascii=False)
+            # Serialize once and write in a single call, flush it to disk, then
+            # swap the file into place so a crash mid-write can never leave a
+            # torn config behind and readers never see partial content
+            payload = _dumps(config_data)
+            tmp_path = self._temp_path()
+            try:
+                with open(tmp_path, 'wb') as f:
+                    f.write(payload)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, self.config_path)
+            except BaseException:
+                tmp_path.unlink(missing_ok=True)
+                raise
         except Exception as e:
             raise IOError(f"Error saving configuration: {e}")
     
+    def _temp_path(self) -> Path:
+        """
+        Get the scratch path used for atomic saves.
+        
+        Returns:
+            Path: Sibling of the config file (same filesystem, so os.replace
+            is an atomic rename), e.g. config.json.tmp
+        """
+        return self.config_path.with_name(self.config_path.name + '.tmp')
+    
     def validate_symbols(self, symbols: List[str]) -> List[str]:
         """
         Validate forex symbols using yfinance ticker validation.
@@ -136,19 +249,25 @@ class ConfigManager:
         if not symbols:
             raise ValueError("Symbol list cannot be empty")
         
+        cleaned = [(symbol, self._clean_symbol(symbol)) for symbol in symbols]
+        
+        # Probe each distinct symbol once; duplicates would otherwise race
+        # past the memoized validator and hit the network twice
+        unique = list(dict.fromkeys(clean for _, clean in cleaned))
+        if len(unique) == 1:
+            # No pool needed for a single round-trip
+            results = {unique[0]: self._validate_single_symbol(unique[0])}
+        else:
+            # Validation is network-bound, so probe all symbols concurrently
+            max_workers = min(self.MAX_VALIDATION_WORKERS, len(unique))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = dict(zip(unique, executor.map(self._validate_single_symbol, unique)))
+        
         valid_symbols = []
         invalid_symbols = []
         
-        for symbol in symbols:
-            # Clean and format symbol
-            clean_symbol = symbol.strip().upper()
-            
-            # Add =X suffix if not present for forex pairs
-            if not clean_symbol.endswith('=X') and len(clean_symbol) == 6:
-                clean_symbol += '=X'
-            
-            # Validate symbol with yfinance
-            if self._validate_single_symbol(clean_symbol):
+        for symbol, clean_symbol in cleaned:
+            if results[clean_symbol]:
                 valid_symbols.append(clean_symbol)
             else:
                 invalid_symbols.append(symbol)
@@ -161,6 +280,29 @@ class ConfigManager:
         
         return valid_symbols
     
+    def _clean_symbol(self, symbol: str) -> str:
+        """
+        Clean and format a user-supplied symbol for yfinance.
+        
+        Args:
+            symbol: Raw symbol (e.g., " eurusd ")
+            
+        Returns:
+            str: Formatted symbol (e.g., "EURUSD=X")
+        """
+        # Common case: one regex match formats a forex pair
+        match = _FOREX_PAIR_RE.fullmatch(symbol)
+        if match:
+            return f"{match.group(1).upper()}=X"
+        
+        clean_symbol = symbol.strip().upper()
+        
+        # Add =X suffix if not present for forex pairs
+        if not clean_symbol.endswith('=X') and len(clean_symbol) == 6:
+            clean_symbol += '=X'
+        
+        return clean_symbol
+    
     def _validate_single_symbol(self, symbol: str) -> bool:
         """
         Validate a single symbol using yfinance.
@@ -171,39 +313,36 @@ class ConfigManager:
         Returns:
             bool: True if symbol is valid, False otherwise
         """
-        try:
-            ticker = yf.Ticker(symbol)
-            # Try to get basic info to validate symbol exists
-            info = ticker.info
-            
-            # Check if we got valid data back
-            if not info or 'symbol' not in info:
-                return False
-            
-            # Additional check: try to get recent data
-            hist = ticker.history(period="1d", interval="1h")
-            return not hist.empty
-            
-        except Exception:
-            # Any exception means the symbol is invalid
-            return False
+        return is_valid_symbol(symbol)
     
     def get_default_config(self) -> Config:
         """
         Get default configuration values.
         
         Returns:
-            Config: Default configuration object
+            Config: Default configuration object (a fresh copy per call)
         """
-        return Config(
-            symbols=[],  # Will be populated by user input
-            ema_length=15,
-            update_frequency=60,
-            notification_methods=["console"],
-            email_config=None,
-            data_retention_hours=24
+        default = self._default_config
+        if default is None:
+            default = type(self)._default_config = Config.from_dict(self._default_fields())
+        
+        # Shallow copy with fresh containers so callers can't mutate the shared default
+        return replace(
+            default,
+            symbols=list(default.symbols),
+            notification_methods=list(default.notification_methods),
+            email_config=copy.copy(default.email_config)
         )
     
+    def _default_fields(self) -> Dict[str, Any]:
+        """
+        Copy the default configuration fields.
+        
+        Returns:
+            Dict[str, Any]: Default field values with fresh mutable containers
+        """
+        return {key: copy.copy(value) for key, value in self.DEFAULT_CONFIG_DATA.items()}
+    
     def update_config(self, **kwargs) -> Config:
         """
         Update existing configuration with new values.
@@ -215,7 +354,8 @@ class ConfigManager:
             Config: Updated configuration object
         """
         current_config = self.load_config()
-        config_dict = current_config.to_dict()
+        current_dict = current_config.to_dict()
+        config_dict = dict(current_dict)
         
         # Update with new values
         config_dict.update(kwargs)
@@ -224,6 +364,10 @@ class ConfigManager:
         if 'symbols' in kwargs:
             config_dict['symbols'] = self.validate_symbols(config_dict['symbols'])
         
+        # Nothing changed, so skip the write
+        if config_dict == current_dict:
+            return current_config
+        
         # Create new config object and save
         updated_config = Config.from_dict(config_dict)
         self.save_config(updated_config)
@@ -286,33 +430,37 @@ class ConfigManager:
         
         return migrated_data
     
-
-    
-
-    
-    def _merge_with_defaults(self, config_data: Dict[str, Any]) -> Dict[str, Any]:
+    def _normalize(self, config_data: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
         """
-        Merge configuration data with default values.
+        Migrate raw configuration data, fill in defaults and split off metadata.
+        
+        Replaces separate migrate/merge/filter steps with a single walk over
+        the loaded keys; only files needing migration are copied, and the
+        defaults are only built when the file is missing a config field.
         
         Args:
-            config_data: Configuration data from file
+            config_data: Raw configuration data from file
             
         Returns:
-            Dict[str, Any]: Configuration data merged with defaults
+            Tuple[Dict[str, Any], Dict[str, Any]]: Config fields merged with
+            defaults (loaded values take precedence) and metadata fields
         """
-        default_config = self.get_default_config()
-        default_dict = default_config.to_dict()
+        config_data = self._migrate_config(config_data)
         
-        # Merge defaults with loaded config (loaded config takes precedence)
-        merged_data = default_dict.copy()
-        merged_data.update(config_data)
+        config_fields = {}
+        metadata = {}
+        
+        for key, value in config_data.items():
+            if key.startswith('_'):
+                metadata[key] = value
+            else:
+                config_fields[key] = value
         
-        # Preserve metadata fields
-        for key in ['_version', '_created', '_updated', '_migrated']:
-            if key in config_data:
-                merged_data[key] = config_data[key]
+        # Loaded values take precedence; defaults only fill the gaps
+        if not _CONFIG_FIELD_SET <= config_fields.keys():
+            config_fields = {**self._default_fields(), **config_fields}
         
-        return merged_data
+        return config_fields, metadata
     
     def _get_timestamp(self) -> str:
         """
@@ -321,7 +469,6 @@ class ConfigManager:
         Returns:
             str: Current timestamp
         """
-        from datetime import datetime
         return datetime.now().isoformat()
     
     def reset_to_defaults(self) -> Config:
@@ -353,12 +500,14 @@ class ConfigManager:
             raise FileNotFoundError("Configuration file does not exist")
         
         if backup_suffix is None:
-            from datetime import datetime
-            backup_suffix = datetime.now().strftime("%Y%m%d_%H%M%S")
+            # Zero-padded ns token: sorts chronologically, no datetime formatting
+            backup_suffix = f"{time.time_ns():020d}"
         
         backup_path = self.config_path.with_suffix(f".backup_{backup_suffix}.json")
         
         try:
+            # A real copy, not a hard link: anything editing config.json in
+            # place (an editor, a manual edit) must not change the backup
             import shutil
             shutil.copy2(self.config_path, backup_path)
             return backup_path
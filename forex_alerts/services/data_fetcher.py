@@ -4,11 +4,37 @@ Data fetching service for forex market data using yfinance API.
 
 import time
 import logging
-from typing import Dict, List, Optional
-from datetime import datetime, timedelta
-import pandas as pd
-import yfinance as yf
+import os
+import random
+from importlib.util import find_spec
+from pathlib import Path
+from typing import Dict, List, Optional, TYPE_CHECKING
+from datetime import datetime, timedelta, date
 from ..models.market_data import MarketData
+from ..utils.http import create_session
+from ..utils.symbols import get_yfinance, is_valid_symbol
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Yahoo chart endpoint used for single-symbol OHLCV fetches
+CHART_URL = "https://query1.finance.yahoo.com/v8/finance/chart/{symbol}"
+CHART_HEADERS = {"User-Agent": "Mozilla/5.0"}
+
+# Parquet caching needs pyarrow; checked without importing it
+PARQUET_AVAILABLE = find_spec('pyarrow') is not None
+
+# pandas is imported on first use to keep module import cheap
+_pd = None
+
+
+def _get_pd():
+    """Import pandas on first use and cache the module."""
+    global _pd
+    if _pd is None:
+        import pandas
+        _pd = pandas
+    return _pd
 
 
 class DataFetcher:
@@ -17,19 +43,49 @@ class DataFetcher:
     and exponential backoff for API failures.
     """
     
-    def __init__(self, symbols: List[str], interval: str = "1m"):
+    DEFAULT_CACHE_DIR = Path.home() / ".forex_alerts" / "cache"
+    CACHE_MAX_AGE = 24 * 60 * 60  # Seconds before a cache file is pruned
+    
+    def __init__(self, symbols: List[str], interval: str = "1m",
+                 cache_dir: Optional[str] = None, cache_ttl: float = 60.0):
         """
         Initialize DataFetcher with forex symbols and update interval.
         
         Args:
             symbols: List of forex symbols (e.g., ["EURUSD", "GBPUSD"])
             interval: Data interval (1m, 5m, 15m, 30m, 1h, 1d)
+            cache_dir: Optional directory for the on-disk parquet cache of
+                fetched bars (e.g., DataFetcher.DEFAULT_CACHE_DIR); disabled if None
+            cache_ttl: Seconds a cached fetch stays fresh (default: 60); files
+                older than CACHE_MAX_AGE are pruned once per day
         """
         self.symbols = [self._format_forex_symbol(symbol) for symbol in symbols]
         self.interval = interval
         self.logger = logging.getLogger(__name__)
         self._max_retries = 5
         self._base_delay = 1.0  # Base delay for exponential backoff
+        self._batch_size = 10  # Max symbols per yf.download request
+        
+        # Un-jittered delay per attempt; only the jitter varies between calls
+        self._backoff_base = [min(self._base_delay * (2 ** attempt), 60.0)
+                              for attempt in range(self._max_retries)]
+        # Keepalive for our own chart API requests only; yfinance keeps its own
+        # process-wide session (with browser impersonation), so none is passed in
+        self._session = create_session()
+        
+        # Parquet cache shared across runs/processes
+        self._cache_ttl = cache_ttl
+        self._cache_dir = Path(cache_dir) if cache_dir and PARQUET_AVAILABLE else None
+        if cache_dir and not PARQUET_AVAILABLE:
+            self.logger.warning("pyarrow not installed, parquet data cache disabled")
+        self._cache_pruned_on: Optional[date] = None
+        if self._cache_dir is not None:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+            self._prune_cache()
+    
+    def close(self) -> None:
+        """Close the pooled HTTP session."""
+        self._session.close()
         
     def _format_forex_symbol(self, symbol: str) -> str:
         """
@@ -55,19 +111,16 @@ class DataFetcher:
         Returns:
             True if symbol is valid, False otherwise
         """
-        try:
-            formatted_symbol = self._format_forex_symbol(symbol)
-            ticker = yf.Ticker(formatted_symbol)
-            
-            # Try to fetch a small amount of data to validate
-            data = ticker.history(period="1d", interval="1d")
-            return not data.empty
-            
-        except Exception as e:
-            self.logger.warning(f"Symbol validation failed for {symbol}: {e}")
-            return False
+        formatted_symbol = self._format_forex_symbol(symbol)
+        
+        # Shared with ConfigManager; confirmed symbols are remembered
+        is_valid = is_valid_symbol(formatted_symbol)
+        if not is_valid:
+            self.logger.warning(f"Symbol validation failed for {symbol}")
+        
+        return is_valid
     
-    def get_forex_data(self, symbol: str, period: str = "1d") -> Optional[pd.DataFrame]:
+    def get_forex_data(self, symbol: str, period: str = "1d") -> Optional['pd.DataFrame']:
         """
         Fetch forex data for a single symbol with retry logic.
         
@@ -80,10 +133,13 @@ class DataFetcher:
         """
         formatted_symbol = self._format_forex_symbol(symbol)
         
+        cached = self._read_cache(formatted_symbol, period)
+        if cached is not None:
+            return cached
+        
         for attempt in range(self._max_retries):
             try:
-                ticker = yf.Ticker(formatted_symbol)
-                data = ticker.history(period=period, interval=self.interval)
+                data = self._fetch_chart(formatted_symbol, period)
                 
                 if data.empty:
                     self.logger.warning(f"No data returned for {formatted_symbol}")
@@ -91,6 +147,7 @@ class DataFetcher:
                 
                 # Add symbol column for identification
                 data['Symbol'] = symbol
+                self._write_cache(formatted_symbol, period, data)
                 return data
                 
             except Exception as e:
@@ -107,13 +164,171 @@ class DataFetcher:
                     
         return None
     
-    def fetch_latest_data(self) -> Dict[str, pd.DataFrame]:
+    def _fetch_chart(self, formatted_symbol: str, period: str) -> 'pd.DataFrame':
+        """
+        Fetch OHLCV bars straight from Yahoo's chart endpoint.
+        
+        Forex has no dividends or splits, so this skips the corporate-action
+        merging and repair work done by Ticker.history and only builds the
+        OHLCV columns.
+        
+        Args:
+            formatted_symbol: Formatted forex symbol (e.g., "EURUSD=X")
+            period: Time period (1d, 5d, 1mo, ...)
+            
+        Returns:
+            DataFrame with Open/High/Low/Close/Volume columns indexed by bar
+            time in the exchange timezone (empty if Yahoo returned no bars)
+            
+        Raises:
+            requests.HTTPError: If the request fails
+            ValueError: If Yahoo reports an error for the symbol
+        """
+        pd = _get_pd()
+        
+        response = self._session.get(
+            CHART_URL.format(symbol=formatted_symbol),
+            params={'range': period, 'interval': self.interval},
+            headers=CHART_HEADERS,
+            timeout=10
+        )
+        response.raise_for_status()
+        chart = response.json()['chart']
+        
+        if chart.get('error'):
+            raise ValueError(f"Chart request failed for {formatted_symbol}: {chart['error']}")
+        
+        result = (chart.get('result') or [{}])[0]
+        timestamps = result.get('timestamp')
+        if not timestamps:
+            return pd.DataFrame(columns=['Open', 'High', 'Low', 'Close', 'Volume'])
+        
+        quote = result['indicators']['quote'][0]
+        index = pd.to_datetime(timestamps, unit='s', utc=True)
+        timezone = result.get('meta', {}).get('exchangeTimezoneName')
+        if timezone:
+            index = index.tz_convert(timezone)
+        index.name = 'Datetime'
+        
+        data = pd.DataFrame({
+            'Open': quote['open'],
+            'High': quote['high'],
+            'Low': quote['low'],
+            'Close': quote['close'],
+            'Volume': quote['volume']
+        }, index=index, dtype='float64')
+        
+        # Yahoo pads missing bars with nulls
+        data = data.dropna(subset=['Open', 'High', 'Low', 'Close'], how='all')
+        data['Volume'] = data['Volume'].fillna(0).astype('int64')
+        
+        return data
+    
+    def _cache_file(self, formatted_symbol: str, period: str) -> Path:
+        """
+        Get the parquet cache file for a symbol/interval/period on today's date.
+        
+        Args:
+            formatted_symbol: Formatted forex symbol (e.g., "EURUSD=X")
+            period: Time period requested
+            
+        Returns:
+            Path to the cache file
+        """
+        name = f"{formatted_symbol}_{self.interval}_{period}_{date.today().isoformat()}.parquet"
+        return self._cache_dir / name
+    
+    def _prune_cache(self) -> None:
+        """
+        Delete cache files older than CACHE_MAX_AGE.
+        
+        Cache file names carry the fetch date, so files from earlier days are
+        never read again; without pruning the directory would grow forever.
+        """
+        self._cache_pruned_on = date.today()
+        cutoff = time.time() - self.CACHE_MAX_AGE
+        try:
+            with os.scandir(self._cache_dir) as entries:
+                for entry in entries:
+                    if not entry.name.endswith(('.parquet', '.tmp')):
+                        continue
+                    try:
+                        if entry.stat().st_mtime < cutoff:
+                            os.unlink(entry.path)
+                    except FileNotFoundError:
+                        # Pruned concurrently by another process
+                        pass
+        except OSError as e:
+            self.logger.warning(f"Failed to prune data cache: {e}")
+    
+    def _read_cache(self, formatted_symbol: str, period: str) -> Optional['pd.DataFrame']:
+        """
+        Read fetched data from the parquet cache if it is still fresh.
+        
+        Args:
+            formatted_symbol: Formatted forex symbol (e.g., "EURUSD=X")
+            period: Time period requested
+            
+        Returns:
+            Cached DataFrame or None if caching is disabled, missing or stale
+        """
+        if self._cache_dir is None:
+            return None
+        
+        cache_file = self._cache_file(formatted_symbol, period)
+        try:
+            age = time.time() - cache_file.stat().st_mtime
+            if age >= self._cache_ttl:
+                return None
+            data = _get_pd().read_parquet(cache_file)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            self.logger.warning(f"Failed to read cached data for {formatted_symbol}: {e}")
+            return None
+        
+        self.logger.debug(f"Using cached data for {formatted_symbol} ({age:.0f}s old)")
+        return data
+    
+    def _write_cache(self, formatted_symbol: str, period: str, data: 'pd.DataFrame') -> None:
+        """
+        Write fetched data to the parquet cache.
+        
+        Args:
+            formatted_symbol: Formatted forex symbol (e.g., "EURUSD=X")
+            period: Time period requested
+            data: DataFrame to cache
+        """
+        if self._cache_dir is None:
+            return
+        
+        # Long-running processes prune once per calendar day
+        if self._cache_pruned_on != date.today():
+            self._prune_cache()
+        
+        cache_file = self._cache_file(formatted_symbol, period)
+        tmp_file = cache_file.with_suffix('.tmp')
+        try:
+            # Write beside the target and swap in so readers never see a partial file
+            data.to_parquet(tmp_file, engine='pyarrow')
+            os.replace(tmp_file, cache_file)
+        except Exception as e:
+            self.logger.warning(f"Failed to cache data for {formatted_symbol}: {e}")
+    
+    def fetch_latest_data(self) -> Dict[str, 'pd.DataFrame']:
         """
         Fetch latest data for all configured symbols.
         
+        Several symbols are fetched with batched downloads (see
+        fetch_latest_data_batched); a single symbol goes straight to
+        get_forex_data, where a batch would save nothing.
+        
         Returns:
             Dictionary mapping symbol names to their DataFrames
         """
+        if len(self.symbols) > 1:
+            return self.fetch_latest_data_batched()
+        
         results = {}
         
         for symbol in self.symbols:
@@ -129,6 +344,128 @@ class DataFetcher:
                 
         return results
     
+    def fetch_latest_data_batched(self) -> Dict[str, 'pd.DataFrame']:
+        """
+        Fetch latest data for all configured symbols using batched downloads.
+        
+        Symbols with fresh parquet cache entries are served from the cache;
+        the rest are requested in chunks of up to ``self._batch_size`` per
+        yf.download call instead of one HTTP round-trip per symbol, and each
+        downloaded frame is written back to the cache. Symbols missing from a
+        batch response fall back to get_forex_data.
+        
+        Returns:
+            Dictionary mapping symbol names to their DataFrames
+        """
+        fetched = {}
+        misses = []
+        
+        for symbol in self.symbols:
+            cached = self._read_cache(self._format_forex_symbol(symbol), "1d")
+            if cached is not None:
+                fetched[symbol] = cached
+            else:
+                misses.append(symbol)
+        
+        for start in range(0, len(misses), self._batch_size):
+            chunk = misses[start:start + self._batch_size]
+            batch_data = self._download_batch(chunk)
+            
+            for symbol in chunk:
+                # Remove =X suffix for cleaner symbol names in results
+                clean_symbol = symbol.replace("=X", "")
+                data = self._extract_symbol_data(batch_data, symbol, len(chunk))
+                
+                if data is None:
+                    # Fall back to single-symbol fetch
+                    data = self.get_forex_data(clean_symbol, period="1d")
+                else:
+                    data['Symbol'] = clean_symbol
+                    self._write_cache(self._format_forex_symbol(symbol), "1d", data)
+                
+                fetched[symbol] = data
+        
+        results = {}
+        
+        for symbol in self.symbols:
+            clean_symbol = symbol.replace("=X", "")
+            data = fetched[symbol]
+            
+            if data is not None:
+                results[clean_symbol] = data
+                self.logger.info(f"Successfully fetched data for {clean_symbol}")
+            else:
+                self.logger.error(f"Failed to fetch data for {clean_symbol}")
+        
+        return results
+    
+    def _download_batch(self, symbols: List[str]) -> Optional['pd.DataFrame']:
+        """
+        Download data for several symbols in one request with retry logic.
+        
+        Args:
+            symbols: Formatted forex symbols (e.g., ["EURUSD=X", "GBPUSD=X"])
+            
+        Returns:
+            DataFrame grouped by ticker or None if all attempts failed
+        """
+        tickers = " ".join(symbols)
+        
+        for attempt in range(self._max_retries):
+            try:
+                return get_yfinance().download(
+                    tickers=tickers,
+                    period="1d",
+                    interval=self.interval,
+                    group_by='ticker',
+                    threads=True,
+                    progress=False
+                )
+                
+            except Exception as e:
+                delay = self._calculate_backoff_delay(attempt)
+                self.logger.warning(
+                    f"Batch attempt {attempt + 1} failed for {tickers}: {e}. "
+                    f"Retrying in {delay:.1f}s"
+                )
+                
+                if attempt < self._max_retries - 1:
+                    time.sleep(delay)
+                else:
+                    self.logger.error(f"All retry attempts failed for batch {tickers}")
+        
+        return None
+    
+    def _extract_symbol_data(self, batch_data: Optional['pd.DataFrame'], symbol: str,
+                             batch_len: int) -> Optional['pd.DataFrame']:
+        """
+        Slice a single symbol's OHLCV frame out of a batched download.
+        
+        Args:
+            batch_data: DataFrame returned by yf.download
+            symbol: Formatted forex symbol to extract
+            batch_len: Number of symbols requested in the batch
+            
+        Returns:
+            DataFrame for the symbol or None if it is missing or empty
+        """
+        if batch_data is None or batch_data.empty:
+            return None
+        
+        if isinstance(batch_data.columns, _get_pd().MultiIndex):
+            if symbol not in batch_data.columns.get_level_values(0):
+                return None
+            data = batch_data[symbol]
+        elif batch_len == 1:
+            data = batch_data
+        else:
+            return None
+        
+        # Rows are aligned across tickers; drop bars this symbol didn't trade
+        data = data.dropna(how='all')
+        
+        return data.copy() if not data.empty else None
+    
     def _calculate_backoff_delay(self, attempt: int) -> float:
         """
         Calculate exponential backoff delay with jitter.
@@ -139,13 +476,11 @@ class DataFetcher:
         Returns:
             Delay in seconds
         """
-        import random
-        
-        # Exponential backoff: base_delay * 2^attempt
-        delay = self._base_delay * (2 ** attempt)
-        
-        # Cap at 60 seconds
-        delay = min(delay, 60.0)
+        # Exponential backoff: base_delay * 2^attempt, capped at 60 seconds
+        if attempt < len(self._backoff_base):
+            delay = self._backoff_base[attempt]
+        else:
+            delay = min(self._base_delay * (2 ** attempt), 60.0)
         
         # Add jitter (±20%)
         jitter = delay * 0.2 * (random.random() - 0.5)
@@ -162,6 +497,21 @@ class DataFetcher:
         Returns:
             Current price or None if unavailable
         """
+        formatted_symbol = self._format_forex_symbol(symbol)
+        
+        try:
+            # fast_info returns the last price without building an OHLCV frame
+            ticker = get_yfinance().Ticker(formatted_symbol)
+            last_price = ticker.fast_info['last_price']
+            if last_price is not None:
+                return float(last_price)
+        except KeyError:
+            self.logger.debug(f"No fast_info last price for {formatted_symbol}, using history")
+        except Exception as e:
+            self.logger.warning(f"Failed to get current price for {formatted_symbol}: {e}")
+            return None
+        
+        # Fall back to the latest close from the daily history
         data = self.get_forex_data(symbol, period="1d")
         
         if data is not None and not data.empty:
@@ -3,69 +3,504 @@ In-memory data storage service for forex market data.
 """
 
 import logging
-from typing import Dict, Optional, List
-from datetime import datetime, timedelta
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, List, NamedTuple, Tuple
+from datetime import datetime, timedelta, timezone
+import numpy as np
 import pandas as pd
 from threading import Lock
-from ..models.market_data import MarketData
+from ..models.market_data import MarketData, OHLCV_COLUMNS
+
+PRICE_COLUMNS = ('Open', 'High', 'Low', 'Close')
+
+# Largest rounding error accepted when storing prices as float32; half a
+# pipette on five-decimal quotes
+COMPACT_PRICE_TOLERANCE = 5e-6
+COMPACT_VOLUME_MAX = np.iinfo(np.int32).max
+
+NS_PER_SECOND = 1_000_000_000
+_EPOCH = datetime(1970, 1, 1)
+_EPOCH_UTC = _EPOCH.replace(tzinfo=timezone.utc)
+_ONE_MICROSECOND = timedelta(microseconds=1)
+
+
+def _next_power_of_two(value: int) -> int:
+    """Smallest power of two that is at least ``value`` (and at least 1)."""
+    return 1 << max(value - 1, 0).bit_length()
+
+
+def _now_ns(aware: bool) -> int:
+    """
+    Current time on the storage timestamp scale.
+    
+    Args:
+        aware: True for UTC nanoseconds, False for local wall-clock
+            nanoseconds as held by naive indexes
+            
+    Returns:
+        Nanoseconds since the epoch
+    """
+    now_ns = time.time_ns()
+    if aware:
+        return now_ns
+    return now_ns + time.localtime(now_ns // NS_PER_SECOND).tm_gmtoff * NS_PER_SECOND
+
+
+def _datetime_to_ns(value: datetime, aware: bool) -> int:
+    """
+    Convert a datetime to the storage timestamp scale without pandas.
+    
+    Naive values are taken as local time when compared against aware
+    data, and aware values are converted to local wall-clock time when
+    compared against naive data.
+    
+    Args:
+        value: datetime or pandas Timestamp
+        aware: Whether the target data is timezone-aware
+        
+    Returns:
+        Nanoseconds since the epoch
+    """
+    nanosecond = 0
+    if isinstance(value, pd.Timestamp):
+        if (value.tzinfo is not None) == aware:
+            return value.value
+        nanosecond = value.nanosecond
+        value = value.to_pydatetime(warn=False)
+    
+    if aware:
+        if value.tzinfo is None:
+            value = value.astimezone()
+        delta = value - _EPOCH_UTC
+    else:
+        if value.tzinfo is not None:
+            value = value.astimezone().replace(tzinfo=None)
+        delta = value - _EPOCH
+    return delta // _ONE_MICROSECOND * 1000 + nanosecond
+
+
+@dataclass(frozen=True, slots=True)
+class SymbolColumns:
+    """
+    Immutable columnar view of one symbol's stored bars.
+    
+    Attributes:
+        ts: Bar timestamps as int64 nanoseconds (UTC for timezone-aware data)
+        open: Opening prices
+        high: Highest prices
+        low: Lowest prices
+        close: Closing prices
+        volume: Trading volumes
+        tz: Timezone of the original index, or None if it was naive
+        index_name: Name of the original index
+    """
+    ts: np.ndarray
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+    tz: Any = None
+    index_name: Any = None
+    
+    def __len__(self) -> int:
+        return len(self.ts)
+    
+    def timestamp(self, ts_ns: int) -> pd.Timestamp:
+        """Convert a stored nanosecond timestamp back to a pandas Timestamp."""
+        timestamp = pd.Timestamp(ts_ns)
+        if self.tz is not None:
+            timestamp = timestamp.tz_localize('UTC').tz_convert(self.tz)
+        return timestamp
+    
+    def to_ns(self, value: datetime) -> int:
+        """
+        Convert a datetime to the nanosecond scale of ``ts``.
+        
+        Naive values are compared as wall-clock time against naive indexes
+        and taken as local time against timezone-aware ones.
+        """
+        return _datetime_to_ns(value, self.tz is not None)
+    
+    def to_frame(self, rows=slice(None)) -> pd.DataFrame:
+        """
+        Build an OHLCV DataFrame from the selected rows.
+        
+        Slices are wrapped without copying, so the frame shares the stored
+        read-only arrays; writing to its values raises ValueError.
+        
+        Args:
+            rows: Slice selecting rows (default: all)
+            
+        Returns:
+            DataFrame indexed like the data originally stored
+        """
+        index = pd.DatetimeIndex(self.ts[rows].view('datetime64[ns]'), name=self.index_name)
+        if self.tz is not None:
+            index = index.tz_localize('UTC').tz_convert(self.tz)
+        return pd.DataFrame(
+            {
+                'Open': self.open[rows],
+                'High': self.high[rows],
+                'Low': self.low[rows],
+                'Close': self.close[rows],
+                'Volume': self.volume[rows]
+            },
+            index=index,
+            copy=False
+        )
+
+
+class _LatestBar(NamedTuple):
+    """Last stored bar of a symbol, boxed once as Python scalars on write."""
+    ts_ns: int
+    timestamp: pd.Timestamp
+    open: float
+    high: float
+    low: float
+    close: float
+    volume: int
+
+
+class _BarBuffer:
+    """
+    Preallocated structure-of-arrays buffer holding one symbol's bars.
+    
+    Live rows occupy ``[head, head + size)`` of every column. Appends are
+    copied in after the last live row and retention eviction only advances
+    ``head``. Rows that have been published in a snapshot are never written
+    again: compaction, growth and merges move the live rows into fresh
+    arrays, doubling capacity if they fill more than half of it.
+    """
+    
+    __slots__ = ('ts', 'open', 'high', 'low', 'close', 'volume', 'head', 'size',
+                 'tz', 'index_name', 'price_dtype', 'volume_dtype')
+    
+    def __init__(self, capacity: int, tz=None, index_name=None,
+                 price_dtype=np.float64, volume_dtype=np.int64):
+        self.price_dtype = price_dtype
+        self.volume_dtype = volume_dtype
+        self._allocate(capacity)
+        self.head = 0
+        self.size = 0
+        self.tz = tz
+        self.index_name = index_name
+    
+    @property
+    def capacity(self) -> int:
+        return len(self.ts)
+    
+    @property
+    def tail(self) -> int:
+        return self.head + self.size
+    
+    def snapshot(self) -> SymbolColumns:
+        """Return read-only views of the live rows for lock-free readers."""
+        live = slice(self.head, self.head + self.size)
+        views = []
+        for array in self._arrays():
+            view = array[live]
+            view.flags.writeable = False
+            views.append(view)
+        return SymbolColumns(*views, self.tz, self.index_name)
+    
+    def append(self, ts: np.ndarray, *values: np.ndarray) -> None:
+        """Copy rows with timestamps newer than the last live row onto the tail."""
+        count = len(ts)
+        if self.tail + count > self.capacity:
+            self._make_room(count)
+        
+        rows = slice(self.tail, self.tail + count)
+        for target, source in zip(self._arrays(), (ts, *values)):
+            target[rows] = source
+        self.size += count
+    
+    def merge(self, ts: np.ndarray, *values: np.ndarray) -> None:
+        """
+        Splice sorted, de-duplicated rows into the live rows.
+        
+        Rows whose timestamp is already stored replace the stored values;
+        the rest are inserted at their binary-searched positions.
+        """
+        live = slice(self.head, self.tail)
+        live_ts = self.ts[live]
+        positions = np.searchsorted(live_ts, ts)
+        matched = positions < self.size
+        matched[matched] = live_ts[positions[matched]] == ts[matched]
+        inserted = ~matched
+        
+        # Stored rows shift right by the number of rows inserted before them,
+        # incoming rows by the number of inserted rows that precede them
+        insert_positions = positions[inserted]
+        stored_rows = np.arange(self.size)
+        stored_targets = stored_rows + np.searchsorted(insert_positions, stored_rows, side='right')
+        incoming_targets = positions + np.cumsum(inserted) - inserted
+        
+        old_arrays = self._arrays()
+        size = self.size + len(insert_positions)
+        self._allocate(self._grown_capacity(size))
+        for target, stored, incoming in zip(self._arrays(), old_arrays, (ts, *values)):
+            target[stored_targets] = stored[live]
+            target[incoming_targets] = incoming
+        self.head = 0
+        self.size = size
+    
+    def evict(self, count: int) -> None:
+        """Drop the oldest ``count`` rows."""
+        self.head += count
+        self.size -= count
+    
+    def _arrays(self) -> Tuple[np.ndarray, ...]:
+        return (self.ts, self.open, self.high, self.low, self.close, self.volume)
+    
+    def _allocate(self, capacity: int) -> None:
+        self.ts = np.empty(capacity, dtype=np.int64)
+        self.open = np.empty(capacity, dtype=self.price_dtype)
+        self.high = np.empty(capacity, dtype=self.price_dtype)
+        self.low = np.empty(capacity, dtype=self.price_dtype)
+        self.close = np.empty(capacity, dtype=self.price_dtype)
+        self.volume = np.empty(capacity, dtype=self.volume_dtype)
+    
+    def _grown_capacity(self, needed: int) -> int:
+        # Keep live rows at most half of a power-of-two capacity, so a
+        # symbol reallocates O(log N) times over its lifetime
+        return max(self.capacity, _next_power_of_two(2 * needed))
+    
+    def _make_room(self, count: int) -> None:
+        live = slice(self.head, self.tail)
+        old_arrays = self._arrays()
+        self._allocate(self._grown_capacity(self.size + count))
+        for target, source in zip(self._arrays(), old_arrays):
+            target[:self.size] = source[live]
+        self.head = 0
 
 
 class DataStorage:
     """
     Manages in-memory storage of historical forex market data with
     data retention policies and efficient access methods.
+    
+    Writers serialize on a per-symbol lock and publish an immutable snapshot
+    of the symbol's columns with a single dict assignment. Incoming batches
+    are queued and merged together when the queue fills up or when a reader
+    needs the symbol. A reader of a symbol with queued batches therefore
+    takes that symbol's lock to merge them first, and may wait on a
+    concurrent writer. A reader of a symbol with nothing queued reads the
+    published snapshot without locking.
     """
     
-    def __init__(self, retention_hours: int = 24):
+    MIN_CAPACITY = 64
+    PENDING_FLUSH_SIZE = 32
+    CLEANUP_WORKERS = 4
+    
+    def __init__(self, retention_hours: int = 24, compact: bool = False):
         """
         Initialize DataStorage with configurable data retention.
         
         Args:
             retention_hours: Hours to retain historical data (default: 24)
+            compact: Store prices as float32 and volume as int32, halving
+                memory for OHLCV columns (default: False). float32 keeps
+                about 7 significant digits, enough for forex quotes but not
+                for high-priced instruments, which store_data rejects.
         """
         self.retention_hours = retention_hours
+        self.compact = compact
         self.logger = logging.getLogger(__name__)
         
-        # Thread-safe storage for market data
-        self._data_lock = Lock()
-        self._storage: Dict[str, pd.DataFrame] = {}
+        # Per-symbol writer locks and column buffers; readers only see the
+        # snapshots published in _storage
+        self._locks: Dict[str, Lock] = {}
+        self._buffers: Dict[str, _BarBuffer] = {}
+        self._pending: Dict[str, deque] = {}
+        self._storage: Dict[str, SymbolColumns] = {}
+        
+        # Last bar per symbol, ready for the latest-value getters
+        self._latest: Dict[str, _LatestBar] = {}
         
-        # Track last cleanup time
+        # Per-symbol stats details keyed by the snapshot they describe
+        self._stats_cache: Dict[str, Tuple[SymbolColumns, Dict[str, Any]]] = {}
+        
+        # Track last cleanup time; the interval check runs on every store,
+        # so it uses the monotonic clock and the datetime is kept for stats
         self._last_cleanup = datetime.now()
+        self._last_cleanup_ns = time.monotonic_ns()
         self._cleanup_interval = timedelta(hours=1)  # Cleanup every hour
+        self._cleanup_interval_ns = int(self._cleanup_interval.total_seconds()) * NS_PER_SECOND
+    
+    def _lock_for(self, symbol: str) -> Lock:
+        """Return the writer lock for a symbol, creating it on first use."""
+        lock = self._locks.get(symbol)
+        if lock is None:
+            # setdefault is atomic, so racing writers end up sharing one lock
+            lock = self._locks.setdefault(symbol, Lock())
+        return lock
     
     def store_data(self, symbol: str, data: pd.DataFrame) -> None:
         """
         Store market data for a symbol, merging with existing data.
         
+        The batch is queued and merged on the next read of the symbol, or
+        once PENDING_FLUSH_SIZE batches are waiting. Bars newer than
+        everything already stored are appended to the symbol's buffer in
+        place; overlapping or out-of-order bars are spliced in by binary
+        search, with incoming values replacing stored bars that have the
+        same timestamp.
+        
         Args:
             symbol: Forex symbol (e.g., "EURUSD")
             data: DataFrame with OHLCV data and datetime index
+            
+        Raises:
+            ValueError: If the data is missing any OHLCV column, or in
+                compact mode if it does not fit float32/int32 precision
         """
         if data.empty:
             self.logger.warning(f"Attempted to store empty data for {symbol}")
             return
         
-        with self._data_lock:
-            if symbol in self._storage:
-                # Merge with existing data, avoiding duplicates
-                existing_data = self._storage[symbol]
-                
-                # Combine and remove duplicates based on index
-                combined_data = pd.concat([existing_data, data])
-                combined_data = combined_data[~combined_data.index.duplicated(keep='last')]
-                combined_data = combined_data.sort_index()
-                
-                self._storage[symbol] = combined_data
-                self.logger.debug(f"Merged data for {symbol}, total records: {len(combined_data)}")
-            else:
-                # Store new data
-                self._storage[symbol] = data.copy()
-                self.logger.debug(f"Stored new data for {symbol}, records: {len(data)}")
+        columns = self._sorted_unique(self._extract_columns(data))
+        if self.compact:
+            self._check_compact(symbol, columns)
+        
+        with self._lock_for(symbol):
+            if symbol not in self._buffers:
+                # Size buffers from the data actually seen rather than the
+                # retention window, so short histories stay small and grow
+                # by doubling only as bars arrive
+                self._buffers[symbol] = _BarBuffer(
+                    _next_power_of_two(max(self.MIN_CAPACITY, 2 * len(columns[0]))),
+                    tz=getattr(data.index, 'tz', None),
+                    index_name=data.index.name,
+                    price_dtype=np.float32 if self.compact else np.float64,
+                    volume_dtype=np.int32 if self.compact else np.int64
+                )
+            
+            pending = self._pending.setdefault(symbol, deque())
+            pending.append(columns)
+            if len(pending) >= self.PENDING_FLUSH_SIZE:
+                self._flush_locked(symbol)
         
         # Trigger cleanup if needed
         self._maybe_cleanup()
     
+    def _flush(self, symbol: str) -> None:
+        """Merge any queued batches for a symbol into its stored data."""
+        if self._pending.get(symbol):
+            with self._lock_for(symbol):
+                self._flush_locked(symbol)
+    
+    def _flush_locked(self, symbol: str) -> None:
+        """
+        Merge queued batches into the symbol's buffer and publish the result.
+        
+        Must be called with the symbol's lock held.
+        """
+        pending = self._pending.get(symbol)
+        buffer = self._buffers.get(symbol)
+        if not pending or buffer is None:
+            return
+        
+        batches = list(pending)
+        pending.clear()
+        
+        columns = batches[0]
+        if len(batches) > 1:
+            columns = tuple(np.concatenate(parts) for parts in zip(*batches))
+            # Each batch is sorted; the whole run is only if batches do not overlap
+            if any(later[0][0] <= earlier[0][-1] for earlier, later in zip(batches, batches[1:])):
+                columns = self._sorted_unique(columns)
+        
+        if buffer.size == 0 or columns[0][0] > buffer.ts[buffer.tail - 1]:
+            buffer.append(*columns)
+        else:
+            buffer.merge(*columns)
+        
+        snapshot = buffer.snapshot()
+        last = buffer.tail - 1
+        ts_ns = int(buffer.ts[last])
+        self._latest[symbol] = _LatestBar(
+            ts_ns, snapshot.timestamp(ts_ns), buffer.open[last].item(), buffer.high[last].item(),
+            buffer.low[last].item(), buffer.close[last].item(), buffer.volume[last].item()
+        )
+        self._storage[symbol] = snapshot
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"Stored {len(batches)} batches for {symbol}, total records: {buffer.size}")
+    
+    def _drop_locked(self, symbol: str) -> None:
+        """
+        Forget all stored and queued data for a symbol.
+        
+        Must be called with the symbol's lock held.
+        """
+        # Unpublish first so readers stop seeing the symbol before its
+        # cached latest bar disappears
+        self._storage.pop(symbol, None)
+        self._latest.pop(symbol, None)
+        self._stats_cache.pop(symbol, None)
+        self._pending.pop(symbol, None)
+        self._buffers.pop(symbol, None)
+    
+    @staticmethod
+    def _check_compact(symbol: str, columns: Tuple[np.ndarray, ...]) -> None:
+        """
+        Verify that a batch survives the float32/int32 compact storage cast.
+        
+        Raises:
+            ValueError: If any price would round by more than
+                COMPACT_PRICE_TOLERANCE or any volume overflows int32
+        """
+        for prices in columns[1:5]:
+            error = np.abs(prices.astype(np.float32).astype(np.float64) - prices)
+            if error.max() > COMPACT_PRICE_TOLERANCE:
+                raise ValueError(f"Prices for {symbol} exceed float32 precision")
+        
+        volume = columns[5]
+        if volume.min() < 0 or volume.max() > COMPACT_VOLUME_MAX:
+            raise ValueError(f"Volume for {symbol} does not fit in int32")
+    
+    @staticmethod
+    def _sorted_unique(columns: Tuple[np.ndarray, ...]) -> Tuple[np.ndarray, ...]:
+        """Sort columns by timestamp, keeping the last row for each timestamp."""
+        ts = columns[0]
+        if len(ts) < 2 or np.all(ts[1:] > ts[:-1]):
+            return columns
+        
+        order = np.argsort(ts, kind='stable')
+        sorted_ts = ts[order]
+        
+        # After a stable sort the last row of each timestamp run is the
+        # latest one received; keep it where the next timestamp differs
+        keep = np.empty(len(sorted_ts), dtype=bool)
+        keep[:-1] = sorted_ts[:-1] != sorted_ts[1:]
+        keep[-1] = True
+        rows = order[keep]
+        return tuple(column[rows] for column in columns)
+    
+    @staticmethod
+    def _extract_columns(data: pd.DataFrame) -> Tuple[np.ndarray, ...]:
+        """
+        Convert an OHLCV DataFrame into int64 nanosecond timestamps plus
+        float64 price and int64 volume arrays.
+        """
+        missing = [column for column in OHLCV_COLUMNS if column not in data.columns]
+        if missing:
+            raise ValueError(f"Missing required columns: {missing}")
+        
+        index = data.index
+        if not isinstance(index, pd.DatetimeIndex):
+            index = pd.DatetimeIndex(index)
+        ts = index.as_unit('ns').asi8
+        
+        prices = tuple(data[column].to_numpy(dtype=np.float64) for column in PRICE_COLUMNS)
+        volume = data['Volume'].to_numpy()
+        if volume.dtype.kind == 'f':
+            volume = np.nan_to_num(volume)
+        return (ts, *prices, volume.astype(np.int64, copy=False))
+    
     def get_historical_data(self, symbol: str, periods: int = 100) -> Optional[pd.DataFrame]:
         """
         Retrieve historical data for a symbol.
@@ -75,23 +510,58 @@ class DataStorage:
             periods: Number of most recent periods to return
             
         Returns:
-            DataFrame with historical data or None if not available
+            Read-only DataFrame view with historical data or None if not
+            available; copy it before modifying values
         """
-        with self._data_lock:
-            if symbol not in self._storage:
-                self.logger.debug(f"No data available for {symbol}")
-                return None
+        self._flush(symbol)
+        snapshot = self._storage.get(symbol)
+        if snapshot is None:
+            self.logger.debug(f"No data available for {symbol}")
+            return None
+        
+        size = len(snapshot)
+        if size == 0:
+            return None
+        
+        # Return the most recent periods
+        return snapshot.to_frame(slice(max(size - periods, 0), None))
+    
+    def get_price_matrix(self, symbols: List[str], periods: int = 100,
+                         column: str = 'Close') -> np.ndarray:
+        """
+        Gather recent prices for several symbols into one contiguous array.
+        
+        Rows are bars (oldest first) and columns follow ``symbols``, so
+        multi-symbol indicators can run over axis 0 in a single pass. Each
+        symbol's latest bar sits in the last row; symbols with fewer bars
+        are padded with NaN at the top.
+        
+        Args:
+            symbols: Forex symbols, one matrix column each
+            periods: Number of most recent periods per symbol
+            column: Price column to gather ('Open', 'High', 'Low' or 'Close')
             
-            data = self._storage[symbol]
+        Returns:
+            float64 array of shape (periods, len(symbols))
             
-            if data.empty:
-                return None
+        Raises:
+            ValueError: If column is not a price column
+        """
+        if column not in PRICE_COLUMNS:
+            raise ValueError(f"Invalid price column: {column}. Must be one of {list(PRICE_COLUMNS)}")
+        
+        matrix = np.full((periods, len(symbols)), np.nan)
+        attribute = column.lower()
+        for position, symbol in enumerate(symbols):
+            self._flush(symbol)
+            snapshot = self._storage.get(symbol)
+            if snapshot is None:
+                continue
             
-            # Return the most recent periods
-            if len(data) <= periods:
-                return data.copy()
-            else:
-                return data.tail(periods).copy()
+            prices = getattr(snapshot, attribute)[max(len(snapshot) - periods, 0):]
+            matrix[periods - len(prices):, position] = prices
+        
+        return matrix
     
     def get_latest_price(self, symbol: str) -> Optional[float]:
         """
@@ -103,12 +573,9 @@ class DataStorage:
         Returns:
             Latest closing price or None if not available
         """
-        with self._data_lock:
-            if symbol not in self._storage or self._storage[symbol].empty:
-                return None
-            
-            data = self._storage[symbol]
-            return float(data['Close'].iloc[-1])
+        self._flush(symbol)
+        latest = self._latest.get(symbol)
+        return latest.close if latest is not None else None
     
     def get_latest_data_point(self, symbol: str) -> Optional[MarketData]:
         """
@@ -120,26 +587,24 @@ class DataStorage:
         Returns:
             MarketData object with latest data or None if not available
         """
-        with self._data_lock:
-            if symbol not in self._storage or self._storage[symbol].empty:
-                return None
-            
-            data = self._storage[symbol]
-            latest_row = data.iloc[-1]
-            
-            try:
-                return MarketData(
-                    symbol=symbol,
-                    timestamp=latest_row.name,  # Index is the timestamp
-                    open=float(latest_row['Open']),
-                    high=float(latest_row['High']),
-                    low=float(latest_row['Low']),
-                    close=float(latest_row['Close']),
-                    volume=int(latest_row['Volume'])
-                )
-            except (KeyError, ValueError) as e:
-                self.logger.error(f"Error creating MarketData for {symbol}: {e}")
-                return None
+        self._flush(symbol)
+        latest = self._latest.get(symbol)
+        if latest is None:
+            return None
+        
+        try:
+            return MarketData(
+                symbol=symbol,
+                timestamp=latest.timestamp,
+                open=latest.open,
+                high=latest.high,
+                low=latest.low,
+                close=latest.close,
+                volume=latest.volume
+            )
+        except ValueError as e:
+            self.logger.error(f"Error creating MarketData for {symbol}: {e}")
+            return None
     
     def get_data_range(self, symbol: str, start_time: datetime, end_time: datetime) -> Optional[pd.DataFrame]:
         """
@@ -151,63 +616,105 @@ class DataStorage:
             end_time: End of time range
             
         Returns:
-            DataFrame with data in the specified range or None
+            Read-only DataFrame view with data in the specified range or
+            None; copy it before modifying values
         """
-        with self._data_lock:
-            if symbol not in self._storage or self._storage[symbol].empty:
-                return None
-            
-            data = self._storage[symbol]
-            
-            # Filter by time range
-            mask = (data.index >= start_time) & (data.index <= end_time)
-            filtered_data = data.loc[mask]
-            
-            return filtered_data.copy() if not filtered_data.empty else None
+        self._flush(symbol)
+        snapshot = self._storage.get(symbol)
+        if snapshot is None or len(snapshot) == 0:
+            return None
+        
+        # Timestamps are sorted, so the inclusive range is one contiguous slice
+        lo = int(np.searchsorted(snapshot.ts, snapshot.to_ns(start_time), side='left'))
+        hi = int(np.searchsorted(snapshot.ts, snapshot.to_ns(end_time), side='right'))
+        if lo >= hi:
+            return None
+        
+        return snapshot.to_frame(slice(lo, hi))
     
     def cleanup_old_data(self) -> None:
         """
         Remove data older than the retention period.
+        
+        Each symbol is trimmed under its own lock, so cleanup never blocks
+        writers of other symbols; with several symbols the work is spread
+        over a small thread pool.
         """
-        cutoff_time = datetime.now() - timedelta(hours=self.retention_hours)
+        retention_ns = self.retention_hours * 3600 * NS_PER_SECOND
         
-        with self._data_lock:
-            symbols_to_remove = []
-            
-            for symbol, data in self._storage.items():
-                if data.empty:
-                    symbols_to_remove.append(symbol)
-                    continue
-                
-                # Filter out old data
-                recent_data = data[data.index >= cutoff_time]
-                
-                if recent_data.empty:
-                    symbols_to_remove.append(symbol)
-                else:
-                    self._storage[symbol] = recent_data
-                    
-                    # Log cleanup if significant data was removed
-                    removed_count = len(data) - len(recent_data)
-                    if removed_count > 0:
-                        self.logger.debug(
-                            f"Cleaned up {removed_count} old records for {symbol}, "
-                            f"retained {len(recent_data)} records"
-                        )
-            
-            # Remove symbols with no recent data
-            for symbol in symbols_to_remove:
-                del self._storage[symbol]
-                self.logger.debug(f"Removed all data for {symbol} (no recent data)")
+        # Naive indexes hold wall-clock nanoseconds, aware ones hold UTC
+        naive_cutoff_ns = _now_ns(aware=False) - retention_ns
+        utc_cutoff_ns = _now_ns(aware=True) - retention_ns
+        
+        symbols = list(self._buffers)
+        if len(symbols) > 1:
+            with ThreadPoolExecutor(max_workers=min(self.CLEANUP_WORKERS, len(symbols))) as executor:
+                removed_counts = list(executor.map(
+                    lambda symbol: self._cleanup_symbol(symbol, naive_cutoff_ns, utc_cutoff_ns),
+                    symbols
+                ))
+        else:
+            removed_counts = [
+                self._cleanup_symbol(symbol, naive_cutoff_ns, utc_cutoff_ns) for symbol in symbols
+            ]
+        
+        # One summary line instead of a log call per symbol
+        if self.logger.isEnabledFor(logging.DEBUG):
+            trimmed = [
+                f"{symbol} ({removed_count})"
+                for symbol, removed_count in zip(symbols, removed_counts)
+                if removed_count and symbol in self._storage
+            ]
+            removed = [
+                symbol for symbol, removed_count in zip(symbols, removed_counts)
+                if removed_count and symbol not in self._storage
+            ]
+            if trimmed or removed:
+                self.logger.debug(
+                    f"Cleaned up old records for {', '.join(trimmed) or 'no symbols'}; "
+                    f"removed all data for {', '.join(removed) or 'no symbols'} (no recent data)"
+                )
         
         self._last_cleanup = datetime.now()
+        self._last_cleanup_ns = time.monotonic_ns()
         self.logger.info(f"Data cleanup completed, retained data for {len(self._storage)} symbols")
     
+    def _cleanup_symbol(self, symbol: str, naive_cutoff_ns: int, utc_cutoff_ns: int) -> int:
+        """
+        Drop one symbol's bars that are older than the cutoff.
+        
+        Args:
+            symbol: Forex symbol
+            naive_cutoff_ns: Cutoff as wall-clock nanoseconds for naive data
+            utc_cutoff_ns: Cutoff as UTC nanoseconds for timezone-aware data
+            
+        Returns:
+            Number of records removed
+        """
+        with self._lock_for(symbol):
+            buffer = self._buffers.get(symbol)
+            if buffer is None:
+                return 0
+            self._flush_locked(symbol)
+            
+            # Rows are sorted, so old data is a prefix found by bisection
+            cutoff_ns = naive_cutoff_ns if buffer.tz is None else utc_cutoff_ns
+            removed_count = int(np.searchsorted(buffer.ts[buffer.head:buffer.tail], cutoff_ns))
+            
+            if removed_count == buffer.size:
+                # Remove symbols with no recent data
+                self._drop_locked(symbol)
+            elif removed_count > 0:
+                buffer.evict(removed_count)
+                self._storage[symbol] = buffer.snapshot()
+            
+            return removed_count
+    
     def _maybe_cleanup(self) -> None:
         """
         Trigger cleanup if enough time has passed since last cleanup.
         """
-        if datetime.now() - self._last_cleanup >= self._cleanup_interval:
+        if time.monotonic_ns() - self._last_cleanup_ns >= self._cleanup_interval_ns:
             self.cleanup_old_data()
     
     def get_storage_stats(self) -> Dict[str, any]:
@@ -217,28 +724,39 @@ class DataStorage:
         Returns:
             Dictionary with storage statistics
         """
-        with self._data_lock:
-            stats = {
-                'symbols_count': len(self._storage),
-                'total_records': sum(len(data) for data in self._storage.values()),
-                'symbols': list(self._storage.keys()),
-                'retention_hours': self.retention_hours,
-                'last_cleanup': self._last_cleanup.isoformat()
-            }
-            
-            # Add per-symbol statistics
-            symbol_stats = {}
-            for symbol, data in self._storage.items():
-                if not data.empty:
-                    symbol_stats[symbol] = {
-                        'records': len(data),
-                        'oldest_record': data.index.min().isoformat(),
-                        'newest_record': data.index.max().isoformat(),
-                        'latest_price': float(data['Close'].iloc[-1])
-                    }
-            
-            stats['symbol_details'] = symbol_stats
-            
+        for symbol in list(self._pending):
+            self._flush(symbol)
+        
+        # list() copies the items in one step, so concurrent writers cannot
+        # change the dict size mid-iteration
+        snapshots = list(self._storage.items())
+        
+        stats = {
+            'symbols_count': len(snapshots),
+            'total_records': sum(len(snapshot) for _, snapshot in snapshots),
+            'symbols': [symbol for symbol, _ in snapshots],
+            'retention_hours': self.retention_hours,
+            'last_cleanup': self._last_cleanup.isoformat()
+        }
+        
+        # Add per-symbol statistics, reusing details computed for the same
+        # snapshot so unchanged symbols skip the timestamp formatting
+        symbol_stats = {}
+        for symbol, snapshot in snapshots:
+            if len(snapshot) > 0:
+                cached = self._stats_cache.get(symbol)
+                if cached is None or cached[0] is not snapshot:
+                    cached = (snapshot, {
+                        'records': len(snapshot),
+                        'oldest_record': snapshot.timestamp(int(snapshot.ts[0])).isoformat(),
+                        'newest_record': snapshot.timestamp(int(snapshot.ts[-1])).isoformat(),
+                        'latest_price': float(snapshot.close[-1])
+                    })
+                    self._stats_cache[symbol] = cached
+                symbol_stats[symbol] = dict(cached[1])
+        
+        stats['symbol_details'] = symbol_stats
+        
         return stats
     
     def clear_symbol_data(self, symbol: str) -> bool:
@@ -251,9 +769,9 @@ class DataStorage:
         Returns:
             True if data was cleared, False if symbol not found
         """
-        with self._data_lock:
-            if symbol in self._storage:
-                del self._storage[symbol]
+        with self._lock_for(symbol):
+            if symbol in self._buffers:
+                self._drop_locked(symbol)
                 self.logger.info(f"Cleared all data for {symbol}")
                 return True
             else:
@@ -264,10 +782,13 @@ class DataStorage:
         """
         Clear all stored data for all symbols.
         """
-        with self._data_lock:
-            symbol_count = len(self._storage)
-            self._storage.clear()
-            self.logger.info(f"Cleared all data for {symbol_count} symbols")
+        symbol_count = 0
+        for symbol in list(self._buffers):
+            with self._lock_for(symbol):
+                if symbol in self._buffers:
+                    self._drop_locked(symbol)
+                    symbol_count += 1
+        self.logger.info(f"Cleared all data for {symbol_count} symbols")
     
     def has_data(self, symbol: str) -> bool:
         """
@@ -279,8 +800,9 @@ class DataStorage:
         Returns:
             True if data exists and is not empty
         """
-        with self._data_lock:
-            return symbol in self._storage and not self._storage[symbol].empty
+        self._flush(symbol)
+        snapshot = self._storage.get(symbol)
+        return snapshot is not None and len(snapshot) > 0
     
     def get_data_age(self, symbol: str) -> Optional[timedelta]:
         """
@@ -292,9 +814,10 @@ class DataStorage:
         Returns:
             Time since the most recent data point or None if no data
         """
-        with self._data_lock:
-            if symbol not in self._storage or self._storage[symbol].empty:
-                return None
-            
-            latest_timestamp = self._storage[symbol].index.max()
-            return datetime.now() - latest_timestamp.to_pydatetime()
\ No newline at end of file
+        self._flush(symbol)
+        latest = self._latest.get(symbol)
+        if latest is None:
+            return None
+        
+        now_ns = _now_ns(aware=latest.timestamp.tzinfo is not None)
+        return timedelta(microseconds=(now_ns - latest.ts_ns) // 1000)
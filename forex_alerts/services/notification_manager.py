@@ -3,20 +3,28 @@ Notification manager for sending trading signal alerts through multiple channels
 """
 
 import logging
-import smtplib
-import ssl
+import os
 import platform
-from datetime import datetime
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-from typing import Dict, List, Optional, Any
+import random
+import shutil
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from threading import Lock, RLock
+from functools import lru_cache
+from importlib.util import find_spec
+from typing import Dict, List, NamedTuple, Optional, Any, Union, TYPE_CHECKING
 from enum import Enum
+from string import Template
 
-try:
-    from plyer import notification
-    PLYER_AVAILABLE = True
-except ImportError:
-    PLYER_AVAILABLE = False
+if TYPE_CHECKING:
+    import smtplib
+    from email.message import EmailMessage
+
+# plyer is checked without importing it; its facade is loaded on first desktop alert
+PLYER_AVAILABLE = find_spec('plyer') is not None
+notification = None
 
 # Try to import alternative notification libraries for fallback
 try:
@@ -25,8 +33,267 @@ try:
 except ImportError:
     SUBPROCESS_AVAILABLE = False
 
+# libnotify via PyGObject sends Linux notifications in-process, without forking
+# notify-send; gi is only checked here and loaded on the first Linux desktop alert
+LIBNOTIFY_AVAILABLE = find_spec('gi') is not None
+
 from ..models.signal import Signal
 
+# SMTP, TLS and email message support are imported on first email, since
+# console-only deployments never need them
+_smtplib = None
+_ssl = None
+_email_message = None
+
+
+def _get_smtplib():
+    """Import smtplib on first use and cache the module."""
+    global _smtplib
+    if _smtplib is None:
+        import smtplib
+        _smtplib = smtplib
+    return _smtplib
+
+
+def _get_ssl():
+    """Import ssl on first use and cache the module."""
+    global _ssl
+    if _ssl is None:
+        import ssl
+        _ssl = ssl
+    return _ssl
+
+
+def _get_email_message() -> type:
+    """Import the EmailMessage class on first use and cache it."""
+    global _email_message
+    if _email_message is None:
+        from email.message import EmailMessage
+        _email_message = EmailMessage
+    return _email_message
+
+
+@lru_cache(maxsize=None)
+def _get_notify():
+    """Import libnotify's Notify binding on first use; None if it can't load."""
+    try:
+        import gi
+        gi.require_version('Notify', '0.7')
+        from gi.repository import Notify
+    except (ImportError, ValueError):
+        return None
+    return Notify
+
+
+def _get_plyer_notification():
+    """Import plyer's notification facade on first use and cache it."""
+    global notification
+    if notification is None:
+        from plyer import notification as plyer_notification
+        notification = plyer_notification
+    return notification
+
+
+class _SignalStyle(NamedTuple):
+    """Presentation details for one signal type."""
+    emoji: str
+    color: str
+
+
+# Signal-specific presentation, looked up by signal type instead of branching
+# in every formatter; also baked into the email templates at import time
+_SIGNAL_STYLE = {
+    "BUY": _SignalStyle(emoji="📈", color="#28a745"),
+    "SELL": _SignalStyle(emoji="📉", color="#dc3545"),
+}
+
+_HTML_EMAIL_TEMPLATE = """
+        <html>
+          <body style="font-family: Arial, sans-serif; margin: 0; padding: 20px; background-color: #f8f9fa;">
+            <div style="max-width: 600px; margin: 0 auto; background-color: white; border-radius: 8px; box-shadow: 0 2px 10px rgba(0,0,0,0.1);">
+              <div style="background-color: $signal_color; color: white; padding: 20px; border-radius: 8px 8px 0 0; text-align: center;">
+                <h1 style="margin: 0; font-size: 24px;">🔔 FOREX ALERT 🔔</h1>
+              </div>
+              
+              <div style="padding: 30px;">
+                <div style="text-align: center; margin-bottom: 30px;">
+                  <h2 style="margin: 0; color: $signal_color; font-size: 28px;">
+                    $signal_type $signal_emoji
+                  </h2>
+                  <h3 style="margin: 10px 0 0 0; color: #333; font-size: 24px;">
+                    $display_symbol
+                  </h3>
+                </div>
+                
+                <table style="width: 100%; border-collapse: collapse; margin-bottom: 20px;">
+                  <tr style="border-bottom: 1px solid #eee;">
+                    <td style="padding: 12px 0; font-weight: bold; color: #666;">Price:</td>
+                    <td style="padding: 12px 0; text-align: right; font-size: 18px; font-weight: bold;">
+                      $$$price
+                    </td>
+                  </tr>
+                  <tr style="border-bottom: 1px solid #eee;">
+                    <td style="padding: 12px 0; font-weight: bold; color: #666;">Time:</td>
+                    <td style="padding: 12px 0; text-align: right;">$time_str</td>
+                  </tr>
+                  <tr style="border-bottom: 1px solid #eee;">
+                    <td style="padding: 12px 0; font-weight: bold; color: #666;">ZLMA:</td>
+                    <td style="padding: 12px 0; text-align: right;">$zlma</td>
+                  </tr>
+                  <tr style="border-bottom: 1px solid #eee;">
+                    <td style="padding: 12px 0; font-weight: bold; color: #666;">EMA:</td>
+                    <td style="padding: 12px 0; text-align: right;">$ema</td>
+                  </tr>
+                  <tr>
+                    <td style="padding: 12px 0; font-weight: bold; color: #666;">Confidence:</td>
+                    <td style="padding: 12px 0; text-align: right; font-weight: bold;">
+                      $confidence
+                    </td>
+                  </tr>
+                </table>
+                
+                <div style="background-color: #f8f9fa; padding: 15px; border-radius: 5px; text-align: center; color: #666; font-size: 12px;">
+                  This is an automated trading signal alert from your Forex Alert System.
+                </div>
+              </div>
+            </div>
+          </body>
+        </html>
+        """
+
+# HTML bodies only vary in a few fields per signal, so the static markup and
+# per-type colors are resolved once here rather than on every email
+_HTML_EMAIL_TEMPLATES = {
+    signal_type: Template(
+        _HTML_EMAIL_TEMPLATE
+        .replace("$signal_color", style.color)
+        .replace("$signal_type", signal_type)
+        .replace("$signal_emoji", style.emoji)
+    )
+    for signal_type, style in _SIGNAL_STYLE.items()
+}
+
+# Plain-text templates are parsed once here and filled with str.format_map
+_TEXT_EMAIL_TEMPLATE = """🔔 FOREX ALERT 🔔
+
+Symbol: {display_symbol}
+Signal: {signal_type} {signal_emoji}
+Price: ${price:.5f}
+Time: {time_str}
+ZLMA: {zlma:.5f} | EMA: {ema:.5f}
+Confidence: {confidence:.2f}
+
+==================================================
+
+This is an automated trading signal alert from your Forex Alert System."""
+
+_CONSOLE_TEMPLATE = """
+🔔 FOREX ALERT 🔔
+Symbol: {display_symbol}
+Signal: {signal_type} {signal_emoji}
+Price: ${price:.5f}
+Time: {time_str}
+ZLMA: {zlma:.5f} | EMA: {ema:.5f}
+Confidence: {confidence:.2f}
+========================================"""
+
+# Port reserved for SMTP over implicit TLS
+_SMTPS_PORT = 465
+
+# Command used for native desktop notifications on each platform
+_NATIVE_NOTIFIERS = {
+    'darwin': 'osascript',
+    'linux': 'notify-send',
+    'windows': 'powershell',
+}
+
+# Native notifier scripts are constant; the title and message reach them as
+# arguments or environment values, so nothing user-supplied is ever quoted
+# into script source
+_OSASCRIPT_COMMAND = [
+    'osascript',
+    '-e', 'on run argv',
+    '-e', 'display notification (item 2 of argv) with title (item 1 of argv) sound name "default"',
+    '-e', 'end run',
+]
+
+_POWERSHELL_SCRIPT = """
+Add-Type -AssemblyName System.Windows.Forms
+$notification = New-Object System.Windows.Forms.NotifyIcon
+$notification.Icon = [System.Drawing.SystemIcons]::Information
+$notification.BalloonTipTitle = $env:FOREX_ALERT_TITLE
+$notification.BalloonTipText = $env:FOREX_ALERT_MESSAGE
+$notification.Visible = $true
+$notification.ShowBalloonTip(5000)
+"""
+
+
+@lru_cache(maxsize=256)
+def _display_symbol(symbol: str) -> str:
+    """
+    Format a symbol for display, memoized per symbol.
+    
+    Args:
+        symbol: Raw symbol (e.g., "EURUSD=X")
+        
+    Returns:
+        str: Display symbol (e.g., "EUR/USD")
+    """
+    # Remove =X suffix if present
+    display_symbol = symbol.replace("=X", "").replace("USD", "/USD")
+    if not "/" in display_symbol and len(display_symbol) == 6:
+        # Format pairs like EURUSD -> EUR/USD
+        display_symbol = f"{display_symbol[:3]}/{display_symbol[3:]}"
+    return display_symbol
+
+
+def _utc_now() -> datetime:
+    """
+    Get the current time as an aware UTC datetime.
+    
+    Returns:
+        datetime: Current UTC time, built straight from the epoch clock
+    """
+    return datetime.fromtimestamp(time.time(), timezone.utc)
+
+
+def _format_recipients(recipients: Union[str, List[str]]) -> str:
+    """
+    Format one or more recipient addresses as a To header value.
+    
+    Args:
+        recipients: A single address or a list of addresses
+        
+    Returns:
+        str: Comma-separated recipient addresses
+    """
+    if isinstance(recipients, str):
+        return recipients
+    return ", ".join(recipients)
+
+
+def _signal_fields(signal: Signal, display_symbol: str) -> Dict[str, Any]:
+    """
+    Collect the template fields for a signal in a single pass.
+    
+    Args:
+        signal: The trading signal
+        display_symbol: Formatted symbol for display
+        
+    Returns:
+        Dict[str, Any]: Field values keyed by template placeholder
+    """
+    return {
+        'display_symbol': display_symbol,
+        'signal_type': signal.signal_type,
+        'signal_emoji': _SIGNAL_STYLE[signal.signal_type].emoji,
+        'price': signal.price,
+        'time_str': signal.timestamp.strftime("%Y-%m-%d %H:%M:%S UTC"),
+        'zlma': signal.zlma_value,
+        'ema': signal.ema_value,
+        'confidence': signal.confidence,
+    }
+
 
 class NotificationChannel(Enum):
     """Supported notification channels."""
@@ -41,8 +308,21 @@ class NotificationManager:
     
     Supports console, email, and desktop notifications with configurable
     formatting and testing capabilities.
+    
+    Call close() when done, or use the manager as a context manager, to shut
+    down the email worker thread and the pooled SMTP session.
     """
     
+    # Messages sent over one SMTP session before it is recycled
+    SMTP_MAX_MESSAGES_PER_CONNECTION = 100
+    
+    # Email batches at least this large are abandoned once over a third fail
+    EMAIL_BATCH_ABORT_MIN_SIZE = 30
+    
+    # Exponential backoff between SMTP retries, in seconds
+    SMTP_RETRY_BASE_DELAY = 0.1
+    SMTP_RETRY_MAX_DELAY = 2.0
+    
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         """
         Initialize notification manager with configuration.
@@ -59,6 +339,24 @@ class NotificationManager:
         self._email_enabled = NotificationChannel.EMAIL in self.enabled_channels
         self._desktop_enabled = NotificationChannel.DESKTOP in self.enabled_channels
         
+        # Platform and desktop settings are fixed for the process, so resolve them once
+        self._platform = platform.system().lower()
+        self._desktop_cfg = self._build_desktop_notification_config()
+        self._desktop_validated: Optional[bool] = None
+        
+        # Pooled SMTP session, reused across emails until it drops or is recycled
+        self._smtp = None
+        self._smtp_key = None
+        self._smtp_msgs = 0
+        self._smtp_lock = RLock()
+        
+        # Loading the trust store is slow, so one TLS context serves every connection
+        self._ssl_context = _get_ssl().create_default_context() if self._email_enabled else None
+        
+        # Worker thread for email delivery, created on first concurrent send
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = Lock()
+        
         self.logger.info(f"NotificationManager initialized with channels: {[c.value for c in self.enabled_channels]}")
     
     def _parse_enabled_channels(self) -> List[NotificationChannel]:
@@ -76,48 +374,102 @@ class NotificationManager:
         # Default to console if no valid channels
         if not channels:
             channels = [NotificationChannel.CONSOLE]
-            
+        
         return channels
     
     def send_notification(self, signal: Signal) -> bool:
         """
         Send notification for a trading signal through all enabled channels.
         
+        When email is enabled alongside other channels it is sent on a worker
+        thread, so a slow SMTP round trip does not hold up console or desktop
+        alerts. Desktop notifications stay on the calling thread because some
+        plyer backends (pyobjc on macOS) only work on the main thread.
+        
         Args:
             signal: The trading signal to notify about
             
         Returns:
             bool: True if at least one notification was sent successfully
         """
-        success_count = 0
+        senders = []
         
         if self._console_enabled:
-            if self._send_console_notification(signal):
-                success_count += 1
+            senders.append(self._send_console_notification)
+        
+        if self._desktop_enabled:
+            senders.append(self._send_desktop_notification)
         
+        email_future = None
         if self._email_enabled:
-            if self._send_email_notification(signal):
-                success_count += 1
+            if not senders:
+                return bool(self._send_email_notification(signal))
+            email_future = self._get_executor().submit(self._send_email_notification, signal)
         
-        if self._desktop_enabled:
-            if self._send_desktop_notification(signal):
-                success_count += 1
+        success_count = sum(1 for sender in senders if sender(signal))
+        if email_future is not None and email_future.result():
+            success_count += 1
         
         return success_count > 0
     
-    def _send_console_notification(self, signal: Signal) -> bool:
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Create the email worker thread on first use."""
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="notification")
+            return self._executor
+    
+    def send_notifications(self, signals: List[Signal]) -> List[bool]:
+        """
+        Send notifications for a batch of signals through all enabled channels.
+        
+        Emails for the whole batch go out over a single SMTP session rather
+        than one session per signal.
+        
+        Args:
+            signals: The trading signals to notify about
+            
+        Returns:
+            List[bool]: Per signal, True if at least one notification was sent
+        """
+        delivered = [False] * len(signals)
+        
+        if self._console_enabled:
+            for i, signal in enumerate(signals):
+                if self._send_console_notification(signal, flush=False):
+                    delivered[i] = True
+            sys.stdout.flush()
+        
+        if self._email_enabled:
+            for i, sent in enumerate(self._send_email_batch(signals)):
+                if sent:
+                    delivered[i] = True
+        
+        if self._desktop_enabled:
+            for i, signal in enumerate(signals):
+                if self._send_desktop_notification(signal):
+                    delivered[i] = True
+        
+        return delivered
+    
+    def _send_console_notification(self, signal: Signal, flush: bool = True) -> bool:
         """
         Send notification to console with formatted message.
         
         Args:
             signal: The trading signal to display
+            flush: Whether to flush stdout after writing; batches flush once at the end
             
         Returns:
             bool: True if notification was sent successfully
         """
         try:
             formatted_message = self._format_console_message(signal)
-            print(formatted_message)
+            # Looked up per call so redirected stdout is honoured
+            stdout = sys.stdout
+            stdout.write(formatted_message + "\n")
+            if flush:
+                stdout.flush()
             self.logger.info(f"Console notification sent for {signal.symbol} {signal.signal_type}")
             return True
         except Exception as e:
@@ -135,66 +487,118 @@ class NotificationManager:
             bool: True if notification was sent successfully
         """
         try:
-            email_config = self.config.get('email_config')
-            if not email_config:
-                self.logger.error("Email configuration not found")
+            email_config = self._get_email_config()
+            if email_config is None:
                 return False
             
-            # Validate required email configuration
-            required_fields = ['smtp_server', 'smtp_port', 'sender_email', 'sender_password', 'recipient_email']
-            for field in required_fields:
-                if field not in email_config:
-                    self.logger.error(f"Missing required email configuration field: {field}")
-                    return False
-            
             # Create email message
             message = self._create_email_message(signal, email_config)
             
             # Send email via SMTP
             return self._send_smtp_email(message, email_config)
-            
+        
         except Exception as e:
             self.logger.error(f"Failed to send email notification: {e}")
             return False
     
-    def _create_email_message(self, signal: Signal, email_config: Dict[str, Any]) -> MIMEMultipart:
+    def _send_email_batch(self, signals: List[Signal]) -> List[bool]:
+        """
+        Email a batch of signals over one SMTP session.
+        
+        Args:
+            signals: The trading signals to email
+            
+        Returns:
+            List[bool]: Per signal, True if its email was sent successfully
+        """
+        results = [False] * len(signals)
+        
+        try:
+            email_config = self._get_email_config()
+            if email_config is None:
+                return results
+            
+            messages = [self._create_email_message(signal, email_config) for signal in signals]
+        except Exception as e:
+            self.logger.error(f"Failed to prepare email notifications: {e}")
+            return results
+        
+        abort_enabled = len(messages) >= self.EMAIL_BATCH_ABORT_MIN_SIZE
+        failures = 0
+        
+        for i, message in enumerate(messages):
+            # Later sends follow one on the same session, so skip the NOOP probe
+            results[i] = self._send_smtp_email(message, email_config, check_connection=(i == 0))
+            if results[i]:
+                continue
+            
+            failures += 1
+            if abort_enabled and failures * 3 > len(messages):
+                self.logger.error(
+                    f"Aborting email batch after {failures} failures out of {len(messages)} messages"
+                )
+                break
+        
+        return results
+    
+    def _get_email_config(self) -> Optional[Dict[str, Any]]:
+        """
+        Get the email configuration if it has all required fields.
+        
+        Returns:
+            Optional[Dict[str, Any]]: Email configuration, or None if missing or incomplete
+        """
+        email_config = self.config.get('email_config')
+        if not email_config:
+            self.logger.error("Email configuration not found")
+            return None
+        
+        # Validate required email configuration
+        required_fields = ['smtp_server', 'smtp_port', 'sender_email', 'sender_password', 'recipient_email']
+        for field in required_fields:
+            if field not in email_config:
+                self.logger.error(f"Missing required email configuration field: {field}")
+                return None
+        
+        return email_config
+    
+    def _create_email_message(self, signal: Signal, email_config: Dict[str, Any]) -> 'EmailMessage':
         """
         Create formatted email message for trading signal.
         
+        The message is built once however many recipients are configured;
+        recipient_email may be a single address or a list of addresses.
+        
         Args:
             signal: The trading signal to format
             email_config: Email configuration dictionary
             
         Returns:
-            MIMEMultipart: Formatted email message
+            EmailMessage: Formatted multipart/alternative email message
         """
         # Create message container
-        message = MIMEMultipart("alternative")
+        message = _get_email_message()()
         
         # Format symbol for display
-        display_symbol = signal.symbol.replace("=X", "").replace("USD", "/USD")
-        if not "/" in display_symbol and len(display_symbol) == 6:
-            display_symbol = f"{display_symbol[:3]}/{display_symbol[3:]}"
+        display_symbol = _display_symbol(signal.symbol)
         
         # Email subject
-        signal_emoji = "📈" if signal.signal_type == "BUY" else "📉"
-        subject = f"🔔 Forex Alert: {signal.signal_type} {display_symbol} {signal_emoji}"
+        signal_type = signal.signal_type
+        subject = f"🔔 Forex Alert: {signal_type} {display_symbol} {_SIGNAL_STYLE[signal_type].emoji}"
         
         # Email headers
         message["Subject"] = subject
         message["From"] = email_config['sender_email']
-        message["To"] = email_config['recipient_email']
+        message["To"] = _format_recipients(email_config['recipient_email'])
         
         # Create HTML and text versions
         html_body = self._create_html_email_body(signal, display_symbol)
         text_body = self._create_text_email_body(signal, display_symbol)
         
-        # Attach parts
-        text_part = MIMEText(text_body, "plain")
-        html_part = MIMEText(html_body, "html")
-        
-        message.attach(text_part)
-        message.attach(html_part)
+        # Plain text first, then the HTML alternative; base64 keeps the
+        # emoji-laden bodies in the same transfer encoding as before
+        message.set_content(text_body, cte="base64")
+        message.add_alternative(html_body, subtype="html", cte="base64")
         
         return message
     
@@ -209,64 +613,14 @@ class NotificationManager:
         Returns:
             str: HTML email body
         """
-        signal_emoji = "📈" if signal.signal_type == "BUY" else "📉"
-        signal_color = "#28a745" if signal.signal_type == "BUY" else "#dc3545"
-        time_str = signal.timestamp.strftime("%Y-%m-%d %H:%M:%S UTC")
-        
-        html = f"""
-        <html>
-          <body style="font-family: Arial, sans-serif; margin: 0; padding: 20px; background-color: #f8f9fa;">
-            <div style="max-width: 600px; margin: 0 auto; background-color: white; border-radius: 8px; box-shadow: 0 2px 10px rgba(0,0,0,0.1);">
-              <div style="background-color: {signal_color}; color: white; padding: 20px; border-radius: 8px 8px 0 0; text-align: center;">
-                <h1 style="margin: 0; font-size: 24px;">🔔 FOREX ALERT 🔔</h1>
-              </div>
-              
-              <div style="padding: 30px;">
-                <div style="text-align: center; margin-bottom: 30px;">
-                  <h2 style="margin: 0; color: {signal_color}; font-size: 28px;">
-                    {signal.signal_type} {signal_emoji}
-                  </h2>
-                  <h3 style="margin: 10px 0 0 0; color: #333; font-size: 24px;">
-                    {display_symbol}
-                  </h3>
-                </div>
-                
-                <table style="width: 100%; border-collapse: collapse; margin-bottom: 20px;">
-                  <tr style="border-bottom: 1px solid #eee;">
-                    <td style="padding: 12px 0; font-weight: bold; color: #666;">Price:</td>
-                    <td style="padding: 12px 0; text-align: right; font-size: 18px; font-weight: bold;">
-                      ${signal.price:.5f}
-                    </td>
-                  </tr>
-                  <tr style="border-bottom: 1px solid #eee;">
-                    <td style="padding: 12px 0; font-weight: bold; color: #666;">Time:</td>
-                    <td style="padding: 12px 0; text-align: right;">{time_str}</td>
-                  </tr>
-                  <tr style="border-bottom: 1px solid #eee;">
-                    <td style="padding: 12px 0; font-weight: bold; color: #666;">ZLMA:</td>
-                    <td style="padding: 12px 0; text-align: right;">{signal.zlma_value:.5f}</td>
-                  </tr>
-                  <tr style="border-bottom: 1px solid #eee;">
-                    <td style="padding: 12px 0; font-weight: bold; color: #666;">EMA:</td>
-                    <td style="padding: 12px 0; text-align: right;">{signal.ema_value:.5f}</td>
-                  </tr>
-                  <tr>
-                    <td style="padding: 12px 0; font-weight: bold; color: #666;">Confidence:</td>
-                    <td style="padding: 12px 0; text-align: right; font-weight: bold;">
-                      {signal.confidence:.2f}
-                    </td>
-                  </tr>
-                </table>
-                
-                <div style="background-color: #f8f9fa; padding: 15px; border-radius: 5px; text-align: center; color: #666; font-size: 12px;">
-                  This is an automated trading signal alert from your Forex Alert System.
-                </div>
-              </div>
-            </div>
-          </body>
-        </html>
-        """
-        return html
+        return _HTML_EMAIL_TEMPLATES[signal.signal_type].substitute(
+            display_symbol=display_symbol,
+            price=f"{signal.price:.5f}",
+            time_str=signal.timestamp.strftime("%Y-%m-%d %H:%M:%S UTC"),
+            zlma=f"{signal.zlma_value:.5f}",
+            ema=f"{signal.ema_value:.5f}",
+            confidence=f"{signal.confidence:.2f}"
+        )
     
     def _create_text_email_body(self, signal: Signal, display_symbol: str) -> str:
         """
@@ -279,99 +633,188 @@ class NotificationManager:
         Returns:
             str: Plain text email body
         """
-        signal_emoji = "📈" if signal.signal_type == "BUY" else "📉"
-        time_str = signal.timestamp.strftime("%Y-%m-%d %H:%M:%S UTC")
-        
-        text = f"""
-🔔 FOREX ALERT 🔔
-
-Symbol: {display_symbol}
-Signal: {signal.signal_type} {signal_emoji}
-Price: ${signal.price:.5f}
-Time: {time_str}
-ZLMA: {signal.zlma_value:.5f} | EMA: {signal.ema_value:.5f}
-Confidence: {signal.confidence:.2f}
-
-{'=' * 50}
-
-This is an automated trading signal alert from your Forex Alert System.
-        """
-        return text.strip()
+        return _TEXT_EMAIL_TEMPLATE.format_map(_signal_fields(signal, display_symbol))
     
-    def _send_smtp_email(self, message: MIMEMultipart, email_config: Dict[str, Any]) -> bool:
+    def _send_smtp_email(self, message: 'EmailMessage', email_config: Dict[str, Any],
+                         check_connection: bool = True) -> bool:
         """
         Send email via SMTP server with error handling and retries.
         
         Args:
             message: The email message to send
             email_config: Email configuration dictionary
+            check_connection: Whether to health-check a pooled session before use
             
         Returns:
             bool: True if email was sent successfully
         """
+        with self._smtp_lock:
+            return self._send_smtp_email_locked(message, email_config, check_connection)
+    
+    def _send_smtp_email_locked(self, message: 'EmailMessage', email_config: Dict[str, Any],
+                                check_connection: bool) -> bool:
+        """Send email over the pooled session. Caller must hold the SMTP lock."""
+        smtplib = _get_smtplib()
         max_retries = 3
         retry_count = 0
+        started = time.monotonic()
         
         while retry_count < max_retries:
             try:
-                # Create SMTP connection
-                smtp_server = email_config['smtp_server']
-                smtp_port = int(email_config['smtp_port'])
-                use_tls = email_config.get('use_tls', True)
+                server = self._get_smtp(email_config, check_connection)
                 
-                if use_tls:
-                    # Use TLS connection
-                    context = ssl.create_default_context()
-                    server = smtplib.SMTP(smtp_server, smtp_port)
-                    server.starttls(context=context)
-                else:
-                    # Use SSL connection
-                    context = ssl.create_default_context()
-                    server = smtplib.SMTP_SSL(smtp_server, smtp_port, context=context)
-                
-                # Login and send email
-                server.login(email_config['sender_email'], email_config['sender_password'])
-                
-                text = message.as_string()
-                server.sendmail(
-                    email_config['sender_email'],
-                    email_config['recipient_email'],
-                    text
-                )
+                # Envelope addresses come from the From/To headers already on the message
+                server.send_message(message)
                 
-                server.quit()
+                self._smtp_msgs += 1
+                if self._smtp_msgs >= self.SMTP_MAX_MESSAGES_PER_CONNECTION:
+                    self._close_smtp()
                 
-                self.logger.info(f"Email notification sent successfully to {email_config['recipient_email']}")
+                self.logger.info(f"Email notification sent successfully to {message['To']}")
                 return True
-                
+            
             except smtplib.SMTPAuthenticationError as e:
                 self.logger.error(f"SMTP authentication failed: {e}")
                 return False  # Don't retry authentication errors
-                
+            
             except smtplib.SMTPRecipientsRefused as e:
                 self.logger.error(f"SMTP recipients refused: {e}")
                 return False  # Don't retry recipient errors
-                
+            
             except smtplib.SMTPServerDisconnected as e:
+                self._close_smtp()
                 retry_count += 1
                 self.logger.warning(f"SMTP server disconnected (attempt {retry_count}/{max_retries}): {e}")
                 if retry_count >= max_retries:
-                    self.logger.error("Max retries reached for SMTP server disconnection")
+                    self.logger.error(
+                        f"Max retries reached for SMTP server disconnection after {time.monotonic() - started:.2f}s"
+                    )
                     return False
-                
+                time.sleep(self._smtp_retry_delay(retry_count))
+            
             except (smtplib.SMTPException, ConnectionError, TimeoutError) as e:
+                self._close_smtp()
                 retry_count += 1
                 self.logger.warning(f"SMTP error (attempt {retry_count}/{max_retries}): {e}")
                 if retry_count >= max_retries:
-                    self.logger.error("Max retries reached for SMTP errors")
+                    self.logger.error(
+                        f"Max retries reached for SMTP errors after {time.monotonic() - started:.2f}s"
+                    )
                     return False
-                
+                time.sleep(self._smtp_retry_delay(retry_count))
+            
             except Exception as e:
+                self._close_smtp()
                 self.logger.error(f"Unexpected error sending email: {e}")
                 return False
         
         return False
     
+    def _smtp_retry_delay(self, retry_count: int) -> float:
+        """
+        Compute the backoff before an SMTP retry.
+        
+        The delay doubles with each attempt up to SMTP_RETRY_MAX_DELAY, plus
+        random jitter so that several senders do not retry in lockstep.
+        
+        Args:
+            retry_count: Number of attempts that have failed so far
+            
+        Returns:
+            float: Seconds to wait before the next attempt
+        """
+        delay = min(self.SMTP_RETRY_BASE_DELAY * 2 ** retry_count, self.SMTP_RETRY_MAX_DELAY)
+        return delay + random.random() * self.SMTP_RETRY_BASE_DELAY
+    
+    def _get_smtp(self, email_config: Dict[str, Any], check_connection: bool = True) -> 'smtplib.SMTP':
+        """
+        Return the pooled SMTP session, connecting and logging in if needed.
+        
+        A cached session is health-checked with NOOP before reuse and replaced
+        when it has gone stale or the server settings changed.
+        
+        Args:
+            email_config: Email configuration dictionary
+            check_connection: Whether to health-check a cached session
+            
+        Returns:
+            smtplib.SMTP: Authenticated SMTP session
+        """
+        smtplib = _get_smtplib()
+        smtp_server = email_config['smtp_server']
+        smtp_port = int(email_config['smtp_port'])
+        use_tls = email_config.get('use_tls', True)
+        key = (smtp_server, smtp_port, use_tls, email_config['sender_email'])
+        
+        if self._smtp is not None:
+            if self._smtp_key == key:
+                if not check_connection:
+                    return self._smtp
+                try:
+                    self._smtp.noop()
+                    return self._smtp
+                except (smtplib.SMTPException, OSError) as e:
+                    self.logger.debug(f"Pooled SMTP connection is stale, reconnecting: {e}")
+            self._close_smtp()
+        
+        if self._ssl_context is None:
+            self._ssl_context = _get_ssl().create_default_context()
+        
+        if use_tls and smtp_port != _SMTPS_PORT:
+            # Use TLS connection
+            server = smtplib.SMTP(smtp_server, smtp_port)
+            server.starttls(context=self._ssl_context)
+        else:
+            # Use SSL connection; port 465 always speaks implicit TLS, which also
+            # saves the EHLO/STARTTLS/EHLO round trips of an upgrade
+            server = smtplib.SMTP_SSL(smtp_server, smtp_port, context=self._ssl_context)
+        
+        try:
+            server.login(email_config['sender_email'], email_config['sender_password'])
+        except Exception:
+            server.close()
+            raise
+        
+        self._smtp = server
+        self._smtp_key = key
+        self._smtp_msgs = 0
+        return server
+    
+    def _close_smtp(self) -> None:
+        """Close the pooled SMTP session, if any, without raising."""
+        server = self._smtp
+        self._smtp = None
+        self._smtp_key = None
+        self._smtp_msgs = 0
+        
+        if server is None:
+            return
+        
+        try:
+            server.quit()
+        except Exception:
+            # The server may already have dropped the connection
+            try:
+                server.close()
+            except Exception:
+                pass
+    
+    def close(self) -> None:
+        """Release resources held by the notification manager."""
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+        
+        with self._smtp_lock:
+            self._close_smtp()
+    
+    def __enter__(self) -> 'NotificationManager':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+    
     def _send_desktop_notification(self, signal: Signal) -> bool:
         """
         Send desktop notification using system notification services.
@@ -382,19 +825,19 @@ This is an automated trading signal alert from your Forex Alert System.
         Returns:
             bool: True if notification was sent successfully
         """
+        symbol, signal_type = signal.symbol, signal.signal_type
+        
         # Format symbol for display
-        display_symbol = signal.symbol.replace("=X", "").replace("USD", "/USD")
-        if not "/" in display_symbol and len(display_symbol) == 6:
-            display_symbol = f"{display_symbol[:3]}/{display_symbol[3:]}"
+        display_symbol = _display_symbol(symbol)
         
         # Create notification title and message
-        signal_emoji = "📈" if signal.signal_type == "BUY" else "📉"
-        title = f"🔔 Forex Alert: {signal.signal_type} {display_symbol}"
+        signal_emoji = _SIGNAL_STYLE[signal_type].emoji
+        title = f"🔔 Forex Alert: {signal_type} {display_symbol}"
         
         # Format message with key details
         time_str = signal.timestamp.strftime("%H:%M:%S")
         message = (
-            f"{signal.signal_type} Signal {signal_emoji}\n"
+            f"{signal_type} Signal {signal_emoji}\n"
             f"Price: ${signal.price:.5f}\n"
             f"Time: {time_str}\n"
             f"Confidence: {signal.confidence:.2f}"
@@ -407,7 +850,7 @@ This is an automated trading signal alert from your Forex Alert System.
                 notification_config = self._get_desktop_notification_config()
                 
                 # Send notification using plyer
-                notification.notify(
+                _get_plyer_notification().notify(
                     title=title,
                     message=message,
                     app_name="Forex Alert System",
@@ -415,9 +858,9 @@ This is an automated trading signal alert from your Forex Alert System.
                     app_icon=notification_config.get('app_icon')
                 )
                 
-                self.logger.info(f"Desktop notification sent via plyer for {signal.symbol} {signal.signal_type}")
+                self.logger.info(f"Desktop notification sent via plyer for {symbol} {signal_type}")
                 return True
-                
+            
             except Exception as e:
                 self.logger.warning(f"Plyer notification failed, trying fallback: {e}")
                 # Continue to fallback methods
@@ -436,47 +879,48 @@ This is an automated trading signal alert from your Forex Alert System.
         Returns:
             bool: True if notification was sent successfully
         """
+        system = self._platform
+        
+        notify = _get_notify() if system == 'linux' and LIBNOTIFY_AVAILABLE else None
+        if notify is not None:
+            try:
+                if not notify.is_initted():
+                    notify.init("Forex Alert System")
+                notify.Notification.new(title, message).show()
+                self.logger.info("Desktop notification sent via libnotify (Linux)")
+                return True
+            except Exception as e:
+                self.logger.warning(f"libnotify notification failed, trying notify-send: {e}")
+        
         if not SUBPROCESS_AVAILABLE:
             self.logger.error("Desktop notifications not available: no notification method available")
             return False
         
-        system = platform.system().lower()
-        
         try:
             if system == 'darwin':  # macOS
                 # Use osascript to display notification
-                script = f'''
-                display notification "{message}" with title "{title}" sound name "default"
-                '''
-                subprocess.run(['osascript', '-e', script], check=True, capture_output=True)
+                subprocess.run([*_OSASCRIPT_COMMAND, title, message], check=True, capture_output=True)
                 self.logger.info(f"Desktop notification sent via osascript (macOS)")
                 return True
-                
+            
             elif system == 'linux':
                 # Use notify-send on Linux
                 subprocess.run(['notify-send', title, message], check=True, capture_output=True)
                 self.logger.info(f"Desktop notification sent via notify-send (Linux)")
                 return True
-                
+            
             elif system == 'windows':
                 # Use PowerShell on Windows
-                ps_script = f'''
-                Add-Type -AssemblyName System.Windows.Forms
-                $notification = New-Object System.Windows.Forms.NotifyIcon
-                $notification.Icon = [System.Drawing.SystemIcons]::Information
-                $notification.BalloonTipTitle = "{title}"
-                $notification.BalloonTipText = "{message}"
-                $notification.Visible = $true
-                $notification.ShowBalloonTip(5000)
-                '''
-                subprocess.run(['powershell', '-Command', ps_script], check=True, capture_output=True)
+                env = {**os.environ, 'FOREX_ALERT_TITLE': title, 'FOREX_ALERT_MESSAGE': message}
+                subprocess.run(['powershell', '-Command', _POWERSHELL_SCRIPT],
+                               check=True, capture_output=True, env=env)
                 self.logger.info(f"Desktop notification sent via PowerShell (Windows)")
                 return True
-                
+            
             else:
                 self.logger.error(f"Desktop notifications not supported on platform: {system}")
                 return False
-                
+        
         except subprocess.CalledProcessError as e:
             self.logger.error(f"Native desktop notification failed: {e}")
             return False
@@ -494,7 +938,16 @@ This is an automated trading signal alert from your Forex Alert System.
         Returns:
             Dict[str, Any]: Configuration dictionary with platform-specific settings
         """
-        system = platform.system().lower()
+        return self._desktop_cfg
+    
+    def _build_desktop_notification_config(self) -> Dict[str, Any]:
+        """
+        Build platform-specific desktop notification configuration.
+        
+        Returns:
+            Dict[str, Any]: Configuration dictionary with platform-specific settings
+        """
+        system = self._platform
         
         # Default configuration
         config = {
@@ -523,10 +976,16 @@ This is an automated trading signal alert from your Forex Alert System.
         """
         Validate that desktop notifications are available and working.
         
+        The result is cached, since the notification systems available to
+        the process do not change while it runs.
+        
         Returns:
             bool: True if desktop notifications are available
         """
-        system = platform.system()
+        if self._desktop_validated is not None:
+            return self._desktop_validated
+        
+        system = self._platform
         self.logger.info(f"Validating desktop notifications on {system}")
         
         # Check plyer availability first
@@ -534,7 +993,7 @@ This is an automated trading signal alert from your Forex Alert System.
         if PLYER_AVAILABLE:
             try:
                 # Check if we can access the notification module
-                if hasattr(notification, 'notify'):
+                if hasattr(_get_plyer_notification(), 'notify'):
                     plyer_available = True
                     self.logger.info("Plyer notification system is available")
                 else:
@@ -542,30 +1001,21 @@ This is an automated trading signal alert from your Forex Alert System.
             except Exception as e:
                 self.logger.warning(f"Plyer notification validation failed: {e}")
         
-        # Check native notification availability as fallback
+        # Check native notification availability as fallback by scanning PATH
+        # for the platform's notifier instead of running it
         native_available = False
-        if SUBPROCESS_AVAILABLE:
-            try:
-                system_lower = system.lower()
-                if system_lower == 'darwin':
-                    # Check if osascript is available
-                    subprocess.run(['osascript', '-e', 'return'], check=True, capture_output=True)
-                    native_available = True
-                    self.logger.info("macOS osascript notification system is available")
-                elif system_lower == 'linux':
-                    # Check if notify-send is available
-                    subprocess.run(['which', 'notify-send'], check=True, capture_output=True)
-                    native_available = True
-                    self.logger.info("Linux notify-send notification system is available")
-                elif system_lower == 'windows':
-                    # Check if PowerShell is available
-                    subprocess.run(['powershell', '-Command', 'echo test'], check=True, capture_output=True)
-                    native_available = True
-                    self.logger.info("Windows PowerShell notification system is available")
-            except (subprocess.CalledProcessError, FileNotFoundError) as e:
-                self.logger.warning(f"Native notification system validation failed: {e}")
-            except Exception as e:
-                self.logger.warning(f"Native notification validation error: {e}")
+        if system == 'linux' and LIBNOTIFY_AVAILABLE:
+            native_available = True
+            self.logger.info("Linux libnotify notification system is available")
+        elif SUBPROCESS_AVAILABLE:
+            command = _NATIVE_NOTIFIERS.get(system)
+            if command is None:
+                self.logger.warning(f"No native notification system for platform: {system}")
+            elif shutil.which(command):
+                native_available = True
+                self.logger.info(f"Native notification command {command} is available")
+            else:
+                self.logger.warning(f"Native notification command {command} not found on PATH")
         
         # Return True if either plyer or native notifications are available
         available = plyer_available or native_available
@@ -574,6 +1024,7 @@ This is an automated trading signal alert from your Forex Alert System.
         else:
             self.logger.error("No desktop notification system is available")
         
+        self._desktop_validated = available
         return available
     
     def _format_console_message(self, signal: Signal) -> str:
@@ -586,30 +1037,7 @@ This is an automated trading signal alert from your Forex Alert System.
         Returns:
             str: Formatted message string
         """
-        # Determine emoji based on signal type
-        emoji = "📈" if signal.signal_type == "BUY" else "📉"
-        
-        # Format symbol for display (remove =X suffix if present)
-        display_symbol = signal.symbol.replace("=X", "").replace("USD", "/USD")
-        if not "/" in display_symbol and len(display_symbol) == 6:
-            # Format pairs like EURUSD -> EUR/USD
-            display_symbol = f"{display_symbol[:3]}/{display_symbol[3:]}"
-        
-        # Format timestamp
-        time_str = signal.timestamp.strftime("%Y-%m-%d %H:%M:%S UTC")
-        
-        # Create formatted message
-        message = f"""
-🔔 FOREX ALERT 🔔
-Symbol: {display_symbol}
-Signal: {signal.signal_type} {emoji}
-Price: ${signal.price:.5f}
-Time: {time_str}
-ZLMA: {signal.zlma_value:.5f} | EMA: {signal.ema_value:.5f}
-Confidence: {signal.confidence:.2f}
-{'=' * 40}"""
-        
-        return message
+        return _CONSOLE_TEMPLATE.format_map(_signal_fields(signal, _display_symbol(signal.symbol)))
     
     def validate_email_config(self, email_config: Optional[Dict[str, Any]] = None) -> bool:
         """
@@ -649,12 +1077,12 @@ Confidence: {signal.confidence:.2f}
         Returns:
             Dict[str, bool]: Results of notification tests by channel
         """
-        # Create test signal
+        # Create test signal, stamped in UTC to match the formatted alert times
         test_signal = Signal(
             symbol="EURUSD=X",
             signal_type="BUY",
             price=1.0845,
-            timestamp=datetime.now(),
+            timestamp=_utc_now(),
             zlma_value=1.0843,
             ema_value=1.0841,
             confidence=0.95
@@ -734,7 +1162,7 @@ Confidence: {signal.confidence:.2f}
             'subprocess_available': SUBPROCESS_AVAILABLE,
             'notifications_enabled': self._desktop_enabled,
             'validation_passed': False,
-            'config': self._get_desktop_notification_config()
+            'config': dict(self._get_desktop_notification_config())
         }
         
         if self._desktop_enabled:
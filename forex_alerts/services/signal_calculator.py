@@ -5,9 +5,124 @@ Signal calculator for technical analysis indicators and signal detection.
 import pandas as pd
 import numpy as np
 from datetime import datetime, timezone
-from typing import List, Optional
+from importlib.util import find_spec
+from typing import Any, Dict, List, Optional, Tuple
+from ..models.market_data import MarketData
 from ..models.signal import Signal
 
+try:
+    from scipy.signal import lfilter, lfiltic
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+
+try:
+    import talib
+    TALIB_AVAILABLE = True
+except ImportError:
+    TALIB_AVAILABLE = False
+
+# numba is checked without importing it; the kernels are compiled on first use
+NUMBA_AVAILABLE = find_spec('numba') is not None
+_kernels = None
+
+
+def _fill_nans(x: np.ndarray) -> Tuple[np.ndarray, int]:
+    """
+    Forward-fill NaNs so the EMA recurrences never see one.
+    
+    Returns the filled array (x itself when it has no NaN) and the number of
+    leading NaNs, which have no earlier price to take and are left in place.
+    """
+    missing = np.isnan(x)
+    if not missing.any():
+        return x, 0
+    positions = np.where(missing, 0, np.arange(len(x)))
+    np.maximum.accumulate(positions, out=positions)
+    leading = int(np.argmin(missing)) if not missing.all() else len(x)
+    return x[positions], leading
+
+
+def _ema(x: np.ndarray, length: int) -> np.ndarray:
+    """
+    Run the adjust=False EMA recurrence over a float price array.
+    
+    Uses TA-Lib's C EMA when available, then scipy's lfilter, then pandas
+    ewm, each seeded so the first output equals the first price. NaNs are
+    forward-filled first; leading NaNs stay NaN in the output. Always
+    returns a new array of the input's dtype.
+    """
+    x, leading = _fill_nans(x)
+    if leading:
+        y = np.full_like(x, np.nan)
+        if leading < len(x):
+            y[leading:] = _ema(x[leading:], length)
+        return y
+    if TALIB_AVAILABLE and length > 1:
+        # TA-Lib seeds with the SMA of the first `length` prices. Running it on
+        # prices relative to the first one, padded with length - 1 zeros, makes
+        # that seed exactly the first price (EMA is shift-equivariant)
+        first = float(x[0])
+        padded = np.zeros(len(x) + length - 1)
+        np.subtract(x, first, out=padded[length - 1:])
+        y = talib.EMA(padded, timeperiod=length)[length - 1:]
+        y += first
+        return y.astype(x.dtype, copy=False)
+    if SCIPY_AVAILABLE:
+        alpha = 2.0 / (length + 1)
+        b, a = [alpha], [1.0, alpha - 1.0]
+        y, _ = lfilter(b, a, x, zi=lfiltic(b, a, x[:1]))
+        return y.astype(x.dtype, copy=False)
+    return pd.Series(x, copy=False).ewm(span=length, adjust=False).mean().to_numpy(dtype=x.dtype)
+
+
+def _get_kernels():
+    """Import the numba kernels on first use, compiling or loading them from cache."""
+    global _kernels
+    if _kernels is None:
+        from . import signal_kernels
+        _kernels = signal_kernels
+    return _kernels
+
+
+def _dual_ema(close: np.ndarray, length: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Compute EMA(close) and ZLMA(close) of a 1D price array together.
+    
+    Runs the fused numba kernel when available, otherwise a second EMA pass
+    smooths the lag-compensated close (2 * close - ema). NaNs are
+    forward-filled first, so the fastmath kernel never sees one; leading
+    NaNs stay NaN in both outputs.
+    """
+    close, leading = _fill_nans(close)
+    if leading:
+        ema = np.full_like(close, np.nan)
+        zlma = np.full_like(close, np.nan)
+        if leading < len(close):
+            ema[leading:], zlma[leading:] = _dual_ema(close[leading:], length)
+        return ema, zlma
+    if NUMBA_AVAILABLE:
+        return _get_kernels().ema_zlma(close, 2.0 / (length + 1))
+    ema = _ema(close, length)
+    zlma = _ema(2.0 * close - ema, length)
+    return ema, zlma
+
+
+def _ema_zlma_columns(closes: np.ndarray, length: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Compute EMA and ZLMA down each column of a (n_bars, n_symbols) array.
+    
+    Runs the parallel numba kernel when available and the input has no NaN,
+    otherwise applies _dual_ema column by column.
+    """
+    if NUMBA_AVAILABLE and not np.isnan(closes).any():
+        return _get_kernels().ema_zlma_batch(closes, 2.0 / (length + 1))
+    ema = np.empty_like(closes)
+    zlma = np.empty_like(closes)
+    for j in range(closes.shape[1]):
+        ema[:, j], zlma[:, j] = _dual_ema(closes[:, j], length)
+    return ema, zlma
+
 
 class SignalCalculator:
     """
@@ -17,17 +132,35 @@ class SignalCalculator:
     along with signal detection logic for crossovers.
     """
     
-    def __init__(self, ema_length: int = 15):
+    SUPPORTED_DTYPES = (np.float32, np.float64)
+    
+    def __init__(self, ema_length: int = 15, dtype: Any = np.float64):
         """
         Initialize the SignalCalculator.
         
         Args:
             ema_length: Length parameter for EMA calculations (default: 15)
+            dtype: Float dtype for EMA/ZLMA arrays (default: float64); float32
+                  halves memory traffic on long or batched histories
+                  
+        Raises:
+            ValueError: If ema_length is not positive or dtype is unsupported
         """
         if ema_length <= 0:
             raise ValueError("EMA length must be positive")
         
+        dtype = np.dtype(dtype)
+        if dtype not in self.SUPPORTED_DTYPES:
+            raise ValueError(f"Unsupported dtype: {dtype}; use float32 or float64")
+        
         self.ema_length = ema_length
+        self.dtype = dtype
+        
+        # Streaming state per symbol: last EMA/ZLMA values and bar timestamp,
+        # seeded by detect_signals and advanced one bar at a time by update
+        self._ema_state: Dict[str, float] = {}
+        self._zlma_state: Dict[str, float] = {}
+        self._last_index: Dict[str, Optional[int]] = {}
     
     def calculate_vwap(self, data: pd.DataFrame) -> pd.Series:
         """
@@ -39,10 +172,10 @@ class SignalCalculator:
         Args:
             data: DataFrame with columns ['high', 'low', 'close', 'volume']
                  with DatetimeIndex for session-based anchoring
-        
+                 
         Returns:
             pd.Series: VWAP values
-        
+            
         Raises:
             ValueError: If required columns are missing or data is empty
         """
@@ -54,32 +187,45 @@ class SignalCalculator:
         if missing_columns:
             raise ValueError(f"Missing required columns: {missing_columns}")
         
-        # Calculate typical price (HLC/3)
-        typical_price = (data['high'] + data['low'] + data['close']) / 3
+        high, low, close, volume = (data[column].to_numpy(dtype=np.float64) for column in required_columns)
+        n = len(data)
         
-        # Create a copy to avoid modifying original data
-        df = data.copy()
-        df['typical_price'] = typical_price
-        df['price_volume'] = typical_price * data['volume']
+        # Typical price (HLC/3) times volume on raw arrays, with the division
+        # folded into a single multiply
+        price_volume = (high + low + close) * volume * (1.0 / 3.0)
         
-        # Group by date for session-based anchoring (daily reset)
+        # Session starts for anchoring (daily reset)
         if isinstance(data.index, pd.DatetimeIndex):
-            df['date'] = data.index.date
+            index = data.index
+            if index.tz is not None:
+                # Sessions follow local calendar days, not UTC ones
+                index = index.tz_localize(None)
+            days = index.to_numpy().astype('datetime64[D]')
+            session_starts = np.flatnonzero(np.r_[True, days[1:] != days[:-1]])
         else:
             # If no datetime index, treat as single session
-            df['date'] = 0
-        
-        # Calculate VWAP for each session
-        vwap_values = []
-        for date, group in df.groupby('date'):
-            # Calculate cumulative sums for this session
-            cum_price_volume = group['price_volume'].cumsum()
-            cum_volume = group['volume'].cumsum()
-            
-            # Handle zero volume periods - set to NaN where cumulative volume is 0
-            session_vwap = cum_price_volume / cum_volume
-            session_vwap = session_vwap.where(cum_volume > 0, np.nan)
-            vwap_values.extend(session_vwap.values)
+            session_starts = np.array([0])
+        
+        # Bars with any missing input report NaN but, as with pandas' cumsum,
+        # don't poison the running totals of later bars
+        missing = np.isnan(price_volume)
+        
+        # Segmented cumulative sums: one pass over the whole history, then
+        # subtract the running totals as of the bar before each later session
+        cum_price_volume = np.nancumsum(price_volume)
+        cum_volume = np.nancumsum(volume)
+        if len(session_starts) > 1:
+            later_starts = session_starts[1:]
+            session_lengths = np.diff(later_starts, append=n)
+            cum_price_volume[later_starts[0]:] -= np.repeat(cum_price_volume[later_starts - 1], session_lengths)
+            cum_volume[later_starts[0]:] -= np.repeat(cum_volume[later_starts - 1], session_lengths)
+        
+        # Divide only where the session has traded, then mark the zero
+        # volume periods and missing bars NaN with one boolean-mask store
+        has_volume = cum_volume > 0
+        vwap_values = np.empty(n, dtype=np.float64)
+        np.divide(cum_price_volume, cum_volume, out=vwap_values, where=has_volume)
+        vwap_values[~has_volume | missing] = np.nan
         
         # Create series with original index
         vwap_series = pd.Series(vwap_values, index=data.index, name='vwap')
@@ -91,15 +237,16 @@ class SignalCalculator:
         Calculate Exponential Moving Average (EMA).
         
         EMA gives more weight to recent prices and responds more quickly to price changes
-        than a simple moving average.
+        than a simple moving average. Missing closes (NaN) are forward-filled
+        from the last valid close; leading NaNs stay NaN.
         
         Args:
             data: DataFrame with 'close' column
             length: EMA period length (uses self.ema_length if not provided)
-        
+            
         Returns:
             pd.Series: EMA values
-        
+            
         Raises:
             ValueError: If 'close' column is missing or data is empty
         """
@@ -114,10 +261,9 @@ class SignalCalculator:
         if ema_length <= 0:
             raise ValueError("EMA length must be positive")
         
-        # Calculate EMA using pandas ewm (exponentially weighted moving average)
         # Alpha = 2 / (length + 1) is the standard EMA smoothing factor
-        ema = data['close'].ewm(span=ema_length, adjust=False).mean()
-        ema.name = f'ema_{ema_length}'
+        ema_values = _ema(data['close'].to_numpy(dtype=self.dtype), ema_length)
+        ema = pd.Series(ema_values, index=data.index, name=f'ema_{ema_length}')
         
         return ema
     
@@ -128,13 +274,16 @@ class SignalCalculator:
         ZLMA attempts to eliminate the lag inherent in moving averages by using
         the formula: zlma = ema(close + (close - ema(close, length)), length)
         
+        Missing closes (NaN) are forward-filled from the last valid close;
+        leading NaNs stay NaN.
+        
         Args:
             data: DataFrame with 'close' column
             length: EMA period length for ZLMA calculation (uses self.ema_length if not provided)
-        
+            
         Returns:
             pd.Series: ZLMA values
-        
+            
         Raises:
             ValueError: If 'close' column is missing or data is empty
         """
@@ -149,23 +298,65 @@ class SignalCalculator:
         if ema_length <= 0:
             raise ValueError("EMA length must be positive")
         
-        # Step 1: Calculate EMA of close prices
-        ema_close = self.calculate_ema(data, ema_length)
+        # EMA of close and EMA of the lag-compensated close in one pass
+        _, zlma_values = _dual_ema(data['close'].to_numpy(dtype=self.dtype), ema_length)
         
-        # Step 2: Calculate the lag difference (close - ema)
-        lag_difference = data['close'] - ema_close
-        
-        # Step 3: Add the lag difference to close prices
-        adjusted_close = data['close'] + lag_difference
+        return pd.Series(zlma_values, index=data.index, name=f'zlma_{ema_length}')
+    
+    def calculate_ema_batch(self, closes: np.ndarray, length: Optional[int] = None) -> np.ndarray:
+        """
+        Calculate EMA for many symbols at once.
         
-        # Step 4: Calculate EMA of the adjusted close prices
-        # Create temporary DataFrame for the adjusted close
-        temp_data = pd.DataFrame({'close': adjusted_close}, index=data.index)
-        zlma = self.calculate_ema(temp_data, ema_length)
-        zlma.name = f'zlma_{ema_length}'
+        Args:
+            closes: 2D array of close prices shaped (n_bars, n_symbols), e.g.
+                   np.column_stack of aligned per-symbol close arrays
+            length: EMA period length (uses self.ema_length if not provided)
+            
+        Returns:
+            np.ndarray: EMA values with the same shape as closes
+            
+        Raises:
+            ValueError: If closes is not a non-empty 2D array or length is invalid
+        """
+        closes, ema_length = self._validate_batch(closes, length)
+        ema, _ = _ema_zlma_columns(closes, ema_length)
+        return ema
+    
+    def calculate_zlma_batch(self, closes: np.ndarray, length: Optional[int] = None) -> np.ndarray:
+        """
+        Calculate Zero-Lag Moving Average for many symbols at once.
         
+        Args:
+            closes: 2D array of close prices shaped (n_bars, n_symbols), e.g.
+                   np.column_stack of aligned per-symbol close arrays
+            length: EMA period length for ZLMA calculation (uses self.ema_length if not provided)
+            
+        Returns:
+            np.ndarray: ZLMA values with the same shape as closes
+            
+        Raises:
+            ValueError: If closes is not a non-empty 2D array or length is invalid
+        """
+        closes, ema_length = self._validate_batch(closes, length)
+        _, zlma = _ema_zlma_columns(closes, ema_length)
         return zlma
     
+    def _validate_batch(self, closes: np.ndarray, length: Optional[int]) -> Tuple[np.ndarray, int]:
+        """Validate batch input and return it as self.dtype with the resolved length."""
+        closes = np.asarray(closes, dtype=self.dtype)
+        if closes.ndim != 2:
+            raise ValueError("Closes must be a 2D array shaped (n_bars, n_symbols)")
+        
+        if closes.size == 0:
+            raise ValueError("Data cannot be empty")
+        
+        ema_length = length if length is not None else self.ema_length
+        
+        if ema_length <= 0:
+            raise ValueError("EMA length must be positive")
+        
+        return closes, ema_length
+    
     def detect_signals(self, data: pd.DataFrame, symbol: str) -> List[Signal]:
         """
         Detect bullish and bearish signals based on ZLMA and EMA crossovers.
@@ -173,13 +364,16 @@ class SignalCalculator:
         Generates BUY signals when ZLMA crosses above EMA (bullish crossover)
         and SELL signals when ZLMA crosses below EMA (bearish crossover).
         
+        Also replaces the streaming state for symbol with the indicator values
+        at the last bar of data, so later update() calls continue from here.
+        
         Args:
             data: DataFrame with OHLCV data
             symbol: The forex symbol being analyzed
-        
+            
         Returns:
             List[Signal]: List of detected signals
-        
+            
         Raises:
             ValueError: If required columns are missing or data is insufficient
         """
@@ -192,51 +386,175 @@ class SignalCalculator:
         if len(data) < self.ema_length:
             raise ValueError(f"Insufficient data: need at least {self.ema_length} periods")
         
-        # Calculate EMA and ZLMA
-        ema = self.calculate_ema(data)
-        zlma = self.calculate_zlma(data)
+        index = data.index if isinstance(data.index, pd.DatetimeIndex) else None
+        return self._detect_signals_core(data['close'].to_numpy(), index, symbol)
+    
+    def detect_signals_arr(self, close: np.ndarray, index_i8: Optional[np.ndarray], symbol: str) -> List[Signal]:
+        """
+        Detect crossover signals from raw arrays, bypassing DataFrame handling.
         
-        signals = []
+        Intended for streaming consumers that already hold NumPy arrays; only
+        the data length is checked. Like detect_signals, this replaces the
+        streaming state for symbol.
         
-        # Need at least 2 periods to detect crossovers
-        for i in range(1, len(data)):
-            current_zlma = zlma.iloc[i]
-            current_ema = ema.iloc[i]
-            prev_zlma = zlma.iloc[i-1]
-            prev_ema = ema.iloc[i-1]
-            
-            # Skip if any values are NaN
-            if pd.isna(current_zlma) or pd.isna(current_ema) or pd.isna(prev_zlma) or pd.isna(prev_ema):
-                continue
+        Args:
+            close: 1D array of close prices
+            index_i8: int64 nanosecond timestamps aligned with close (e.g.
+                     data.index.asi8, which is UTC for tz-aware indexes), or
+                     None to stamp signals with the current UTC time
+            symbol: The forex symbol being analyzed
             
-            # Detect bullish crossover: ZLMA crosses above EMA
-            if prev_zlma <= prev_ema and current_zlma > current_ema:
-                signal = Signal(
-                    symbol=symbol,
-                    signal_type="BUY",
-                    price=data['close'].iloc[i],
-                    timestamp=data.index[i] if isinstance(data.index, pd.DatetimeIndex) else datetime.now(timezone.utc),
-                    zlma_value=current_zlma,
-                    ema_value=current_ema,
-                    confidence=self._calculate_signal_confidence(current_zlma, current_ema, prev_zlma, prev_ema)
-                )
-                signals.append(signal)
+        Returns:
+            List[Signal]: List of detected signals, with naive timestamps when
+                         index_i8 is given
+                         
+        Raises:
+            ValueError: If close has fewer than ema_length values
+        """
+        if len(close) < self.ema_length:
+            raise ValueError(f"Insufficient data: need at least {self.ema_length} periods")
+        
+        index = None
+        if index_i8 is not None:
+            index = pd.DatetimeIndex(np.asarray(index_i8, dtype=np.int64).view('M8[ns]'))
+        return self._detect_signals_core(np.asarray(close), index, symbol)
+    
+    def _detect_signals_core(self, close_arr: np.ndarray, index: Optional[pd.DatetimeIndex],
+                             symbol: str) -> List[Signal]:
+        """
+        Find ZLMA/EMA crossovers in a validated close array and build signals.
+        
+        Args:
+            close_arr: 1D array of close prices
+            index: Timestamps aligned with close_arr, or None to stamp signals
+                  with the current UTC time
+            symbol: The forex symbol being analyzed
             
-            # Detect bearish crossover: ZLMA crosses below EMA
-            elif prev_zlma >= prev_ema and current_zlma < current_ema:
-                signal = Signal(
-                    symbol=symbol,
-                    signal_type="SELL",
-                    price=data['close'].iloc[i],
-                    timestamp=data.index[i] if isinstance(data.index, pd.DatetimeIndex) else datetime.now(timezone.utc),
-                    zlma_value=current_zlma,
-                    ema_value=current_ema,
-                    confidence=self._calculate_signal_confidence(current_zlma, current_ema, prev_zlma, prev_ema)
-                )
-                signals.append(signal)
+        Returns:
+            List[Signal]: List of detected signals
+        """
+        # Calculate EMA and ZLMA together, skipping the public methods'
+        # validation and Series construction
+        ema_arr, zlma_arr = _dual_ema(close_arr.astype(self.dtype, copy=False), self.ema_length)
+        
+        # Bar pairs where either indicator or the original close is NaN on
+        # either bar are excluded, using one isnan pass per array instead of
+        # per-bar checks; the indicators keep moving over forward-filled gaps,
+        # so a crossover there would have no real price to report
+        nan_mask = np.isnan(zlma_arr) | np.isnan(ema_arr) | np.isnan(close_arr)
+        valid_pair = ~(nan_mask[1:] | nan_mask[:-1])
+        
+        # Crossovers are sign changes of (zlma - ema) between consecutive bars
+        diff = zlma_arr - ema_arr
+        cross_up = valid_pair & (diff[1:] > 0) & (diff[:-1] <= 0)
+        cross_dn = valid_pair & (diff[1:] < 0) & (diff[:-1] >= 0)
+        
+        # Gather every field at the (typically sparse) crossover bars with one
+        # fancy index each; mask positions are offset by one from their bar
+        crossings = np.flatnonzero(cross_up | cross_dn) + 1
+        previous = crossings - 1
+        zlma_values = zlma_arr[crossings]
+        ema_values = ema_arr[crossings]
+        confidences = self._calculate_signal_confidence_vec(
+            zlma_values, ema_values, zlma_arr[previous], ema_arr[previous]
+        )
+        signal_types = np.where(cross_up[previous], "BUY", "SELL")
+        if index is not None:
+            timestamps = index[crossings]
+        else:
+            timestamps = [datetime.now(timezone.utc)] * len(crossings)
+        
+        # Bound locally so the comprehension reads a closure cell, not a global
+        new_signal = Signal
+        signals = [
+            new_signal(
+                symbol=symbol,
+                signal_type=signal_type,
+                price=price,
+                timestamp=timestamp,
+                zlma_value=zlma_value,
+                ema_value=ema_value,
+                confidence=confidence
+            )
+            for signal_type, price, timestamp, zlma_value, ema_value, confidence in zip(
+                signal_types.tolist(), close_arr[crossings].tolist(), timestamps,
+                zlma_values.tolist(), ema_values.tolist(), confidences.tolist()
+            )
+        ]
+        
+        self._seed_state(symbol, ema_arr[-1], zlma_arr[-1], index[-1].value if index is not None else None)
         
         return signals
     
+    def update(self, bar: MarketData) -> Optional[Signal]:
+        """
+        Advance the indicators for bar.symbol by one bar and check for a crossover.
+        
+        Applies a single step of the EMA and ZLMA recurrences to the state left
+        by detect_signals (or by earlier updates), so each new bar costs O(1)
+        instead of recomputing the whole history. The first bar seen for a
+        symbol without prior state only seeds it. Bars that are not newer than
+        the last processed timestamp are ignored; timestamps are compared in
+        UTC, with naive timestamps taken to be UTC already.
+        
+        Args:
+            bar: The newest market data bar for a symbol
+            
+        Returns:
+            Optional[Signal]: The signal generated by this bar, if any
+        """
+        symbol = bar.symbol
+        close = bar.close
+        
+        # UTC nanoseconds, so naive bars compare against tz-aware history
+        bar_index = pd.Timestamp(bar.timestamp).value
+        last_index = self._last_index.get(symbol)
+        if last_index is not None and bar_index <= last_index:
+            return None
+        
+        prev_ema = self._ema_state.get(symbol)
+        prev_zlma = self._zlma_state.get(symbol)
+        if prev_ema is None or prev_zlma is None:
+            self._seed_state(symbol, close, close, bar_index)
+            return None
+        
+        alpha = 2.0 / (self.ema_length + 1)
+        decay = 1.0 - alpha
+        ema = alpha * close + decay * prev_ema
+        zlma = alpha * (2.0 * close - ema) + decay * prev_zlma
+        self._seed_state(symbol, ema, zlma, bar_index)
+        
+        prev_diff = prev_zlma - prev_ema
+        diff = zlma - ema
+        if prev_diff <= 0 and diff > 0:
+            signal_type = "BUY"
+        elif prev_diff >= 0 and diff < 0:
+            signal_type = "SELL"
+        else:
+            return None
+        
+        return Signal(
+            symbol=symbol,
+            signal_type=signal_type,
+            price=close,
+            timestamp=bar.timestamp,
+            zlma_value=zlma,
+            ema_value=ema,
+            confidence=self._calculate_signal_confidence(zlma, ema, prev_zlma, prev_ema)
+        )
+    
+    def _seed_state(self, symbol: str, ema: float, zlma: float, last_index: Optional[int]) -> None:
+        """Store the latest EMA/ZLMA values and bar timestamp (UTC ns) for a symbol."""
+        if np.isnan(ema) or np.isnan(zlma):
+            # A NaN tail cannot seed the recurrences; start over on the next bar
+            self._ema_state.pop(symbol, None)
+            self._zlma_state.pop(symbol, None)
+            self._last_index.pop(symbol, None)
+            return
+        self._ema_state[symbol] = float(ema)
+        self._zlma_state[symbol] = float(zlma)
+        self._last_index[symbol] = last_index
+    
     def _calculate_signal_confidence(self, current_zlma: float, current_ema: float, 
                                    prev_zlma: float, prev_ema: float) -> float:
         """
@@ -251,30 +569,53 @@ class SignalCalculator:
             current_ema: Current EMA value
             prev_zlma: Previous ZLMA value
             prev_ema: Previous EMA value
-        
+            
         Returns:
             float: Confidence level between 0.0 and 1.0
         """
+        return float(self._calculate_signal_confidence_vec(current_zlma, current_ema, prev_zlma, prev_ema))
+    
+    def _calculate_signal_confidence_vec(self, current_zlma: np.ndarray, current_ema: np.ndarray,
+                                         prev_zlma: np.ndarray, prev_ema: np.ndarray) -> np.ndarray:
+        """
+        Calculate signal confidence for many crossovers at once.
+        
+        Element-wise equivalent of _calculate_signal_confidence, evaluated with
+        NumPy ufuncs instead of one Python call per crossover.
+        
+        Args:
+            current_zlma: ZLMA values at the crossover bars
+            current_ema: EMA values at the crossover bars
+            prev_zlma: ZLMA values on the bars before the crossovers
+            prev_ema: EMA values on the bars before the crossovers
+            
+        Returns:
+            np.ndarray: Confidence levels between 0.0 and 1.0
+        """
+        current_zlma, current_ema, prev_zlma, prev_ema = (
+            np.asarray(values, dtype=np.float64) for values in (current_zlma, current_ema, prev_zlma, prev_ema)
+        )
+        
         # Calculate the separation after crossover (as percentage of price)
-        current_separation = abs(current_zlma - current_ema)
+        current_separation = np.abs(current_zlma - current_ema)
         avg_price = (current_zlma + current_ema) / 2
-        separation_pct = current_separation / avg_price if avg_price > 0 else 0
+        separation_pct = np.divide(current_separation, avg_price,
+                                   out=np.zeros_like(avg_price), where=avg_price > 0)
         
         # Calculate how decisive the crossover was
-        prev_separation = abs(prev_zlma - prev_ema)
+        prev_separation = np.abs(prev_zlma - prev_ema)
         prev_avg_price = (prev_zlma + prev_ema) / 2
-        prev_separation_pct = prev_separation / prev_avg_price if prev_avg_price > 0 else 0
-        
-        # Base confidence starts at 0.5
-        confidence = 0.5
+        prev_separation_pct = np.divide(prev_separation, prev_avg_price,
+                                        out=np.zeros_like(prev_avg_price), where=prev_avg_price > 0)
         
-        # Increase confidence based on current separation (up to +0.3)
-        confidence += min(separation_pct * 100, 0.3)  # Scale by 100 for typical forex spreads
+        # Base confidence starts at 0.5, increased based on current separation
+        # (up to +0.3); scale by 100 for typical forex spreads
+        confidence = 0.5 + np.minimum(separation_pct * 100, 0.3)
         
         # Increase confidence if crossover is decisive (up to +0.2)
-        if prev_separation_pct > 0:
-            decisiveness = separation_pct / prev_separation_pct
-            confidence += min(decisiveness * 0.1, 0.2)
+        decisiveness = np.divide(separation_pct, prev_separation_pct,
+                                 out=np.zeros_like(separation_pct), where=prev_separation_pct > 0)
+        confidence += np.minimum(decisiveness * 0.1, 0.2)
         
         # Ensure confidence stays within bounds
-        return min(max(confidence, 0.0), 1.0)
\ No newline at end of file
+        return np.clip(confidence, 0.0, 1.0)
\ No newline at end of file
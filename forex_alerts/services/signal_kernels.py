@@ -0,0 +1,69 @@
+"""
+Compiled EMA/ZLMA kernels for the signal calculator.
+
+Requires numba. signal_calculator imports this module on first use, so the
+numba import and kernel compilation (or on-disk cache load) stay off the
+package's import path.
+"""
+
+import numpy as np
+from numba import njit, prange
+
+# Explicit signatures (one per supported dtype) compile both variants when
+# this module is imported, or load them from numba's on-disk cache
+_KERNEL_SIGNATURES = [
+    'UniTuple(float64[:], 2)(float64[:], float64)',
+    'UniTuple(float32[:], 2)(float32[:], float64)',
+]
+_BATCH_KERNEL_SIGNATURES = [
+    'UniTuple(float64[:, :], 2)(float64[:, :], float64)',
+    'UniTuple(float32[:, :], 2)(float32[:, :], float64)',
+]
+
+
+@njit(_KERNEL_SIGNATURES, cache=True, fastmath=True)
+def ema_zlma(close, alpha):
+    """
+    Compute EMA(close) and ZLMA(close) in a single compiled pass.
+    
+    Both recurrences are seeded with the first close, matching pandas
+    ewm with adjust=False. Outputs share the input's dtype. The input
+    must not contain NaN (see signal_calculator._fill_nans), which lets it
+    use fastmath.
+    """
+    n = close.shape[0]
+    ema = np.empty_like(close)
+    zlma = np.empty_like(close)
+    ema_prev = close[0]
+    zlma_prev = close[0]
+    decay = 1.0 - alpha
+    for i in range(n):
+        ema_prev = alpha * close[i] + decay * ema_prev
+        # close + (close - ema) is the lag-compensated price
+        zlma_prev = alpha * (2.0 * close[i] - ema_prev) + decay * zlma_prev
+        ema[i] = ema_prev
+        zlma[i] = zlma_prev
+    return ema, zlma
+
+
+@njit(_BATCH_KERNEL_SIGNATURES, cache=True, fastmath=True, parallel=True)
+def ema_zlma_batch(closes, alpha):
+    """
+    Compute EMA and ZLMA for every column of a (n_bars, n_symbols) array.
+    
+    Symbols are independent, so columns are spread across threads while
+    each column runs the same recurrence as ema_zlma.
+    """
+    n_bars, n_symbols = closes.shape
+    ema = np.empty_like(closes)
+    zlma = np.empty_like(closes)
+    decay = 1.0 - alpha
+    for j in prange(n_symbols):
+        ema_prev = closes[0, j]
+        zlma_prev = closes[0, j]
+        for i in range(n_bars):
+            ema_prev = alpha * closes[i, j] + decay * ema_prev
+            zlma_prev = alpha * (2.0 * closes[i, j] - ema_prev) + decay * zlma_prev
+            ema[i, j] = ema_prev
+            zlma[i, j] = zlma_prev
+    return ema, zlma
@@ -1,3 +1,8 @@
 """
 Utility functions and helpers for the Forex Alert System.
-"""
\ No newline at end of file
+"""
+
+from .http import create_session
+from .symbols import clear_symbol_cache, get_yfinance, is_valid_symbol
+
+__all__ = ['create_session', 'clear_symbol_cache', 'get_yfinance', 'is_valid_symbol']
@@ -0,0 +1,27 @@
+"""
+HTTP session helpers for direct Yahoo Finance requests.
+"""
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+def create_session(pool_size: int = 16) -> requests.Session:
+    """
+    Create a requests session with keepalive connection pooling.
+    
+    Reusing one session across our own chart API calls avoids a fresh
+    TCP+TLS handshake to Yahoo for every request. Don't pass it to yfinance,
+    which manages its own session.
+    
+    Args:
+        pool_size: Number of pooled connections per host
+        
+    Returns:
+        requests.Session: Session with pooled HTTP(S) adapters mounted
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
@@ -0,0 +1,57 @@
+"""
+yfinance access and symbol validation helpers shared by the services.
+"""
+
+from typing import Set
+
+
+# yfinance (and the pandas/numpy stack it pulls in) is imported on first use
+_yf = None
+
+# Symbols yfinance has confirmed as valid. Failures (including network
+# errors) are never cached, so a transient outage can't blacklist a symbol
+_valid_symbols: Set[str] = set()
+
+
+def get_yfinance():
+    """Import yfinance on first use and cache the module."""
+    global _yf
+    if _yf is None:
+        import yfinance
+        _yf = yfinance
+    return _yf
+
+
+def is_valid_symbol(symbol: str) -> bool:
+    """
+    Validate a formatted symbol using yfinance, remembering confirmed symbols.
+    
+    Args:
+        symbol: Formatted symbol to validate (e.g., "EURUSD=X")
+        
+    Returns:
+        bool: True if symbol is valid, False otherwise
+    """
+    if symbol in _valid_symbols:
+        return True
+    
+    try:
+        # A single daily bar is enough to prove the symbol exists; the
+        # .info endpoint is a second, much heavier round-trip. No session is
+        # passed so yfinance keeps its own (browser-impersonating) one
+        hist = get_yfinance().Ticker(symbol).history(period="1d", interval="1d")
+    
+    except Exception:
+        # Any exception means the symbol is invalid
+        return False
+    
+    if hist.empty:
+        return False
+    
+    _valid_symbols.add(symbol)
+    return True
+
+
+def clear_symbol_cache() -> None:
+    """Forget every symbol previously confirmed as valid."""
+    _valid_symbols.clear()
@@ -11,34 +11,56 @@ from unittest.mock import Mock, patch, MagicMock
 import pandas as pd
 
 from forex_alerts.services.config_manager import ConfigManager
+from forex_alerts.utils.symbols import clear_symbol_cache
 from forex_alerts.models.config import Config
 
 
+def _fast_rmtree(path: str) -> None:
+    """Recursively delete a directory using dirent types from os.scandir."""
+    try:
+        entries = os.scandir(path)
+    except FileNotFoundError:
+        # Already gone; cheaper than a separate exists() stat
+        return
+    
+    with entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                _fast_rmtree(entry.path)
+            else:
+                os.unlink(entry.path)
+    os.rmdir(path)
+
+
 class TestConfigManager(unittest.TestCase):
     """Test cases for ConfigManager class."""
     
+    @classmethod
+    def setUpClass(cls):
+        """Create one temporary directory shared by every test in the class."""
+        cls.temp_dir = tempfile.mkdtemp()
+    
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the shared temporary directory."""
+        _fast_rmtree(cls.temp_dir)
+    
     def setUp(self):
         """Set up test fixtures."""
-        # Create temporary directory for test configs
-        self.temp_dir = tempfile.mkdtemp()
-        self.test_config_path = Path(self.temp_dir) / "test_config.json"
+        # Each test gets its own config filename inside the shared directory
+        self.config_stem = f"cfg_{self._testMethodName}"
+        self.test_config_path = Path(self.temp_dir) / f"{self.config_stem}.json"
         self.config_manager = ConfigManager(str(self.test_config_path))
+        clear_symbol_cache()
     
     def tearDown(self):
         """Clean up test fixtures."""
-        # Remove test config file if it exists
-        if self.test_config_path.exists():
-            self.test_config_path.unlink()
-        
-        # Remove any backup files
-        temp_path = Path(self.temp_dir)
-        for backup_file in temp_path.glob("*.backup_*.json"):
-            backup_file.unlink()
-        
-        # Remove temp directory
-        if temp_path.exists():
-            import shutil
-            shutil.rmtree(self.temp_dir)
+        # Remove only this test's config, temp and backup files
+        prefix = f"{self.config_stem}."
+        with os.scandir(self.temp_dir) as entries:
+            for entry in entries:
+                if entry.name.startswith(prefix):
+                    os.unlink(entry.path)
     
     def test_init_default_path(self):
         """Test ConfigManager initialization with default path."""
@@ -89,11 +111,100 @@ class TestConfigManager(unittest.TestCase):
         # Load config
         loaded_config = self.config_manager.load_config()
         
-        self.assertEqual(loaded_config.symbols, test_config.symbols)
-        self.assertEqual(loaded_config.ema_length, test_config.ema_length)
-        self.assertEqual(loaded_config.update_frequency, test_config.update_frequency)
-        self.assertEqual(loaded_config.notification_methods, test_config.notification_methods)
-        self.assertEqual(loaded_config.data_retention_hours, test_config.data_retention_hours)
+        # Dataclass equality compares every field, including email_config
+        self.assertEqual(loaded_config, test_config)
+    
+    def test_save_config_replaces_file_atomically(self):
+        """Test save_config swaps in the new file without leaving a temp file."""
+        self.config_manager.save_config(Config(symbols=["EURUSD=X"]))
+        self.config_manager.save_config(Config(symbols=["GBPUSD=X"]))
+        
+        with open(self.test_config_path, 'r') as f:
+            saved_data = json.load(f)
+        
+        self.assertEqual(saved_data['symbols'], ["GBPUSD=X"])
+        self.assertFalse(self.config_manager._temp_path().exists())
+    
+    def test_save_config_fsyncs_before_replace(self):
+        """Test the temp file is flushed to disk before it replaces the config."""
+        calls = []
+        with patch('forex_alerts.services.config_manager.os.fsync',
+                   side_effect=lambda fd: calls.append('fsync')), \
+             patch('forex_alerts.services.config_manager.os.replace',
+                   side_effect=lambda src, dst: calls.append('replace')):
+            self.config_manager.save_config(Config(symbols=["EURUSD=X"]))
+        
+        self.assertEqual(calls, ['fsync', 'replace'])
+    
+    def test_save_config_failure_removes_temp_file(self):
+        """Test a failed save leaves the old config and no temp file behind."""
+        self.config_manager.save_config(Config(symbols=["EURUSD=X"]))
+        original_bytes = self.test_config_path.read_bytes()
+        
+        with patch('forex_alerts.services.config_manager.os.fsync', side_effect=OSError("disk full")):
+            with self.assertRaises(IOError):
+                self.config_manager.save_config(Config(symbols=["GBPUSD=X"]))
+        
+        self.assertEqual(self.test_config_path.read_bytes(), original_bytes)
+        self.assertFalse(self.config_manager._temp_path().exists())
+    
+    @patch('forex_alerts.services.config_manager.ORJSON_AVAILABLE', False)
+    def test_save_and_load_config_stdlib_json(self):
+        """Test config round-trip falls back to stdlib json without orjson."""
+        test_config = Config(symbols=["EURUSD=X"], ema_length=20)
+        
+        self.config_manager.save_config(test_config)
+        loaded_config = self.config_manager.load_config()
+        
+        self.assertEqual(loaded_config, Config(symbols=["EURUSD=X"], ema_length=20))
+    
+    def test_load_config_cached_until_file_changes(self):
+        """Test load_config reuses the parsed config until the file changes."""
+        self.config_manager.save_config(Config(symbols=["EURUSD=X"]))
+        
+        first = self.config_manager.load_config()
+        with patch('forex_alerts.services.config_manager._loads') as mock_loads:
+            second = self.config_manager.load_config()
+            mock_loads.assert_not_called()
+        self.assertEqual(first, second)
+        self.assertIsNot(first, second)
+        
+        # Saving invalidates the cache
+        self.config_manager.save_config(Config(symbols=["GBPUSD=X"]))
+        self.assertEqual(self.config_manager.load_config().symbols, ["GBPUSD=X"])
+    
+    def test_load_config_cache_isolated_from_callers(self):
+        """Test mutating a loaded config does not change later loads."""
+        self.config_manager.save_config(Config(symbols=["EURUSD=X"]))
+        
+        first = self.config_manager.load_config()
+        first.symbols.append("GBPUSD=X")
+        first.ema_length = 99
+        
+        second = self.config_manager.load_config()
+        self.assertEqual(second.symbols, ["EURUSD=X"])
+        self.assertEqual(second.ema_length, 15)
+    
+    @patch.object(ConfigManager, 'MMAP_THRESHOLD_BYTES', 0)
+    def test_load_config_memory_mapped(self):
+        """Test loading a config above the mmap threshold."""
+        self.config_manager.save_config(Config(symbols=["EURUSD=X"], ema_length=20))
+        
+        loaded_config = self.config_manager.load_config()
+        
+        self.assertEqual(loaded_config, Config(symbols=["EURUSD=X"], ema_length=20))
+    
+    def test_load_config_complete_file_not_rewritten(self):
+        """Test loading an up-to-date config does not write it back."""
+        self.config_manager.save_config(Config(symbols=["EURUSD=X"]))
+        original_bytes = self.test_config_path.read_bytes()
+        
+        # Fresh manager so the in-memory cache is not involved
+        with patch.object(ConfigManager, 'save_config') as mock_save:
+            ConfigManager(str(self.test_config_path)).load_config()
+            mock_save.assert_not_called()
+        
+        self.assertEqual(self.test_config_path.read_bytes(), original_bytes)
     
     def test_load_config_creates_default_if_not_exists(self):
         """Test that load_config creates default config if file doesn't exist."""
@@ -122,6 +233,16 @@ class TestConfigManager(unittest.TestCase):
         
         self.assertIn("Invalid JSON", str(context.exception))
     
+    @patch('forex_alerts.services.config_manager.ORJSON_AVAILABLE', False)
+    def test_load_config_invalid_json_stdlib(self):
+        """Test invalid JSON is reported the same way without orjson."""
+        self.test_config_path.write_text("invalid json content")
+        
+        with self.assertRaises(ValueError) as context:
+            self.config_manager.load_config()
+        
+        self.assertIn("Invalid JSON", str(context.exception))
+    
     def test_save_config_io_error(self):
         """Test save_config with IO error."""
         # Create config
@@ -134,12 +255,11 @@ class TestConfigManager(unittest.TestCase):
             
             self.assertIn("Error saving configuration", str(context.exception))
     
-    @patch('forex_alerts.services.config_manager.yf.Ticker')
+    @patch('yfinance.Ticker')
     def test_validate_single_symbol_valid(self, mock_ticker_class):
         """Test validation of a single valid symbol."""
         # Mock yfinance ticker
         mock_ticker = Mock()
-        mock_ticker.info = {'symbol': 'EURUSD=X'}
         mock_ticker.history.return_value = pd.DataFrame({
             'Close': [1.0850, 1.0860],
             'Volume': [1000, 1100]
@@ -151,30 +271,30 @@ class TestConfigManager(unittest.TestCase):
         
         # Verify yfinance was called correctly
         mock_ticker_class.assert_called_once_with("EURUSD=X")
-        mock_ticker.history.assert_called_once_with(period="1d", interval="1h")
-    
-    @patch('forex_alerts.services.config_manager.yf.Ticker')
-    def test_validate_single_symbol_invalid_no_info(self, mock_ticker_class):
-        """Test validation of symbol with no info."""
-        mock_ticker = Mock()
-        mock_ticker.info = {}
-        mock_ticker_class.return_value = mock_ticker
-        
-        result = self.config_manager._validate_single_symbol("INVALID=X")
-        self.assertFalse(result)
+        mock_ticker.history.assert_called_once_with(period="1d", interval="1d")
     
-    @patch('forex_alerts.services.config_manager.yf.Ticker')
+    @patch('yfinance.Ticker')
     def test_validate_single_symbol_invalid_empty_history(self, mock_ticker_class):
         """Test validation of symbol with empty history."""
         mock_ticker = Mock()
-        mock_ticker.info = {'symbol': 'INVALID=X'}
         mock_ticker.history.return_value = pd.DataFrame()  # Empty DataFrame
         mock_ticker_class.return_value = mock_ticker
         
         result = self.config_manager._validate_single_symbol("INVALID=X")
         self.assertFalse(result)
     
-    @patch('forex_alerts.services.config_manager.yf.Ticker')
+    @patch('yfinance.Ticker')
+    def test_validate_single_symbol_history_only(self, mock_ticker_class):
+        """Test validation judges the symbol on history alone, never .info."""
+        # Any attribute outside the spec (e.g. .info) raises, failing validation
+        mock_ticker = Mock(spec=['history'])
+        mock_ticker.history.return_value = pd.DataFrame({'Close': [1.0850]})
+        mock_ticker_class.return_value = mock_ticker
+        
+        self.assertTrue(self.config_manager._validate_single_symbol("EURUSD=X"))
+        mock_ticker.history.assert_called_once()
+    
+    @patch('yfinance.Ticker')
     def test_validate_single_symbol_exception(self, mock_ticker_class):
         """Test validation of symbol that raises exception."""
         mock_ticker_class.side_effect = Exception("Network error")
@@ -182,6 +302,34 @@ class TestConfigManager(unittest.TestCase):
         result = self.config_manager._validate_single_symbol("ERROR=X")
         self.assertFalse(result)
     
+    @patch('yfinance.Ticker')
+    def test_validate_single_symbol_cached(self, mock_ticker_class):
+        """Test repeated validation of a symbol only probes yfinance once."""
+        mock_ticker = Mock()
+        mock_ticker.history.return_value = pd.DataFrame({'Close': [1.0850]})
+        mock_ticker_class.return_value = mock_ticker
+        
+        self.assertTrue(self.config_manager._validate_single_symbol("EURUSD=X"))
+        self.assertTrue(self.config_manager._validate_single_symbol("EURUSD=X"))
+        
+        mock_ticker_class.assert_called_once_with("EURUSD=X")
+        
+        # Clearing the cache forces a fresh probe
+        clear_symbol_cache()
+        self.config_manager._validate_single_symbol("EURUSD=X")
+        self.assertEqual(mock_ticker_class.call_count, 2)
+    
+    @patch('yfinance.Ticker')
+    def test_validate_single_symbol_failure_not_cached(self, mock_ticker_class):
+        """Test a failed probe is retried instead of marking the symbol invalid for good."""
+        mock_ticker = Mock()
+        mock_ticker.history.return_value = pd.DataFrame({'Close': [1.0850]})
+        mock_ticker_class.side_effect = [Exception("Network error"), mock_ticker]
+        
+        self.assertFalse(self.config_manager._validate_single_symbol("EURUSD=X"))
+        self.assertTrue(self.config_manager._validate_single_symbol("EURUSD=X"))
+        self.assertEqual(mock_ticker_class.call_count, 2)
+    
     @patch.object(ConfigManager, '_validate_single_symbol')
     def test_validate_symbols_success(self, mock_validate):
         """Test successful symbol validation."""
@@ -199,8 +347,9 @@ class TestConfigManager(unittest.TestCase):
     @patch.object(ConfigManager, '_validate_single_symbol')
     def test_validate_symbols_mixed_valid_invalid(self, mock_validate):
         """Test symbol validation with mix of valid and invalid symbols."""
-        # Mock validation: first two valid, third invalid
-        mock_validate.side_effect = [True, True, False]
+        # Mock validation: first two valid, third invalid (keyed by symbol
+        # since validation runs concurrently)
+        mock_validate.side_effect = lambda symbol: symbol != "INVALID"
         
         symbols = ["EURUSD", "GBPUSD", "INVALID"]
         
@@ -227,6 +376,25 @@ class TestConfigManager(unittest.TestCase):
         self.assertIn("INVALID1", str(context.exception))
         self.assertIn("INVALID2", str(context.exception))
     
+    @patch.object(ConfigManager, '_validate_single_symbol', return_value=True)
+    def test_validate_symbols_probes_duplicates_once(self, mock_validate):
+        """Test symbols that format identically are validated once."""
+        result = self.config_manager.validate_symbols(["eurusd", "EURUSD=X", " GBPUSD "])
+        
+        self.assertEqual(result, ["EURUSD=X", "EURUSD=X", "GBPUSD=X"])
+        self.assertEqual(sorted(call.args[0] for call in mock_validate.call_args_list),
+                         ["EURUSD=X", "GBPUSD=X"])
+    
+    @patch.object(ConfigManager, '_validate_single_symbol', return_value=True)
+    def test_validate_symbols_single_symbol_inline(self, mock_validate):
+        """Test a single symbol is validated without a thread pool."""
+        with patch('forex_alerts.services.config_manager.ThreadPoolExecutor') as mock_pool:
+            result = self.config_manager.validate_symbols(["EURUSD"])
+        
+        self.assertEqual(result, ["EURUSD=X"])
+        mock_pool.assert_not_called()
+        mock_validate.assert_called_once_with("EURUSD=X")
+    
     def test_validate_symbols_empty_list(self):
         """Test symbol validation with empty list."""
         with self.assertRaises(ValueError) as context:
@@ -246,6 +414,13 @@ class TestConfigManager(unittest.TestCase):
         expected = ["EURUSD=X", "GBPUSD=X", "USDJPY=X", "AUDCAD=X"]
         self.assertEqual(result, expected)
     
+    def test_clean_symbol_non_forex_formats(self):
+        """Test symbols that aren't six-letter pairs keep the fallback formatting."""
+        self.assertEqual(self.config_manager._clean_symbol(" btc-usd "), "BTC-USD")
+        self.assertEqual(self.config_manager._clean_symbol("gc=f"), "GC=F")
+        self.assertEqual(self.config_manager._clean_symbol("123456"), "123456=X")
+        self.assertEqual(self.config_manager._clean_symbol("eurusd=x\n"), "EURUSD=X")
+    
     @patch.object(ConfigManager, 'validate_symbols')
     @patch.object(ConfigManager, 'load_config')
     @patch.object(ConfigManager, 'save_config')
@@ -277,6 +452,18 @@ class TestConfigManager(unittest.TestCase):
         self.assertEqual(result.ema_length, 20)
         self.assertEqual(result.update_frequency, 60)  # Unchanged
     
+    @patch.object(ConfigManager, 'load_config')
+    @patch.object(ConfigManager, 'save_config')
+    def test_update_config_no_changes_skips_save(self, mock_save, mock_load):
+        """Test updating configuration with unchanged values does not save."""
+        current_config = Config(symbols=["EURUSD=X"], ema_length=15)
+        mock_load.return_value = current_config
+        
+        result = self.config_manager.update_config(ema_length=15)
+        
+        mock_save.assert_not_called()
+        self.assertIs(result, current_config)
+    
     def test_get_config_path(self):
         """Test getting configuration file path."""
         path = self.config_manager.get_config_path()
@@ -311,7 +498,7 @@ class TestConfigManager(unittest.TestCase):
         self.assertEqual(result['symbols'], ['EURUSD=X'])
         self.assertEqual(result['ema_length'], 15)
     
-    def test_merge_with_defaults_complete_config(self):
+    def test_normalize_complete_config(self):
         """Test merging with defaults when config has all fields."""
         config_data = {
             'symbols': ['EURUSD=X', 'GBPUSD=X'],
@@ -322,24 +509,29 @@ class TestConfigManager(unittest.TestCase):
             'data_retention_hours': 48
         }
         
-        result = self.config_manager._merge_with_defaults(config_data)
+        result, _ = self.config_manager._normalize(config_data)
         
         # Should preserve all provided values
-        self.assertEqual(result['symbols'], ['EURUSD=X', 'GBPUSD=X'])
-        self.assertEqual(result['ema_length'], 20)
-        self.assertEqual(result['update_frequency'], 30)
-        self.assertEqual(result['notification_methods'], ['email'])
-        self.assertEqual(result['email_config'], {'smtp_server': 'smtp.gmail.com'})
-        self.assertEqual(result['data_retention_hours'], 48)
-    
-    def test_merge_with_defaults_partial_config(self):
+        self.assertEqual(result, config_data)
+    
+    def test_normalize_complete_config_skips_defaults(self):
+        """Test a config with every field doesn't build the defaults."""
+        config_data = self.config_manager.get_default_config().to_dict()
+        
+        with patch.object(self.config_manager, '_default_fields') as mock_defaults:
+            result, _ = self.config_manager._normalize(config_data)
+        
+        mock_defaults.assert_not_called()
+        self.assertEqual(result, config_data)
+    
+    def test_normalize_partial_config(self):
         """Test merging with defaults when config has only some fields."""
         config_data = {
             'symbols': ['EURUSD=X'],
             'ema_length': 25
         }
         
-        result = self.config_manager._merge_with_defaults(config_data)
+        result, _ = self.config_manager._normalize(config_data)
         
         # Should use provided values
         self.assertEqual(result['symbols'], ['EURUSD=X'])
@@ -351,11 +543,11 @@ class TestConfigManager(unittest.TestCase):
         self.assertIsNone(result['email_config'])
         self.assertEqual(result['data_retention_hours'], 24)
     
-    def test_merge_with_defaults_empty_config(self):
+    def test_normalize_empty_config(self):
         """Test merging with defaults when config is empty."""
         config_data = {}
         
-        result = self.config_manager._merge_with_defaults(config_data)
+        result, _ = self.config_manager._normalize(config_data)
         
         # Should use all default values
         default_config = self.config_manager.get_default_config()
@@ -364,6 +556,41 @@ class TestConfigManager(unittest.TestCase):
         for key, value in default_dict.items():
             self.assertEqual(result[key], value)
     
+    def test_get_default_config_returns_independent_copies(self):
+        """Test mutating one default config doesn't affect later calls."""
+        first = self.config_manager.get_default_config()
+        first.symbols.append('EURUSD=X')
+        first.notification_methods.append('email')
+        
+        second = ConfigManager(str(self.test_config_path)).get_default_config()
+        
+        self.assertIsNot(first, second)
+        self.assertEqual(second.symbols, [])
+        self.assertEqual(second.notification_methods, ['console'])
+    
+    def test_normalize_does_not_share_default_template(self):
+        """Test defaults filled in by normalizing are copies of the template."""
+        result, _ = self.config_manager._normalize({})
+        result['notification_methods'].append('email')
+        result['symbols'].append('EURUSD=X')
+        
+        self.assertEqual(ConfigManager.DEFAULT_CONFIG_DATA['notification_methods'], ['console'])
+        self.assertEqual(ConfigManager.DEFAULT_CONFIG_DATA['symbols'], [])
+    
+    def test_normalize_splits_metadata(self):
+        """Test normalizing separates metadata from config fields."""
+        config_data = {
+            'symbols': ['EURUSD=X'],
+            '_version': '1.0',
+            '_created': '2024-01-01T00:00:00'
+        }
+        
+        fields, metadata = self.config_manager._normalize(config_data)
+        
+        self.assertNotIn('_version', fields)
+        self.assertEqual(metadata, {'_version': '1.0', '_created': '2024-01-01T00:00:00'})
+        self.assertEqual(fields['symbols'], ['EURUSD=X'])
+    
     def test_load_config_with_migration_and_merge(self):
         """Test complete load_config flow with migration and merging."""
         # Create config file with partial data and no version
@@ -397,7 +624,7 @@ class TestConfigManager(unittest.TestCase):
         self.assertEqual(saved_data['_version'], '1.0')
         self.assertEqual(saved_data['update_frequency'], 60)
         self.assertEqual(saved_data['notification_methods'], ['console'])
-
+    
     def test_save_config_with_metadata(self):
         """Test saving configuration includes metadata."""
         test_config = Config(
@@ -416,14 +643,14 @@ class TestConfigManager(unittest.TestCase):
         self.assertIn('_updated', saved_data)
         self.assertEqual(saved_data['_version'], '1.0')
     
-    def test_merge_with_defaults(self):
+    def test_normalize_merges_defaults(self):
         """Test merging configuration with defaults."""
         partial_config = {
             'symbols': ['EURUSD=X'],
             'ema_length': 25
         }
         
-        merged = self.config_manager._merge_with_defaults(partial_config)
+        merged, _ = self.config_manager._normalize(partial_config)
         
         # Should have all default fields
         self.assertEqual(merged['symbols'], ['EURUSD=X'])
@@ -536,6 +763,18 @@ class TestConfigManager(unittest.TestCase):
         
         self.assertEqual(backup_data['symbols'], ['EURUSD=X'])
     
+    def test_backup_config_unaffected_by_in_place_edits(self):
+        """Test editing the config file in place leaves the backup untouched."""
+        self.config_manager.save_config(Config(symbols=['EURUSD=X']))
+        backup_path = self.config_manager.backup_config("edit")
+        
+        # Rewrite the live file in place, as an editor would
+        with open(self.test_config_path, 'w') as f:
+            json.dump(Config(symbols=['GBPUSD=X']).to_dict(), f)
+        
+        with open(backup_path, 'r') as f:
+            self.assertEqual(json.load(f)['symbols'], ['EURUSD=X'])
+    
     def test_backup_config_no_file(self):
         """Test backup when config file doesn't exist."""
         with self.assertRaises(FileNotFoundError):
@@ -553,6 +792,11 @@ class TestConfigManager(unittest.TestCase):
         self.assertTrue(backup_path.exists())
         self.assertIn("backup_", backup_path.name)
         
+        # Suffix is a nanosecond timestamp token
+        suffix = backup_path.name.split(".backup_")[1].rsplit(".json", 1)[0]
+        self.assertTrue(suffix.isdigit())
+        self.assertEqual(len(suffix), 20)
+        
         # Clean up
         backup_path.unlink()
     
@@ -565,6 +809,18 @@ class TestConfigManager(unittest.TestCase):
         parsed = datetime.fromisoformat(timestamp)
         self.assertIsInstance(parsed, datetime)
     
+    def test_load_config_ignores_unknown_fields(self):
+        """Test keys that aren't Config fields are skipped when loading."""
+        config_data = Config(symbols=['EURUSD=X']).to_dict()
+        config_data.update({'_version': '1.0', 'legacy_option': True})
+        
+        with open(self.test_config_path, 'w') as f:
+            json.dump(config_data, f)
+        
+        config = self.config_manager.load_config()
+        
+        self.assertEqual(config, Config(symbols=['EURUSD=X']))
+    
     def test_load_config_with_partial_data(self):
         """Test loading config with missing fields gets defaults."""
         # Write partial config
@@ -5,10 +5,12 @@ Unit tests for DataFetcher class.
 import pytest
 import pandas as pd
 from unittest.mock import Mock, patch, MagicMock
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
+import os
 import time
 
-from forex_alerts.services.data_fetcher import DataFetcher
+from forex_alerts.services.data_fetcher import DataFetcher, PARQUET_AVAILABLE
+from forex_alerts.utils.symbols import clear_symbol_cache
 
 
 class TestDataFetcher:
@@ -18,6 +20,7 @@ class TestDataFetcher:
         """Set up test fixtures."""
         self.symbols = ["EURUSD", "GBPUSD"]
         self.data_fetcher = DataFetcher(self.symbols, interval="1m")
+        clear_symbol_cache()
         
         # Create mock data
         self.mock_data = pd.DataFrame({
@@ -46,7 +49,7 @@ class TestDataFetcher:
         # Test other symbols
         assert self.data_fetcher._format_forex_symbol("GBPJPY") == "GBPJPY=X"
     
-    @patch('forex_alerts.services.data_fetcher.yf.Ticker')
+    @patch('yfinance.Ticker')
     def test_validate_symbol_success(self, mock_ticker):
         """Test successful symbol validation."""
         # Mock ticker with valid data
@@ -60,7 +63,7 @@ class TestDataFetcher:
         mock_ticker.assert_called_once_with("EURUSD=X")
         mock_ticker_instance.history.assert_called_once_with(period="1d", interval="1d")
     
-    @patch('forex_alerts.services.data_fetcher.yf.Ticker')
+    @patch('yfinance.Ticker')
     def test_validate_symbol_empty_data(self, mock_ticker):
         """Test symbol validation with empty data."""
         # Mock ticker with empty data
@@ -72,7 +75,7 @@ class TestDataFetcher:
         
         assert result is False
     
-    @patch('forex_alerts.services.data_fetcher.yf.Ticker')
+    @patch('yfinance.Ticker')
     def test_validate_symbol_exception(self, mock_ticker):
         """Test symbol validation with exception."""
         # Mock ticker that raises exception
@@ -82,69 +85,133 @@ class TestDataFetcher:
         
         assert result is False
     
-    @patch('forex_alerts.services.data_fetcher.yf.Ticker')
-    def test_get_forex_data_success(self, mock_ticker):
+    @patch.object(DataFetcher, '_fetch_chart')
+    def test_get_forex_data_success(self, mock_fetch_chart):
         """Test successful forex data retrieval."""
-        # Mock ticker with valid data
-        mock_ticker_instance = Mock()
-        mock_ticker_instance.history.return_value = self.mock_data
-        mock_ticker.return_value = mock_ticker_instance
+        mock_fetch_chart.return_value = self.mock_data
         
         result = self.data_fetcher.get_forex_data("EURUSD", period="1d")
         
         assert result is not None
         assert 'Symbol' in result.columns
         assert result['Symbol'].iloc[0] == "EURUSD"
-        mock_ticker.assert_called_once_with("EURUSD=X")
-        mock_ticker_instance.history.assert_called_once_with(period="1d", interval="1m")
+        mock_fetch_chart.assert_called_once_with("EURUSD=X", "1d")
     
-    @patch('forex_alerts.services.data_fetcher.yf.Ticker')
-    def test_get_forex_data_empty_response(self, mock_ticker):
+    @patch.object(DataFetcher, '_fetch_chart')
+    def test_get_forex_data_empty_response(self, mock_fetch_chart):
         """Test forex data retrieval with empty response."""
-        # Mock ticker with empty data
-        mock_ticker_instance = Mock()
-        mock_ticker_instance.history.return_value = pd.DataFrame()
-        mock_ticker.return_value = mock_ticker_instance
+        mock_fetch_chart.return_value = pd.DataFrame()
         
         result = self.data_fetcher.get_forex_data("EURUSD")
         
         assert result is None
     
-    @patch('forex_alerts.services.data_fetcher.yf.Ticker')
+    @patch.object(DataFetcher, '_fetch_chart')
     @patch('time.sleep')
-    def test_get_forex_data_retry_logic(self, mock_sleep, mock_ticker):
+    def test_get_forex_data_retry_logic(self, mock_sleep, mock_fetch_chart):
         """Test retry logic with exponential backoff."""
-        # Mock ticker that fails first two attempts, succeeds on third
-        mock_ticker_instance = Mock()
-        mock_ticker_instance.history.side_effect = [
+        # Fail first two attempts, succeed on third
+        mock_fetch_chart.side_effect = [
             Exception("Network error"),
             Exception("API error"),
             self.mock_data
         ]
-        mock_ticker.return_value = mock_ticker_instance
         
         result = self.data_fetcher.get_forex_data("EURUSD")
         
         assert result is not None
         assert 'Symbol' in result.columns
-        assert mock_ticker_instance.history.call_count == 3
+        assert mock_fetch_chart.call_count == 3
         assert mock_sleep.call_count == 2  # Two retries before success
     
-    @patch('forex_alerts.services.data_fetcher.yf.Ticker')
+    @patch.object(DataFetcher, '_fetch_chart')
     @patch('time.sleep')
-    def test_get_forex_data_max_retries_exceeded(self, mock_sleep, mock_ticker):
+    def test_get_forex_data_max_retries_exceeded(self, mock_sleep, mock_fetch_chart):
         """Test behavior when max retries are exceeded."""
-        # Mock ticker that always fails
-        mock_ticker_instance = Mock()
-        mock_ticker_instance.history.side_effect = Exception("Persistent error")
-        mock_ticker.return_value = mock_ticker_instance
+        mock_fetch_chart.side_effect = Exception("Persistent error")
         
         result = self.data_fetcher.get_forex_data("EURUSD")
         
         assert result is None
-        assert mock_ticker_instance.history.call_count == 5  # Max retries
+        assert mock_fetch_chart.call_count == 5  # Max retries
         assert mock_sleep.call_count == 4  # One less than max retries
     
+    def test_fetch_chart_parses_response(self):
+        """Test chart endpoint JSON is converted to an OHLCV DataFrame."""
+        response = Mock()
+        response.json.return_value = {'chart': {'error': None, 'result': [{
+            'meta': {'exchangeTimezoneName': 'Europe/London'},
+            'timestamp': [1704103200, 1704103260, 1704103320],
+            'indicators': {'quote': [{
+                'open': [1.08, None, 1.081],
+                'high': [1.0815, None, 1.0825],
+                'low': [1.0795, None, 1.0805],
+                'close': [1.0805, None, 1.0815],
+                'volume': [0, None, 0]
+            }]}
+        }]}}
+        
+        with patch.object(self.data_fetcher._session, 'get', return_value=response) as mock_get:
+            result = self.data_fetcher._fetch_chart("EURUSD=X", "1d")
+        
+        assert list(result.columns) == ['Open', 'High', 'Low', 'Close', 'Volume']
+        assert len(result) == 2  # Null bar dropped
+        assert result['Close'].iloc[-1] == 1.0815
+        assert str(result.index.tz) == 'Europe/London'
+        assert mock_get.call_args[1]['params'] == {'range': '1d', 'interval': '1m'}
+    
+    def test_fetch_chart_error(self):
+        """Test chart endpoint errors are raised."""
+        response = Mock()
+        response.json.return_value = {'chart': {'error': {'code': 'Not Found'}, 'result': None}}
+        
+        with patch.object(self.data_fetcher._session, 'get', return_value=response):
+            with pytest.raises(ValueError, match="Chart request failed"):
+                self.data_fetcher._fetch_chart("INVALID=X", "1d")
+    
+    @pytest.mark.skipif(not PARQUET_AVAILABLE, reason="pyarrow not installed")
+    @patch.object(DataFetcher, '_fetch_chart')
+    def test_get_forex_data_uses_parquet_cache(self, mock_fetch_chart, tmp_path):
+        """Test fresh cached data is served without another fetch."""
+        mock_fetch_chart.return_value = self.mock_data.copy()
+        fetcher = DataFetcher(self.symbols, interval="1m", cache_dir=str(tmp_path))
+        
+        first = fetcher.get_forex_data("EURUSD")
+        second = fetcher.get_forex_data("EURUSD")
+        
+        assert mock_fetch_chart.call_count == 1
+        assert len(list(tmp_path.glob("EURUSD=X_1m_1d_*.parquet"))) == 1
+        pd.testing.assert_frame_equal(first, second, check_freq=False)
+    
+    @patch.object(DataFetcher, '_fetch_chart')
+    def test_get_forex_data_stale_cache_refetches(self, mock_fetch_chart, tmp_path):
+        """Test stale cached data triggers a new fetch."""
+        mock_fetch_chart.side_effect = lambda *args: self.mock_data.copy()
+        fetcher = DataFetcher(self.symbols, interval="1m", cache_dir=str(tmp_path), cache_ttl=0)
+        
+        fetcher.get_forex_data("EURUSD")
+        fetcher.get_forex_data("EURUSD")
+        
+        assert mock_fetch_chart.call_count == 2
+    
+    def test_cache_prunes_old_files(self, tmp_path):
+        """Test cache files older than CACHE_MAX_AGE are deleted on startup."""
+        old_file = tmp_path / "EURUSD=X_1m_1d_2024-01-01.parquet"
+        fresh_file = tmp_path / f"EURUSD=X_1m_1d_{date.today().isoformat()}.parquet"
+        unrelated_file = tmp_path / "notes.txt"
+        for path in (old_file, fresh_file, unrelated_file):
+            path.write_bytes(b"")
+        stale = time.time() - DataFetcher.CACHE_MAX_AGE - 60
+        os.utime(old_file, (stale, stale))
+        os.utime(unrelated_file, (stale, stale))
+        
+        with patch('forex_alerts.services.data_fetcher.PARQUET_AVAILABLE', True):
+            DataFetcher(self.symbols, cache_dir=str(tmp_path))
+        
+        assert not old_file.exists()
+        assert fresh_file.exists()
+        assert unrelated_file.exists()
+    
     def test_calculate_backoff_delay(self):
         """Test exponential backoff delay calculation."""
         # Test increasing delays
@@ -161,8 +228,9 @@ class TestDataFetcher:
         delay_large = self.data_fetcher._calculate_backoff_delay(10)
         assert delay_large <= 72.0  # 60 + 20% jitter
     
+    @patch.object(DataFetcher, '_download_batch', return_value=None)
     @patch.object(DataFetcher, 'get_forex_data')
-    def test_fetch_latest_data_success(self, mock_get_forex_data):
+    def test_fetch_latest_data_success(self, mock_get_forex_data, mock_download_batch):
         """Test successful fetching of latest data for all symbols."""
         # Mock successful data retrieval
         mock_get_forex_data.side_effect = [self.mock_data, self.mock_data]
@@ -174,8 +242,9 @@ class TestDataFetcher:
         assert "GBPUSD" in result
         assert mock_get_forex_data.call_count == 2
     
+    @patch.object(DataFetcher, '_download_batch', return_value=None)
     @patch.object(DataFetcher, 'get_forex_data')
-    def test_fetch_latest_data_partial_failure(self, mock_get_forex_data):
+    def test_fetch_latest_data_partial_failure(self, mock_get_forex_data, mock_download_batch):
         """Test fetching data when some symbols fail."""
         # Mock mixed success/failure
         mock_get_forex_data.side_effect = [self.mock_data, None]
@@ -186,9 +255,117 @@ class TestDataFetcher:
         assert "EURUSD" in result
         assert "GBPUSD" not in result
     
+    @patch('yfinance.download')
+    def test_fetch_latest_data_uses_batched_download(self, mock_download):
+        """Test several symbols are fetched through one batched download."""
+        mock_download.return_value = pd.concat(
+            {"EURUSD=X": self.mock_data, "GBPUSD=X": self.mock_data}, axis=1
+        )
+        
+        with patch.object(DataFetcher, 'get_forex_data') as mock_get_forex_data:
+            result = self.data_fetcher.fetch_latest_data()
+        
+        assert set(result) == {"EURUSD", "GBPUSD"}
+        mock_download.assert_called_once()
+        mock_get_forex_data.assert_not_called()
+    
+    @patch('yfinance.download')
+    def test_fetch_latest_data_single_symbol_skips_batch(self, mock_download):
+        """Test a single symbol is fetched directly without a batched download."""
+        fetcher = DataFetcher(["EURUSD"])
+        
+        with patch.object(fetcher, 'get_forex_data', return_value=self.mock_data) as mock_get_forex_data:
+            result = fetcher.fetch_latest_data()
+        
+        assert set(result) == {"EURUSD"}
+        mock_get_forex_data.assert_called_once_with("EURUSD", period="1d")
+        mock_download.assert_not_called()
+    
+    @patch('yfinance.download')
+    def test_fetch_latest_data_batched_success(self, mock_download):
+        """Test batched fetching slices per-symbol frames from one download."""
+        mock_download.return_value = pd.concat(
+            {"EURUSD=X": self.mock_data, "GBPUSD=X": self.mock_data}, axis=1
+        )
+        
+        result = self.data_fetcher.fetch_latest_data_batched()
+        
+        assert set(result) == {"EURUSD", "GBPUSD"}
+        assert result["EURUSD"]['Symbol'].iloc[0] == "EURUSD"
+        assert len(result["GBPUSD"]) == 3
+        mock_download.assert_called_once()
+        assert mock_download.call_args[1]['tickers'] == "EURUSD=X GBPUSD=X"
+        assert mock_download.call_args[1]['group_by'] == 'ticker'
+    
+    @patch.object(DataFetcher, 'get_forex_data')
+    @patch('yfinance.download')
+    def test_fetch_latest_data_batched_fallback(self, mock_download, mock_get_forex_data):
+        """Test symbols missing from the batch fall back to single fetches."""
+        mock_download.return_value = pd.concat({"EURUSD=X": self.mock_data}, axis=1)
+        mock_get_forex_data.return_value = self.mock_data
+        
+        result = self.data_fetcher.fetch_latest_data_batched()
+        
+        assert set(result) == {"EURUSD", "GBPUSD"}
+        mock_get_forex_data.assert_called_once_with("GBPUSD", period="1d")
+    
+    @pytest.mark.skipif(not PARQUET_AVAILABLE, reason="pyarrow not installed")
+    @patch('yfinance.download')
+    def test_fetch_latest_data_batched_uses_parquet_cache(self, mock_download, tmp_path):
+        """Test batched fetching caches downloaded frames and only downloads cache misses."""
+        fetcher = DataFetcher(self.symbols, interval="1m", cache_dir=str(tmp_path))
+        mock_download.return_value = pd.concat(
+            {"EURUSD=X": self.mock_data, "GBPUSD=X": self.mock_data}, axis=1
+        )
+        
+        first = fetcher.fetch_latest_data_batched()
+        
+        assert len(list(tmp_path.glob("*_1m_1d_*.parquet"))) == 2
+        next(tmp_path.glob("GBPUSD=X_1m_1d_*.parquet")).unlink()
+        mock_download.return_value = pd.concat({"GBPUSD=X": self.mock_data}, axis=1)
+        
+        second = fetcher.fetch_latest_data_batched()
+        
+        assert mock_download.call_count == 2
+        assert mock_download.call_args[1]['tickers'] == "GBPUSD=X"
+        assert set(second) == {"EURUSD", "GBPUSD"}
+        pd.testing.assert_frame_equal(first["EURUSD"], second["EURUSD"], check_freq=False)
+    
+    @patch('yfinance.download')
+    def test_fetch_latest_data_batched_chunks(self, mock_download):
+        """Test symbols are split into batches of at most 10."""
+        fetcher = DataFetcher([f"SYM{i:03d}" for i in range(12)])
+        mock_download.return_value = pd.DataFrame()
+        
+        with patch.object(fetcher, 'get_forex_data', return_value=None):
+            fetcher.fetch_latest_data_batched()
+        
+        assert mock_download.call_count == 2
+    
+    @patch('yfinance.Ticker')
+    def test_get_current_price_fast_info(self, mock_ticker):
+        """Test current price comes from fast_info without fetching history."""
+        mock_ticker.return_value.fast_info = {'last_price': 1.0842}
+        
+        with patch.object(DataFetcher, 'get_forex_data') as mock_get_forex_data:
+            price = self.data_fetcher.get_current_price("EURUSD")
+        
+        assert price == 1.0842
+        mock_ticker.assert_called_once_with("EURUSD=X")
+        mock_get_forex_data.assert_not_called()
+    
+    @patch('yfinance.Ticker')
+    def test_get_current_price_fast_info_error(self, mock_ticker):
+        """Test current price returns None when fast_info fails."""
+        mock_ticker.side_effect = Exception("API Error")
+        
+        assert self.data_fetcher.get_current_price("EURUSD") is None
+    
+    @patch('yfinance.Ticker')
     @patch.object(DataFetcher, 'get_forex_data')
-    def test_get_current_price_success(self, mock_get_forex_data):
-        """Test successful current price retrieval."""
+    def test_get_current_price_success(self, mock_get_forex_data, mock_ticker):
+        """Test current price falls back to history when fast_info lacks it."""
+        mock_ticker.return_value.fast_info = {}
         mock_get_forex_data.return_value = self.mock_data
         
         price = self.data_fetcher.get_current_price("EURUSD")
@@ -196,18 +373,22 @@ class TestDataFetcher:
         assert price == 1.0815  # Last close price in mock data
         mock_get_forex_data.assert_called_once_with("EURUSD", period="1d")
     
+    @patch('yfinance.Ticker')
     @patch.object(DataFetcher, 'get_forex_data')
-    def test_get_current_price_no_data(self, mock_get_forex_data):
+    def test_get_current_price_no_data(self, mock_get_forex_data, mock_ticker):
         """Test current price retrieval with no data."""
+        mock_ticker.return_value.fast_info = {}
         mock_get_forex_data.return_value = None
         
         price = self.data_fetcher.get_current_price("EURUSD")
         
         assert price is None
     
+    @patch('yfinance.Ticker')
     @patch.object(DataFetcher, 'get_forex_data')
-    def test_get_current_price_empty_data(self, mock_get_forex_data):
+    def test_get_current_price_empty_data(self, mock_get_forex_data, mock_ticker):
         """Test current price retrieval with empty DataFrame."""
+        mock_ticker.return_value.fast_info = {}
         mock_get_forex_data.return_value = pd.DataFrame()
         
         price = self.data_fetcher.get_current_price("EURUSD")
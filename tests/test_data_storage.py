@@ -3,6 +3,7 @@ Unit tests for DataStorage class.
 """
 
 import pytest
+import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
 from unittest.mock import patch, Mock
@@ -52,7 +53,8 @@ class TestDataStorage:
         assert self.data_storage.has_data("EURUSD")
         stored_data = self.data_storage.get_historical_data("EURUSD")
         assert len(stored_data) == 3
-        pd.testing.assert_frame_equal(stored_data, self.mock_data)
+        # Frames are rebuilt from column arrays, so the index carries no freq
+        pd.testing.assert_frame_equal(stored_data, self.mock_data, check_freq=False)
     
     def test_store_data_merge_existing(self):
         """Test merging data with existing symbol data."""
@@ -102,6 +104,156 @@ class TestDataStorage:
         assert stored_data.loc['2024-01-01 10:01:00', 'Open'] == 1.0801  # Updated value
         assert stored_data.loc['2024-01-01 10:02:00', 'Open'] == 1.0806  # Updated value
     
+    def test_store_data_out_of_order(self):
+        """Test that out-of-order batches are merged into sorted order."""
+        self.data_storage.store_data("EURUSD", self.mock_data.iloc[[2, 0]])
+        self.data_storage.store_data("EURUSD", self.mock_data.iloc[[1]])
+        
+        stored_data = self.data_storage.get_historical_data("EURUSD")
+        pd.testing.assert_frame_equal(stored_data, self.mock_data, check_freq=False)
+    
+    def test_store_data_grows_past_initial_capacity(self):
+        """Test that appends beyond the preallocated capacity keep every bar."""
+        storage = DataStorage(retention_hours=1)
+        count = DataStorage.MIN_CAPACITY * 3
+        index = pd.date_range('2024-01-01', periods=count, freq='1min')
+        data = pd.DataFrame({
+            'Open': 1.08, 'High': 1.081, 'Low': 1.079, 'Close': 1.0805, 'Volume': 100
+        }, index=index)
+        
+        for start in range(0, count, 7):
+            storage.store_data("EURUSD", data.iloc[start:start + 7])
+        
+        stored_data = storage.get_historical_data("EURUSD", periods=count)
+        assert len(stored_data) == count
+        assert (stored_data.index == index).all()
+        
+        # Capacity grows in powers of two with at least half of it free
+        capacity = storage._buffers["EURUSD"].capacity
+        assert capacity & (capacity - 1) == 0
+        assert capacity >= 2 * count
+    
+    def test_small_history_uses_small_buffer(self):
+        """Test that buffers are sized by stored bars, not the retention window."""
+        storage = DataStorage(retention_hours=24)
+        storage.store_data("EURUSD", self.mock_data)
+        
+        assert storage._buffers["EURUSD"].capacity == DataStorage.MIN_CAPACITY
+    
+    def test_large_first_batch_capacity_is_power_of_two(self):
+        """Test that a large first batch still gets a power-of-two buffer."""
+        index = pd.date_range('2024-01-01', periods=100, freq='1min')
+        data = pd.DataFrame({
+            'Open': 1.08, 'High': 1.081, 'Low': 1.079, 'Close': 1.0805, 'Volume': 100
+        }, index=index)
+        
+        self.data_storage.store_data("EURUSD", data)
+        
+        assert self.data_storage._buffers["EURUSD"].capacity == 256
+    
+    def test_store_data_preserves_timezone(self):
+        """Test that timezone-aware indexes round-trip unchanged."""
+        data = self.mock_data.tz_localize('Europe/London')
+        data.index.name = 'Datetime'
+        self.data_storage.store_data("EURUSD", data)
+        
+        stored_data = self.data_storage.get_historical_data("EURUSD")
+        pd.testing.assert_frame_equal(stored_data, data, check_freq=False)
+        assert self.data_storage.get_latest_data_point("EURUSD").timestamp == data.index[-1]
+    
+    def test_store_data_interleaved_merge(self):
+        """Test merging a batch that both overwrites and inserts between bars."""
+        self.data_storage.store_data("EURUSD", self.old_data)
+        self.data_storage.store_data("EURUSD", self.mock_data.iloc[[0, 2]])
+        
+        # 08:00 replaces a stored bar, 09:00 and 10:01 fall between stored bars,
+        # 10:05 is appended past the end; 10:01 appears twice and the last wins
+        index = pd.to_datetime([
+            '2024-01-01 10:05:00', '2024-01-01 08:00:00', '2024-01-01 10:01:00',
+            '2024-01-01 09:00:00', '2024-01-01 10:01:00'
+        ])
+        batch = pd.DataFrame({
+            'Open': [1.5, 1.1, 1.2, 1.3, 1.4],
+            'High': [1.6, 1.2, 1.3, 1.4, 1.5],
+            'Low': [1.4, 1.0, 1.1, 1.2, 1.3],
+            'Close': [1.5, 1.1, 1.2, 1.3, 1.4],
+            'Volume': [5, 1, 2, 3, 4]
+        }, index=index)
+        self.data_storage.store_data("EURUSD", batch)
+        
+        stored_data = self.data_storage.get_historical_data("EURUSD")
+        assert list(stored_data.index.strftime('%H:%M')) == [
+            '08:00', '08:01', '09:00', '10:00', '10:01', '10:02', '10:05'
+        ]
+        assert list(stored_data['Open']) == [1.1, 1.0705, 1.3, 1.0800, 1.4, 1.0810, 1.5]
+        assert list(stored_data['Volume']) == [1, 900, 3, 1000, 4, 1200, 5]
+        assert self.data_storage.get_latest_price("EURUSD") == 1.5
+    
+    def test_published_snapshot_is_not_rewritten(self):
+        """Test that a merge never modifies rows a reader may still hold."""
+        self.data_storage.store_data("EURUSD", self.mock_data)
+        assert self.data_storage.has_data("EURUSD")
+        snapshot = self.data_storage._storage["EURUSD"]
+        
+        overlapping_data = self.mock_data.copy()
+        overlapping_data['Open'] += 0.001
+        self.data_storage.store_data("EURUSD", overlapping_data)
+        
+        assert list(snapshot.open) == list(self.mock_data['Open'])
+        assert self.data_storage.get_historical_data("EURUSD")['Open'].iloc[0] == 1.0810
+    
+    def test_compact_storage(self):
+        """Test float32/int32 storage keeps forex prices within tolerance."""
+        storage = DataStorage(compact=True)
+        storage.store_data("EURUSD", self.mock_data)
+        
+        stored_data = storage.get_historical_data("EURUSD")
+        assert stored_data['Close'].dtype == np.float32
+        assert stored_data['Volume'].dtype == np.int32
+        np.testing.assert_allclose(stored_data['Close'], self.mock_data['Close'], atol=1e-6)
+        
+        latest = storage.get_latest_data_point("EURUSD")
+        assert isinstance(latest.close, float)
+        assert isinstance(latest.volume, int)
+        assert abs(latest.close - 1.0815) < 1e-6
+    
+    def test_compact_storage_rejects_imprecise_prices(self):
+        """Test that compact mode refuses prices float32 cannot represent."""
+        storage = DataStorage(compact=True)
+        data = self.mock_data * 60000.123
+        
+        with pytest.raises(ValueError, match="float32 precision"):
+            storage.store_data("BTCUSD", data)
+        assert not storage.has_data("BTCUSD")
+    
+    def test_store_data_missing_columns(self):
+        """Test that data without OHLCV columns is rejected."""
+        with pytest.raises(ValueError, match="Missing required columns"):
+            self.data_storage.store_data("EURUSD", self.mock_data.drop(columns=['Volume']))
+    
+    def test_store_data_queues_until_read(self):
+        """Test that batches are merged lazily on the next read."""
+        self.data_storage.store_data("EURUSD", self.mock_data.iloc[[1]])
+        self.data_storage.store_data("EURUSD", self.mock_data.iloc[[0]])
+        self.data_storage.store_data("EURUSD", self.mock_data.iloc[[2]])
+        assert "EURUSD" not in self.data_storage._storage
+        
+        stored_data = self.data_storage.get_historical_data("EURUSD")
+        pd.testing.assert_frame_equal(stored_data, self.mock_data, check_freq=False)
+        assert not self.data_storage._pending["EURUSD"]
+    
+    def test_store_data_flushes_full_queue(self):
+        """Test that a full queue is merged without waiting for a reader."""
+        index = pd.date_range('2024-01-01', periods=DataStorage.PENDING_FLUSH_SIZE, freq='1min')
+        data = pd.DataFrame({
+            'Open': 1.08, 'High': 1.081, 'Low': 1.079, 'Close': 1.0805, 'Volume': 100
+        }, index=index)
+        
+        for i in range(len(data)):
+            self.data_storage.store_data("EURUSD", data.iloc[[i]])
+        
+        assert len(self.data_storage._storage["EURUSD"]) == len(data)
+    
     def test_store_empty_data(self):
         """Test storing empty DataFrame."""
         empty_data = pd.DataFrame()
@@ -135,6 +287,38 @@ class TestDataStorage:
         expected_start = extended_data.index[-5]
         assert result.index[0] == expected_start
     
+    def test_get_historical_data_returns_read_only_view(self):
+        """Test that returned frames share storage and reject in-place writes."""
+        self.data_storage.store_data("EURUSD", self.mock_data)
+        
+        result = self.data_storage.get_historical_data("EURUSD")
+        snapshot = self.data_storage._storage["EURUSD"]
+        assert np.shares_memory(result['Close'].to_numpy(), snapshot.close)
+        
+        with pytest.raises(ValueError):
+            result.iloc[0, 0] = 2.0
+        
+        # An explicit copy is writable and leaves storage untouched
+        modified = result.copy()
+        modified.iloc[0, 0] = 2.0
+        assert self.data_storage.get_historical_data("EURUSD")['Open'].iloc[0] == 1.0800
+    
+    def test_get_price_matrix(self):
+        """Test gathering several symbols' closes into one array."""
+        self.data_storage.store_data("EURUSD", self.mock_data)
+        self.data_storage.store_data("GBPUSD", self.mock_data.iloc[1:])
+        
+        matrix = self.data_storage.get_price_matrix(["EURUSD", "GBPUSD", "USDJPY"], periods=3)
+        
+        assert matrix.shape == (3, 3)
+        assert list(matrix[:, 0]) == [1.0805, 1.0810, 1.0815]
+        assert np.isnan(matrix[0, 1])
+        assert list(matrix[1:, 1]) == [1.0810, 1.0815]
+        assert np.isnan(matrix[:, 2]).all()
+        
+        with pytest.raises(ValueError, match="Invalid price column"):
+            self.data_storage.get_price_matrix(["EURUSD"], column='Volume')
+    
     def test_get_latest_price(self):
         """Test getting latest price."""
         self.data_storage.store_data("EURUSD", self.mock_data)
@@ -159,6 +343,23 @@ class TestDataStorage:
         assert latest_data.volume == 1200
         assert latest_data.timestamp == self.mock_data.index[-1]
     
+    def test_latest_cache_tracks_merges_and_clears(self):
+        """Test that the cached latest bar follows updates and clears."""
+        self.data_storage.store_data("EURUSD", self.mock_data)
+        
+        # An overlapping update of the last bar replaces the cached values
+        update = self.mock_data.iloc[[-1]].copy()
+        update['Close'] = 1.0820
+        update['High'] = 1.0830
+        self.data_storage.store_data("EURUSD", update)
+        assert self.data_storage.get_latest_price("EURUSD") == 1.0820
+        assert self.data_storage.get_latest_data_point("EURUSD").high == 1.0830
+        
+        self.data_storage.clear_symbol_data("EURUSD")
+        assert self.data_storage.get_latest_price("EURUSD") is None
+        assert self.data_storage.get_latest_data_point("EURUSD") is None
+        assert self.data_storage.get_data_age("EURUSD") is None
+    
     def test_get_latest_data_point_not_found(self):
         """Test getting latest data point for non-existent symbol."""
         result = self.data_storage.get_latest_data_point("NONEXISTENT")
@@ -177,6 +378,22 @@ class TestDataStorage:
         assert len(result) == 1
         assert result.index[0] == pd.Timestamp('2024-01-01 10:01:00')
     
+    def test_get_data_range_boundaries(self):
+        """Test that range bounds are inclusive and empty ranges return None."""
+        self.data_storage.store_data("EURUSD", self.mock_data)
+        
+        result = self.data_storage.get_data_range(
+            "EURUSD", datetime(2024, 1, 1, 10, 1), datetime(2024, 1, 1, 10, 2)
+        )
+        assert list(result.index) == list(self.mock_data.index[1:])
+        
+        assert self.data_storage.get_data_range(
+            "EURUSD", datetime(2024, 1, 1, 10, 2, 1), datetime(2024, 1, 1, 11, 0)
+        ) is None
+        assert self.data_storage.get_data_range(
+            "EURUSD", datetime(2024, 1, 1, 10, 2), datetime(2024, 1, 1, 10, 1)
+        ) is None
+    
     def test_get_data_range_not_found(self):
         """Test getting data range for non-existent symbol."""
         start_time = datetime(2024, 1, 1, 10, 0, 0)
@@ -224,6 +441,25 @@ class TestDataStorage:
         assert len(remaining_data) == 1
         assert remaining_data.index[0] == recent_time
     
+    def test_cleanup_timezone_aware_data(self):
+        """Test that cleanup compares aware timestamps in absolute time."""
+        storage = DataStorage(retention_hours=1)
+        now = pd.Timestamp.now(tz='UTC').floor('min')
+        data = pd.DataFrame({
+            'Open': [1.07, 1.08],
+            'High': [1.08, 1.09],
+            'Low': [1.06, 1.07],
+            'Close': [1.075, 1.085],
+            'Volume': [800, 900]
+        }, index=pd.DatetimeIndex([now - timedelta(hours=2), now - timedelta(minutes=30)]).tz_convert('Asia/Tokyo'))
+        
+        storage.store_data("EURUSD", data)
+        storage.cleanup_old_data()
+        
+        remaining_data = storage.get_historical_data("EURUSD")
+        assert len(remaining_data) == 1
+        assert remaining_data.index[0] == data.index[1]
+    
     def test_cleanup_removes_empty_symbols(self):
         """Test that cleanup removes symbols with no recent data."""
         storage = DataStorage(retention_hours=1)
@@ -247,20 +483,54 @@ class TestDataStorage:
         # Verify symbol is removed
         assert not storage.has_data("EURUSD")
     
-    @patch('forex_alerts.services.data_storage.datetime')
-    def test_maybe_cleanup_triggers(self, mock_datetime):
+    def test_cleanup_many_symbols(self):
+        """Test that cleanup trims every symbol when run across workers."""
+        storage = DataStorage(retention_hours=1)
+        old_time = datetime.now() - timedelta(hours=2)
+        recent_time = datetime.now() - timedelta(minutes=30)
+        data = pd.DataFrame({
+            'Open': [1.07, 1.08],
+            'High': [1.08, 1.09],
+            'Low': [1.06, 1.07],
+            'Close': [1.075, 1.085],
+            'Volume': [800, 900]
+        }, index=[old_time, recent_time])
+        
+        symbols = [f"SYMBOL{i}" for i in range(10)]
+        for symbol in symbols:
+            storage.store_data(symbol, data)
+        storage.store_data("STALE", data.iloc[:1])
+        
+        storage.get_storage_stats()  # merge queued batches first
+        with patch.object(storage.logger, 'isEnabledFor', return_value=True), \
+                patch.object(storage.logger, 'debug') as mock_debug:
+            storage.cleanup_old_data()
+        
+        # One summary line covers every symbol
+        mock_debug.assert_called_once()
+        assert "SYMBOL9 (1)" in mock_debug.call_args[0][0]
+        assert "STALE" in mock_debug.call_args[0][0]
+        assert not storage.has_data("STALE")
+        for symbol in symbols:
+            remaining_data = storage.get_historical_data(symbol)
+            assert len(remaining_data) == 1
+            assert remaining_data.index[0] == recent_time
+    
+    def test_maybe_cleanup_triggers(self):
         """Test that _maybe_cleanup triggers when interval has passed."""
-        # Mock current time
-        current_time = datetime(2024, 1, 1, 12, 0, 0)
-        mock_datetime.now.return_value = current_time
-        
-        # Set last cleanup to more than an hour ago
-        self.data_storage._last_cleanup = current_time - timedelta(hours=2)
+        # Set last cleanup to more than an hour ago on the monotonic clock
+        self.data_storage._last_cleanup_ns = time.monotonic_ns() - 2 * 3600 * 10**9
         
         with patch.object(self.data_storage, 'cleanup_old_data') as mock_cleanup:
             self.data_storage._maybe_cleanup()
             mock_cleanup.assert_called_once()
     
+    def test_maybe_cleanup_skips_within_interval(self):
+        """Test that _maybe_cleanup does nothing before the interval passes."""
+        with patch.object(self.data_storage, 'cleanup_old_data') as mock_cleanup:
+            self.data_storage._maybe_cleanup()
+            mock_cleanup.assert_not_called()
+    
     def test_get_storage_stats(self):
         """Test getting storage statistics."""
         self.data_storage.store_data("EURUSD", self.mock_data)
@@ -278,6 +548,18 @@ class TestDataStorage:
         assert stats['symbol_details']['EURUSD']['records'] == 3
         assert stats['symbol_details']['EURUSD']['latest_price'] == 1.0815
     
+    def test_get_storage_stats_refreshes_after_write(self):
+        """Test that cached per-symbol stats follow new data."""
+        self.data_storage.store_data("EURUSD", self.mock_data.iloc[:2])
+        first = self.data_storage.get_storage_stats()
+        assert first['symbol_details']['EURUSD']['records'] == 2
+        
+        self.data_storage.store_data("EURUSD", self.mock_data.iloc[2:])
+        second = self.data_storage.get_storage_stats()
+        assert second['symbol_details']['EURUSD']['records'] == 3
+        assert second['symbol_details']['EURUSD']['latest_price'] == 1.0815
+        assert second['symbol_details']['EURUSD']['newest_record'] == '2024-01-01T10:02:00'
+    
     def test_clear_symbol_data(self):
         """Test clearing data for a specific symbol."""
         self.data_storage.store_data("EURUSD", self.mock_data)
@@ -337,6 +619,28 @@ class TestDataStorage:
         # Should be approximately 30 minutes (allowing for test execution time)
         assert timedelta(minutes=29) <= age <= timedelta(minutes=31)
     
+    def test_timezone_aware_age_and_range(self):
+        """Test age and range queries against timezone-aware data."""
+        past_time = pd.Timestamp.now(tz='UTC') - timedelta(minutes=30)
+        data = pd.DataFrame({
+            'Open': [1.0800],
+            'High': [1.0815],
+            'Low': [1.0795],
+            'Close': [1.0805],
+            'Volume': [1000]
+        }, index=pd.DatetimeIndex([past_time]).tz_convert('America/New_York'))
+        
+        self.data_storage.store_data("EURUSD", data)
+        
+        age = self.data_storage.get_data_age("EURUSD")
+        assert timedelta(minutes=29) <= age <= timedelta(minutes=31)
+        
+        start_time = (past_time - timedelta(seconds=1)).to_pydatetime()
+        end_time = (past_time + timedelta(seconds=1)).tz_convert('Europe/Paris')
+        result = self.data_storage.get_data_range("EURUSD", start_time, end_time)
+        assert len(result) == 1
+        assert result.index[0] == past_time
+    
     def test_get_data_age_not_found(self):
         """Test getting data age for non-existent symbol."""
         result = self.data_storage.get_data_age("NONEXISTENT")
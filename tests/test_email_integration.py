@@ -58,15 +58,19 @@ class TestEmailIntegration:
         mock_smtp.assert_called_once_with('smtp.gmail.com', 587)
         mock_server.starttls.assert_called_once()
         mock_server.login.assert_called_once_with('test@example.com', 'test_password')
-        mock_server.sendmail.assert_called_once()
+        mock_server.send_message.assert_called_once()
+        
+        # The session stays pooled until the manager is closed
+        mock_server.quit.assert_not_called()
+        manager.close()
         mock_server.quit.assert_called_once()
         
-        # Verify email content
-        sendmail_args = mock_server.sendmail.call_args[0]
-        assert sendmail_args[0] == 'test@example.com'  # sender
-        assert sendmail_args[1] == 'recipient@example.com'  # recipient
+        # Verify email content; the envelope is taken from these headers
+        sent_message = mock_server.send_message.call_args[0][0]
+        assert sent_message['From'] == 'test@example.com'  # sender
+        assert sent_message['To'] == 'recipient@example.com'  # recipient
         
-        email_content = sendmail_args[2]  # message content
+        email_content = sent_message.as_string()
         assert 'From: test@example.com' in email_content
         assert 'To: recipient@example.com' in email_content
         # Subject is encoded, but we can check for the basic structure
@@ -105,8 +109,8 @@ class TestEmailIntegration:
             assert result is True
             
             # Check that the email was sent (content is base64 encoded)
-            sendmail_args = mock_server.sendmail.call_args[0]
-            email_content = sendmail_args[2]
+            sent_message = mock_server.send_message.call_args[0][0]
+            email_content = sent_message.as_string()
             # Just verify the email structure is correct
             assert 'From: test@example.com' in email_content
             assert 'To: recipient@example.com' in email_content
@@ -117,7 +121,7 @@ class TestEmailIntegration:
         mock_server = Mock()
         
         # First attempt fails with server disconnection, second succeeds
-        mock_server.sendmail.side_effect = [
+        mock_server.send_message.side_effect = [
             smtplib.SMTPServerDisconnected("Connection lost"),
             None  # Success on retry
         ]
@@ -128,7 +132,7 @@ class TestEmailIntegration:
         
         # Should succeed after retry
         assert result is True
-        assert mock_server.sendmail.call_count == 2
+        assert mock_server.send_message.call_count == 2
     
     @patch('smtplib.SMTP')
     def test_email_notification_permanent_failure(self, mock_smtp):
@@ -143,7 +147,7 @@ class TestEmailIntegration:
         # Should fail without retry for authentication errors
         assert result is False
         mock_server.login.assert_called_once()
-        mock_server.sendmail.assert_not_called()
+        mock_server.send_message.assert_not_called()
     
     def test_email_notification_invalid_configuration(self):
         """Test email notification with invalid configuration."""
@@ -200,7 +204,7 @@ class TestEmailIntegration:
             context=mock_smtp_ssl.call_args[1]['context']
         )
         mock_server.login.assert_called_once()
-        mock_server.sendmail.assert_called_once()
+        mock_server.send_message.assert_called_once()
     
     def test_email_message_content_validation(self):
         """Test that email messages contain all required information."""
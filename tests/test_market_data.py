@@ -0,0 +1,70 @@
+"""
+Unit tests for MarketData model.
+"""
+
+import pytest
+import pandas as pd
+
+from forex_alerts.models.market_data import MarketData
+
+
+class TestMarketData:
+    """Test cases for MarketData model."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.mock_data = pd.DataFrame({
+            'Open': [1.0800, 1.0805, 1.0810],
+            'High': [1.0815, 1.0820, 1.0825],
+            'Low': [1.0795, 1.0800, 1.0805],
+            'Close': [1.0805, 1.0810, 1.0815],
+            'Volume': [1000, 1500, 1200]
+        }, index=pd.date_range('2024-01-01 10:00:00', periods=3, freq='1min'))
+    
+    def test_derived_prices(self):
+        """Test typical and weighted prices are computed on construction."""
+        data = MarketData("EURUSD", pd.Timestamp('2024-01-01'), 1.08, 1.09, 1.07, 1.085, 100)
+        
+        assert data.typical_price == pytest.approx((1.09 + 1.07 + 1.085) / 3)
+        assert data.weighted_price == pytest.approx(data.typical_price * 100)
+    
+    def test_from_dataframe(self):
+        """Test bulk construction matches per-row construction."""
+        result = MarketData.from_dataframe(self.mock_data, "EURUSD")
+        
+        assert len(result) == 3
+        for (timestamp, row), data in zip(self.mock_data.iterrows(), result):
+            expected = MarketData("EURUSD", timestamp, row['Open'], row['High'],
+                                  row['Low'], row['Close'], int(row['Volume']))
+            assert data == expected
+            assert data.typical_price == pytest.approx(expected.typical_price)
+            assert data.weighted_price == pytest.approx(expected.weighted_price)
+            assert isinstance(data.volume, int)
+    
+    def test_from_dataframe_inconsistent_prices(self):
+        """Test bulk construction rejects High below Open/Close."""
+        self.mock_data.loc[self.mock_data.index[1], 'High'] = 1.0
+        
+        with pytest.raises(ValueError, match="inconsistent"):
+            MarketData.from_dataframe(self.mock_data, "EURUSD")
+    
+    def test_from_dataframe_non_positive_price(self):
+        """Test bulk construction rejects non-positive prices."""
+        self.mock_data.loc[self.mock_data.index[0], 'Low'] = 0.0
+        
+        with pytest.raises(ValueError, match="positive"):
+            MarketData.from_dataframe(self.mock_data, "EURUSD")
+    
+    def test_to_soa(self):
+        """Test structure-of-arrays conversion returns typed columns."""
+        columns = MarketData.to_soa(self.mock_data)
+        
+        assert columns['close'].tolist() == [1.0805, 1.0810, 1.0815]
+        assert columns['volume'].dtype == 'float64'
+        assert columns['timestamp'][0] == self.mock_data.index[0]
+        assert len(columns['typical_price']) == 3
+    
+    def test_to_soa_missing_columns(self):
+        """Test structure-of-arrays conversion requires OHLCV columns."""
+        with pytest.raises(ValueError, match="Missing required columns"):
+            MarketData.to_soa(self.mock_data.drop(columns=['Volume']))
@@ -5,10 +5,11 @@ Unit tests for NotificationManager.
 import pytest
 import smtplib
 import subprocess
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from unittest.mock import patch, MagicMock, Mock
 from io import StringIO
 import sys
+import threading
 
 from forex_alerts.services.notification_manager import NotificationManager, NotificationChannel
 from forex_alerts.models.signal import Signal
@@ -164,9 +165,10 @@ class TestNotificationManager:
         assert "EUR/USD" in output
         assert "BUY 📈" in output
 
-    @patch('builtins.print', side_effect=Exception("Print error"))
-    def test_send_console_notification_failure(self, mock_print):
+    @patch('sys.stdout')
+    def test_send_console_notification_failure(self, mock_stdout):
         """Test console notification failure handling."""
+        mock_stdout.write.side_effect = Exception("Write error")
         manager = NotificationManager({'notification_methods': ['console']})
         signal = Signal("EURUSD=X", "BUY", 1.0845,
                         datetime.now(), 1.0843, 1.0841)
@@ -175,6 +177,19 @@ class TestNotificationManager:
 
         assert result is False
 
+    @patch('sys.stdout')
+    def test_send_notifications_console_flushes_once(self, mock_stdout):
+        """Test that a console batch writes each alert but flushes once."""
+        manager = NotificationManager({'notification_methods': ['console']})
+        signals = [Signal("EURUSD=X", "BUY", 1.0845,
+                          datetime.now(), 1.0843, 1.0841)] * 3
+
+        results = manager.send_notifications(signals)
+
+        assert results == [True] * 3
+        assert mock_stdout.write.call_count == 3
+        mock_stdout.flush.assert_called_once()
+
     def test_send_notification_console_only(self):
         """Test sending notification with console channel only."""
         manager = NotificationManager({'notification_methods': ['console']})
@@ -205,6 +220,65 @@ class TestNotificationManager:
             mock_email.assert_called_once_with(signal)
             mock_desktop.assert_called_once_with(signal)
 
+    def test_send_notification_email_runs_concurrently(self):
+        """Test that email is sent on a worker thread while other channels run."""
+        config = {'notification_methods': ['console', 'email']}
+        manager = NotificationManager(config)
+        signal = Signal("EURUSD=X", "BUY", 1.0845,
+                        datetime.now(), 1.0843, 1.0841)
+        email_started = threading.Event()
+
+        def slow_console(_signal):
+            # Only returns True if the email channel runs while this one waits
+            return email_started.wait(timeout=5)
+
+        def email(_signal):
+            email_started.set()
+            return False
+
+        with patch.object(manager, '_send_console_notification', side_effect=slow_console) as mock_console, \
+                patch.object(manager, '_send_email_notification', side_effect=email):
+
+            result = manager.send_notification(signal)
+
+        assert result is True
+        mock_console.assert_called_once_with(signal)
+        manager.close()
+
+    def test_send_notification_desktop_on_calling_thread(self):
+        """Test that desktop notifications are never moved off the calling thread."""
+        config = {'notification_methods': ['console', 'email', 'desktop']}
+        signal = Signal("EURUSD=X", "BUY", 1.0845,
+                        datetime.now(), 1.0843, 1.0841)
+        desktop_threads = []
+
+        with NotificationManager(config) as manager, \
+                patch.object(manager, '_send_console_notification', return_value=True), \
+                patch.object(manager, '_send_email_notification', return_value=True), \
+                patch.object(manager, '_send_desktop_notification',
+                             side_effect=lambda _signal: desktop_threads.append(threading.current_thread())):
+
+            manager.send_notification(signal)
+
+        assert desktop_threads == [threading.current_thread()]
+
+    def test_executor_created_lazily_and_closed(self):
+        """Test the worker pool only exists once needed and is shut down by close()."""
+        manager = NotificationManager({'notification_methods': ['console']})
+        signal = Signal("EURUSD=X", "BUY", 1.0845,
+                        datetime.now(), 1.0843, 1.0841)
+
+        with patch.object(manager, '_send_console_notification', return_value=True):
+            manager.send_notification(signal)
+        assert manager._executor is None
+
+        with NotificationManager({'notification_methods': ['console', 'email']}) as manager, \
+                patch.object(manager, '_send_console_notification', return_value=True), \
+                patch.object(manager, '_send_email_notification', return_value=True):
+            manager.send_notification(signal)
+            assert manager._executor is not None
+        assert manager._executor is None
+
     def test_send_notification_partial_failure(self):
         """Test sending notification with some channels failing."""
         config = {'notification_methods': ['console', 'email']}
@@ -250,6 +324,21 @@ class TestNotificationManager:
         assert "🔔 FOREX ALERT 🔔" in output
         assert "✅ Successful channels: ['console']" in output
 
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_test_notifications_signal_timestamp_is_utc(self, mock_stdout):
+        """Test that the sample signal is stamped with the current UTC time."""
+        manager = NotificationManager({'notification_methods': ['console']})
+
+        with patch.object(manager, '_send_console_notification', return_value=True) as mock_console:
+            before = datetime.now(timezone.utc)
+            manager.test_notifications()
+            after = datetime.now(timezone.utc)
+
+        timestamp = mock_console.call_args[0][0].timestamp
+        assert timestamp.tzinfo is not None
+        assert timestamp.utcoffset() == timedelta(0)
+        assert before - timedelta(seconds=1) <= timestamp <= after
+
     @patch('sys.stdout', new_callable=StringIO)
     @patch('forex_alerts.services.notification_manager.PLYER_AVAILABLE', True)
     @patch('forex_alerts.services.notification_manager.notification')
@@ -273,6 +362,20 @@ class TestNotificationManager:
         assert "✅ Successful channels: ['console', 'desktop']" in output
         assert "❌ Failed channels: ['email']" in output
 
+    def test_module_import_defers_channel_dependencies(self):
+        """Test that importing the module does not load email or plyer support."""
+        code = (
+            "import sys\n"
+            "import forex_alerts.services.notification_manager\n"
+            "loaded = [m for m in ('smtplib', 'ssl', 'email.message', 'plyer')"
+            " if m in sys.modules]\n"
+            "print(','.join(loaded))\n"
+        )
+        result = subprocess.run([sys.executable, '-c', code],
+                                capture_output=True, text=True, check=True)
+
+        assert result.stdout.strip() == ''
+
     def test_get_enabled_channels(self):
         """Test getting list of enabled channels."""
         config = {'notification_methods': ['console', 'email']}
@@ -492,6 +595,27 @@ class TestEmailNotifications:
         assert parts[0].get_content_type() == "text/plain"
         assert parts[1].get_content_type() == "text/html"
 
+    @patch('smtplib.SMTP')
+    def test_send_email_multiple_recipients(self, mock_smtp):
+        """Test that one message is sent to every configured recipient."""
+        mock_server = Mock()
+        mock_smtp.return_value = mock_server
+
+        email_config = self.valid_email_config.copy()
+        email_config['recipient_email'] = [
+            'first@example.com', 'second@example.com']
+        manager = NotificationManager({'email_config': email_config})
+
+        with patch.object(manager, '_create_email_message',
+                          wraps=manager._create_email_message) as mock_create:
+            result = manager._send_email_notification(self.test_signal)
+
+        assert result is True
+        mock_create.assert_called_once()
+        mock_server.send_message.assert_called_once()
+        sent_message = mock_server.send_message.call_args[0][0]
+        assert sent_message["To"] == "first@example.com, second@example.com"
+
     def test_create_email_message_sell_signal(self):
         """Test email message creation for SELL signal."""
         sell_signal = Signal(
@@ -566,7 +690,10 @@ class TestEmailNotifications:
         mock_server.starttls.assert_called_once()
         mock_server.login.assert_called_once_with(
             'test@example.com', 'test_password')
-        mock_server.sendmail.assert_called_once()
+        mock_server.send_message.assert_called_once()
+        mock_server.quit.assert_not_called()
+
+        manager.close()
         mock_server.quit.assert_called_once()
 
     @patch('smtplib.SMTP_SSL')
@@ -590,9 +717,114 @@ class TestEmailNotifications:
             'smtp.gmail.com', 465, context=mock_smtp_ssl.call_args[1]['context'])
         mock_server.login.assert_called_once_with(
             'test@example.com', 'test_password')
-        mock_server.sendmail.assert_called_once()
+        mock_server.send_message.assert_called_once()
+
+        manager.close()
         mock_server.quit.assert_called_once()
 
+    @patch('smtplib.SMTP')
+    @patch('smtplib.SMTP_SSL')
+    def test_send_smtp_email_port_465_uses_ssl(self, mock_smtp_ssl, mock_smtp):
+        """Test that port 465 connects with implicit TLS even when use_tls is set."""
+        mock_server = Mock()
+        mock_smtp_ssl.return_value = mock_server
+
+        ssl_config = self.valid_email_config.copy()
+        ssl_config['smtp_port'] = '465'
+
+        manager = NotificationManager({'email_config': ssl_config})
+        message = manager._create_email_message(self.test_signal, ssl_config)
+
+        result = manager._send_smtp_email(message, ssl_config)
+
+        assert result is True
+        mock_smtp.assert_not_called()
+        mock_smtp_ssl.assert_called_once()
+        mock_server.starttls.assert_not_called()
+        mock_server.login.assert_called_once()
+
+    @patch('smtplib.SMTP')
+    def test_send_smtp_email_reuses_connection(self, mock_smtp):
+        """Test that consecutive emails share one SMTP session."""
+        mock_server = Mock()
+        mock_smtp.return_value = mock_server
+
+        config = {'email_config': self.valid_email_config}
+        manager = NotificationManager(config)
+        message = manager._create_email_message(
+            self.test_signal, self.valid_email_config)
+
+        for _ in range(3):
+            assert manager._send_smtp_email(
+                message, self.valid_email_config) is True
+
+        mock_smtp.assert_called_once()
+        mock_server.login.assert_called_once()
+        assert mock_server.noop.call_count == 2
+        assert mock_server.send_message.call_count == 3
+
+    @patch('smtplib.SMTP')
+    def test_send_smtp_email_reconnects_stale_connection(self, mock_smtp):
+        """Test that a session failing its NOOP check is replaced."""
+        stale_server = Mock()
+        stale_server.noop.side_effect = smtplib.SMTPServerDisconnected(
+            "Connection lost")
+        fresh_server = Mock()
+        mock_smtp.side_effect = [stale_server, fresh_server]
+
+        config = {'email_config': self.valid_email_config}
+        manager = NotificationManager(config)
+        message = manager._create_email_message(
+            self.test_signal, self.valid_email_config)
+
+        assert manager._send_smtp_email(message, self.valid_email_config) is True
+        assert manager._send_smtp_email(message, self.valid_email_config) is True
+
+        assert mock_smtp.call_count == 2
+        stale_server.send_message.assert_called_once()
+        fresh_server.login.assert_called_once()
+        fresh_server.send_message.assert_called_once()
+
+    @patch('smtplib.SMTP')
+    def test_send_smtp_email_recycles_connection(self, mock_smtp):
+        """Test that a session is closed after the per-connection message cap."""
+        mock_server = Mock()
+        mock_smtp.return_value = mock_server
+
+        config = {'email_config': self.valid_email_config}
+        manager = NotificationManager(config)
+        manager.SMTP_MAX_MESSAGES_PER_CONNECTION = 2
+        message = manager._create_email_message(
+            self.test_signal, self.valid_email_config)
+
+        for _ in range(3):
+            manager._send_smtp_email(message, self.valid_email_config)
+
+        assert mock_smtp.call_count == 2
+        mock_server.quit.assert_called_once()
+
+    @patch('ssl.create_default_context')
+    @patch('smtplib.SMTP')
+    def test_send_smtp_email_reuses_ssl_context(self, mock_smtp, mock_context):
+        """Test that reconnecting reuses the TLS context built at init."""
+        mock_server = Mock()
+        mock_smtp.return_value = mock_server
+
+        config = {'email_config': self.valid_email_config,
+                  'notification_methods': ['email']}
+        manager = NotificationManager(config)
+        message = manager._create_email_message(
+            self.test_signal, self.valid_email_config)
+
+        manager._send_smtp_email(message, self.valid_email_config)
+        manager._close_smtp()
+        manager._send_smtp_email(message, self.valid_email_config)
+
+        mock_context.assert_called_once()
+        assert mock_smtp.call_count == 2
+        for call in mock_server.starttls.call_args_list:
+            assert call[1]['context'] is mock_context.return_value
+
     @patch('smtplib.SMTP')
     def test_send_smtp_email_authentication_error(self, mock_smtp):
         """Test SMTP email sending with authentication error."""
@@ -615,7 +847,7 @@ class TestEmailNotifications:
     def test_send_smtp_email_recipients_refused(self, mock_smtp):
         """Test SMTP email sending with recipients refused error."""
         mock_server = Mock()
-        mock_server.sendmail.side_effect = smtplib.SMTPRecipientsRefused({})
+        mock_server.send_message.side_effect = smtplib.SMTPRecipientsRefused({})
         mock_smtp.return_value = mock_server
 
         config = {'email_config': self.valid_email_config}
@@ -626,14 +858,14 @@ class TestEmailNotifications:
         result = manager._send_smtp_email(message, self.valid_email_config)
 
         assert result is False
-        mock_server.sendmail.assert_called_once()
+        mock_server.send_message.assert_called_once()
 
     @patch('smtplib.SMTP')
     def test_send_smtp_email_server_disconnected_retry(self, mock_smtp):
         """Test SMTP email sending with server disconnection and retry."""
         mock_server = Mock()
         # First two attempts fail, third succeeds
-        mock_server.sendmail.side_effect = [
+        mock_server.send_message.side_effect = [
             smtplib.SMTPServerDisconnected("Connection lost"),
             smtplib.SMTPServerDisconnected("Connection lost"),
             None  # Success on third attempt
@@ -648,13 +880,45 @@ class TestEmailNotifications:
         result = manager._send_smtp_email(message, self.valid_email_config)
 
         assert result is True
-        assert mock_server.sendmail.call_count == 3
+        assert mock_server.send_message.call_count == 3
+
+    @patch('forex_alerts.services.notification_manager.time.sleep')
+    @patch('smtplib.SMTP')
+    def test_send_smtp_email_retry_backoff(self, mock_smtp, mock_sleep):
+        """Test that SMTP retries back off exponentially with jitter."""
+        mock_server = Mock()
+        mock_server.send_message.side_effect = smtplib.SMTPServerDisconnected(
+            "Connection lost")
+        mock_smtp.return_value = mock_server
+
+        config = {'email_config': self.valid_email_config}
+        manager = NotificationManager(config)
+        message = manager._create_email_message(
+            self.test_signal, self.valid_email_config)
+
+        result = manager._send_smtp_email(message, self.valid_email_config)
+
+        assert result is False
+        # No wait after the final attempt
+        delays = [call[0][0] for call in mock_sleep.call_args_list]
+        assert len(delays) == 2
+        assert 0.2 <= delays[0] < 0.3
+        assert 0.4 <= delays[1] < 0.5
+
+    def test_smtp_retry_delay_capped(self):
+        """Test that the retry backoff never exceeds the configured maximum plus jitter."""
+        manager = NotificationManager()
+
+        delay = manager._smtp_retry_delay(10)
+
+        assert manager.SMTP_RETRY_MAX_DELAY <= delay
+        assert delay < manager.SMTP_RETRY_MAX_DELAY + manager.SMTP_RETRY_BASE_DELAY
 
     @patch('smtplib.SMTP')
     def test_send_smtp_email_max_retries_exceeded(self, mock_smtp):
         """Test SMTP email sending with max retries exceeded."""
         mock_server = Mock()
-        mock_server.sendmail.side_effect = smtplib.SMTPServerDisconnected(
+        mock_server.send_message.side_effect = smtplib.SMTPServerDisconnected(
             "Connection lost")
         mock_smtp.return_value = mock_server
 
@@ -666,7 +930,43 @@ class TestEmailNotifications:
         result = manager._send_smtp_email(message, self.valid_email_config)
 
         assert result is False
-        assert mock_server.sendmail.call_count == 3  # Max retries
+        assert mock_server.send_message.call_count == 3  # Max retries
+
+    @patch('smtplib.SMTP')
+    def test_send_notifications_batch_single_session(self, mock_smtp):
+        """Test that a batch of signals is emailed over one SMTP session."""
+        mock_server = Mock()
+        mock_smtp.return_value = mock_server
+
+        config = {'email_config': self.valid_email_config,
+                  'notification_methods': ['email']}
+        manager = NotificationManager(config)
+        signals = [self.test_signal] * 5
+
+        results = manager.send_notifications(signals)
+
+        assert results == [True] * 5
+        mock_smtp.assert_called_once()
+        mock_server.login.assert_called_once()
+        mock_server.noop.assert_not_called()
+        assert mock_server.send_message.call_count == 5
+
+    @patch('smtplib.SMTP')
+    def test_send_notifications_aborts_failing_batch(self, mock_smtp):
+        """Test that a large batch stops once over a third of sends fail."""
+        mock_server = Mock()
+        mock_server.send_message.side_effect = smtplib.SMTPRecipientsRefused({})
+        mock_smtp.return_value = mock_server
+
+        config = {'email_config': self.valid_email_config,
+                  'notification_methods': ['email']}
+        manager = NotificationManager(config)
+        signals = [self.test_signal] * 30
+
+        results = manager.send_notifications(signals)
+
+        assert results == [False] * 30
+        assert mock_server.send_message.call_count == 11
 
     def test_send_email_notification_missing_config(self):
         """Test email notification sending with missing configuration."""
@@ -824,14 +1124,29 @@ class TestDesktopNotifications:
         assert notification_config['timeout'] == 25
         assert notification_config['app_icon'] == '/custom/icon.png'
 
+    @patch('forex_alerts.services.notification_manager.PLYER_AVAILABLE', True)
+    @patch('forex_alerts.services.notification_manager.notification')
+    @patch('forex_alerts.services.notification_manager.platform.system')
+    def test_desktop_notification_config_resolved_once(self, mock_platform, mock_notification):
+        """Test that platform detection and desktop settings are cached at init."""
+        mock_platform.return_value = "Linux"
+
+        manager = NotificationManager({'notification_methods': ['desktop']})
+        for _ in range(3):
+            manager._send_desktop_notification(self.test_signal)
+
+        mock_platform.assert_called_once()
+        assert manager._get_desktop_notification_config() is manager._get_desktop_notification_config()
+        assert mock_notification.notify.call_args[1]['timeout'] == 8
+
     @patch('forex_alerts.services.notification_manager.PLYER_AVAILABLE', True)
     @patch('forex_alerts.services.notification_manager.SUBPROCESS_AVAILABLE', True)
     @patch('forex_alerts.services.notification_manager.notification')
-    @patch('forex_alerts.services.notification_manager.subprocess.run')
-    def test_validate_desktop_notifications_success(self, mock_subprocess, mock_notification):
+    @patch('forex_alerts.services.notification_manager.shutil.which')
+    def test_validate_desktop_notifications_success(self, mock_which, mock_notification):
         """Test successful desktop notification validation."""
         mock_notification.notify = Mock()  # Ensure notify attribute exists
-        mock_subprocess.return_value = Mock()  # Mock successful subprocess call
+        mock_which.return_value = '/usr/bin/notify-send'
 
         manager = NotificationManager({'notification_methods': ['desktop']})
         result = manager.validate_desktop_notifications()
@@ -850,14 +1165,14 @@ class TestDesktopNotifications:
     @patch('forex_alerts.services.notification_manager.PLYER_AVAILABLE', True)
     @patch('forex_alerts.services.notification_manager.SUBPROCESS_AVAILABLE', True)
     @patch('forex_alerts.services.notification_manager.notification')
-    @patch('forex_alerts.services.notification_manager.subprocess.run')
-    def test_validate_desktop_notifications_plyer_fails_native_succeeds(self, mock_subprocess, mock_notification):
+    @patch('forex_alerts.services.notification_manager.shutil.which')
+    def test_validate_desktop_notifications_plyer_fails_native_succeeds(self, mock_which, mock_notification):
         """Test desktop notification validation when plyer fails but native succeeds."""
         # Remove the notify attribute to simulate missing method
         if hasattr(mock_notification, 'notify'):
             delattr(mock_notification, 'notify')
 
-        mock_subprocess.return_value = Mock()  # Mock successful native call
+        mock_which.return_value = '/usr/bin/notify-send'  # Native notifier on PATH
 
         manager = NotificationManager({'notification_methods': ['desktop']})
         result = manager.validate_desktop_notifications()
@@ -866,28 +1181,45 @@ class TestDesktopNotifications:
 
     @patch('forex_alerts.services.notification_manager.PLYER_AVAILABLE', False)
     @patch('forex_alerts.services.notification_manager.SUBPROCESS_AVAILABLE', True)
-    @patch('forex_alerts.services.notification_manager.subprocess.run')
-    def test_validate_desktop_notifications_native_only(self, mock_subprocess):
+    @patch('forex_alerts.services.notification_manager.shutil.which')
+    def test_validate_desktop_notifications_native_only(self, mock_which):
         """Test desktop notification validation with native method only."""
-        mock_subprocess.return_value = Mock()  # Mock successful native call
+        mock_which.return_value = '/usr/bin/notify-send'  # Native notifier on PATH
 
         manager = NotificationManager({'notification_methods': ['desktop']})
         result = manager.validate_desktop_notifications()
 
         assert result is True  # Should succeed with native method
 
+    @patch('forex_alerts.services.notification_manager.PLYER_AVAILABLE', False)
+    @patch('forex_alerts.services.notification_manager.SUBPROCESS_AVAILABLE', True)
+    @patch('forex_alerts.services.notification_manager.subprocess.run')
+    @patch('forex_alerts.services.notification_manager.shutil.which')
+    @patch('forex_alerts.services.notification_manager.platform.system')
+    def test_validate_desktop_notifications_cached(self, mock_system, mock_which, mock_subprocess):
+        """Test that validation looks up the notifier once and never forks."""
+        mock_system.return_value = "Linux"
+        mock_which.return_value = None
+
+        manager = NotificationManager({'notification_methods': ['desktop']})
+
+        assert manager.validate_desktop_notifications() is False
+        assert manager.validate_desktop_notifications() is False
+        mock_which.assert_called_once_with('notify-send')
+        mock_subprocess.assert_not_called()
+
     @patch('forex_alerts.services.notification_manager.PLYER_AVAILABLE', True)
     @patch('forex_alerts.services.notification_manager.SUBPROCESS_AVAILABLE', True)
     @patch('forex_alerts.services.notification_manager.notification')
-    @patch('forex_alerts.services.notification_manager.subprocess.run')
+    @patch('forex_alerts.services.notification_manager.shutil.which')
     @patch('forex_alerts.services.notification_manager.platform.system')
     @patch('forex_alerts.services.notification_manager.platform.release')
-    def test_get_desktop_notification_status(self, mock_release, mock_system, mock_subprocess, mock_notification):
+    def test_get_desktop_notification_status(self, mock_release, mock_system, mock_which, mock_notification):
         """Test getting desktop notification status information."""
         mock_system.return_value = "Darwin"
         mock_release.return_value = "21.6.0"
         mock_notification.notify = Mock()
-        mock_subprocess.return_value = Mock()
+        mock_which.return_value = '/usr/bin/osascript'
 
         manager = NotificationManager({'notification_methods': ['desktop']})
         status = manager.get_desktop_notification_status()
@@ -939,11 +1271,11 @@ class TestDesktopNotifications:
     @patch('forex_alerts.services.notification_manager.PLYER_AVAILABLE', True)
     @patch('forex_alerts.services.notification_manager.SUBPROCESS_AVAILABLE', True)
     @patch('forex_alerts.services.notification_manager.notification')
-    @patch('forex_alerts.services.notification_manager.subprocess.run')
-    def test_test_notifications_desktop_success(self, mock_subprocess, mock_notification, mock_stdout):
+    @patch('forex_alerts.services.notification_manager.shutil.which')
+    def test_test_notifications_desktop_success(self, mock_which, mock_notification, mock_stdout):
         """Test notification testing with successful desktop notification."""
         mock_notification.notify = Mock()
-        mock_subprocess.return_value = Mock()
+        mock_which.return_value = '/usr/bin/notify-send'
 
         manager = NotificationManager({'notification_methods': ['desktop']})
         results = manager.test_notifications()
@@ -975,11 +1307,11 @@ class TestDesktopNotifications:
     @patch('forex_alerts.services.notification_manager.PLYER_AVAILABLE', True)
     @patch('forex_alerts.services.notification_manager.SUBPROCESS_AVAILABLE', True)
     @patch('forex_alerts.services.notification_manager.notification')
-    @patch('forex_alerts.services.notification_manager.subprocess.run')
-    def test_test_notifications_desktop_send_failure(self, mock_subprocess, mock_notification, mock_stdout):
+    @patch('forex_alerts.services.notification_manager.shutil.which')
+    def test_test_notifications_desktop_send_failure(self, mock_which, mock_notification, mock_stdout):
         """Test notification testing when desktop notification sending fails."""
         mock_notification.notify = Mock()
-        mock_subprocess.return_value = Mock()
+        mock_which.return_value = '/usr/bin/notify-send'
 
         manager = NotificationManager({'notification_methods': ['desktop']})
 
@@ -1014,8 +1346,11 @@ class TestDesktopNotifications:
         call_args = mock_subprocess.call_args[0][0]
         assert call_args[0] == 'osascript'
         assert call_args[1] == '-e'
-        assert 'display notification "Test Message" with title "Test Title"' in call_args[2]
+        # Title and message are passed as script arguments, not interpolated
+        assert call_args[-2:] == ['Test Title', 'Test Message']
+        assert not any('Test' in arg for arg in call_args[:-2])
 
+    @patch('forex_alerts.services.notification_manager.LIBNOTIFY_AVAILABLE', False)
     @patch('forex_alerts.services.notification_manager.PLYER_AVAILABLE', False)
     @patch('forex_alerts.services.notification_manager.SUBPROCESS_AVAILABLE', True)
     @patch('forex_alerts.services.notification_manager.subprocess.run')
@@ -1036,6 +1371,49 @@ class TestDesktopNotifications:
             capture_output=True
         )
 
+    @patch('forex_alerts.services.notification_manager.PLYER_AVAILABLE', False)
+    @patch('forex_alerts.services.notification_manager.LIBNOTIFY_AVAILABLE', True)
+    @patch('forex_alerts.services.notification_manager._get_notify')
+    @patch('forex_alerts.services.notification_manager.subprocess.run')
+    @patch('forex_alerts.services.notification_manager.platform.system')
+    def test_send_native_desktop_notification_linux_libnotify(self, mock_system, mock_subprocess, mock_get_notify):
+        """Test that Linux notifications go through libnotify in-process when available."""
+        mock_system.return_value = "Linux"
+        mock_notify = mock_get_notify.return_value
+        mock_notify.is_initted.return_value = False
+
+        manager = NotificationManager({'notification_methods': ['desktop']})
+        result = manager._send_native_desktop_notification(
+            "Test Title", "Test Message")
+
+        assert result is True
+        mock_notify.init.assert_called_once()
+        mock_notify.Notification.new.assert_called_once_with("Test Title", "Test Message")
+        mock_notify.Notification.new.return_value.show.assert_called_once()
+        mock_subprocess.assert_not_called()
+
+    @patch('forex_alerts.services.notification_manager.PLYER_AVAILABLE', False)
+    @patch('forex_alerts.services.notification_manager.LIBNOTIFY_AVAILABLE', True)
+    @patch('forex_alerts.services.notification_manager.SUBPROCESS_AVAILABLE', True)
+    @patch('forex_alerts.services.notification_manager._get_notify', return_value=None)
+    @patch('forex_alerts.services.notification_manager.subprocess.run')
+    @patch('forex_alerts.services.notification_manager.platform.system')
+    def test_send_native_desktop_notification_linux_libnotify_unloadable(self, mock_system, mock_subprocess, mock_get_notify):
+        """Test that notify-send is used when libnotify can't be loaded."""
+        mock_system.return_value = "Linux"
+
+        manager = NotificationManager({'notification_methods': ['desktop']})
+        result = manager._send_native_desktop_notification(
+            "Test Title", "Test Message")
+
+        assert result is True
+        mock_get_notify.assert_called_once()
+        mock_subprocess.assert_called_once_with(
+            ['notify-send', 'Test Title', 'Test Message'],
+            check=True,
+            capture_output=True
+        )
+
     @patch('forex_alerts.services.notification_manager.PLYER_AVAILABLE', False)
     @patch('forex_alerts.services.notification_manager.SUBPROCESS_AVAILABLE', True)
     @patch('forex_alerts.services.notification_manager.subprocess.run')
@@ -1056,8 +1434,28 @@ class TestDesktopNotifications:
         call_args = mock_subprocess.call_args[0][0]
         assert call_args[0] == 'powershell'
         assert call_args[1] == '-Command'
-        assert 'Test Title' in call_args[2]
-        assert 'Test Message' in call_args[2]
+        # Title and message reach the script through its environment
+        assert 'Test Title' not in call_args[2]
+        env = mock_subprocess.call_args[1]['env']
+        assert env['FOREX_ALERT_TITLE'] == 'Test Title'
+        assert env['FOREX_ALERT_MESSAGE'] == 'Test Message'
+
+    @patch('forex_alerts.services.notification_manager.PLYER_AVAILABLE', False)
+    @patch('forex_alerts.services.notification_manager.SUBPROCESS_AVAILABLE', True)
+    @patch('forex_alerts.services.notification_manager.subprocess.run')
+    @patch('forex_alerts.services.notification_manager.platform.system')
+    def test_send_native_desktop_notification_macos_quotes(self, mock_system, mock_subprocess):
+        """Test that quotes in the message cannot break out of the AppleScript."""
+        mock_system.return_value = "Darwin"
+
+        manager = NotificationManager({'notification_methods': ['desktop']})
+        message = 'Price "1.0" & do shell script "rm -rf ~"'
+        result = manager._send_native_desktop_notification("Test Title", message)
+
+        assert result is True
+        call_args = mock_subprocess.call_args[0][0]
+        assert call_args[-1] == message
+        assert not any('rm -rf' in arg for arg in call_args[:-1])
 
     @patch('forex_alerts.services.notification_manager.PLYER_AVAILABLE', False)
     @patch('forex_alerts.services.notification_manager.SUBPROCESS_AVAILABLE', True)
@@ -1084,6 +1482,7 @@ class TestDesktopNotifications:
 
         assert result is False
 
+    @patch('forex_alerts.services.notification_manager.LIBNOTIFY_AVAILABLE', False)
     @patch('forex_alerts.services.notification_manager.PLYER_AVAILABLE', False)
     @patch('forex_alerts.services.notification_manager.SUBPROCESS_AVAILABLE', True)
     @patch('forex_alerts.services.notification_manager.subprocess.run')
@@ -2,11 +2,14 @@
 Unit tests for SignalCalculator class.
 """
 
+import subprocess
+import sys
 import pytest
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from forex_alerts.services.signal_calculator import SignalCalculator
+from forex_alerts.models.market_data import MarketData
 from forex_alerts.models.signal import Signal
 
 
@@ -213,6 +216,86 @@ class TestSignalCalculator:
         assert pd.isna(vwap.iloc[0])  # Should be NaN due to zero initial volume
         assert abs(vwap.iloc[1] - expected_vwap_2) < 0.0001
         assert abs(vwap.iloc[2] - expected_vwap_3) < 0.0001
+    
+    def test_calculate_vwap_nan_bar_mid_session(self):
+        """Test a NaN bar is NaN itself but doesn't poison later VWAP values."""
+        index = pd.date_range('2024-01-01 10:00', periods=4, freq='h').append(
+            pd.date_range('2024-01-02 10:00', periods=2, freq='h'))
+        data = pd.DataFrame({
+            'high': [1.10, 1.20, 1.15, 1.12, 1.30, 1.25],
+            'low': [1.05, 1.15, 1.10, 1.08, 1.20, 1.21],
+            'close': [1.08, 1.18, 1.12, 1.10, 1.25, 1.23],
+            'volume': [1000, np.nan, 1500, 500, 800, 1200]
+        }, index=index)
+        
+        vwap = self.calculator.calculate_vwap(data)
+        
+        tp = (data['high'] + data['low'] + data['close']) / 3
+        expected_vwap_3 = (tp.iloc[0] * 1000 + tp.iloc[2] * 1500) / 2500
+        expected_vwap_4 = (tp.iloc[0] * 1000 + tp.iloc[2] * 1500 + tp.iloc[3] * 500) / 3000
+        expected_vwap_6 = (tp.iloc[4] * 800 + tp.iloc[5] * 1200) / 2000
+        
+        assert pd.isna(vwap.iloc[1])
+        assert vwap.isna().sum() == 1
+        assert abs(vwap.iloc[2] - expected_vwap_3) < 1e-12
+        assert abs(vwap.iloc[3] - expected_vwap_4) < 1e-12
+        assert abs(vwap.iloc[5] - expected_vwap_6) < 1e-12
+    
+    def test_calculate_vwap_matches_per_session_cumsum(self):
+        """Test VWAP over many sessions matches a per-day cumulative sum."""
+        rng = np.random.default_rng(7)
+        index = pd.date_range('2024-01-01', periods=24 * 5, freq='h')
+        close = 1.1 + np.cumsum(rng.normal(0, 0.001, len(index)))
+        data = pd.DataFrame({
+            'high': close + 0.001,
+            'low': close - 0.001,
+            'close': close,
+            'volume': rng.integers(0, 1000, len(index)).astype(float)
+        }, index=index)
+        data.iloc[48:50, data.columns.get_loc('volume')] = 0  # Day 3 opens with no volume
+        
+        vwap = self.calculator.calculate_vwap(data)
+        
+        typical_price = (data['high'] + data['low'] + data['close']) / 3
+        for _, day in data.groupby(data.index.date):
+            cum_volume = day['volume'].cumsum()
+            expected = (typical_price[day.index] * day['volume']).cumsum() / cum_volume
+            expected = expected.where(cum_volume > 0)
+            pd.testing.assert_series_equal(vwap[day.index], expected, check_names=False)
+    
+    def test_calculate_vwap_does_not_modify_input(self):
+        """Test VWAP accumulation never writes into the caller's DataFrame."""
+        data = pd.DataFrame({
+            'high': [1.10, 1.20, 1.15, 1.25],
+            'low': [1.05, 1.15, 1.10, 1.20],
+            'close': [1.08, 1.18, 1.12, 1.22],
+            'volume': [1000.0, 2000.0, 1500.0, 1200.0]
+        }, index=pd.date_range('2024-01-01', periods=4, freq='12h'))
+        original = data.copy()
+        
+        self.calculator.calculate_vwap(data)
+        
+        pd.testing.assert_frame_equal(data, original)
+    
+    def test_calculate_vwap_tz_aware_resets_at_local_midnight(self):
+        """Test VWAP sessions follow the index timezone's calendar days."""
+        index = pd.DatetimeIndex([
+            '2024-01-01 22:00', '2024-01-01 23:00',
+            '2024-01-02 00:00', '2024-01-02 01:00'  # New local day - VWAP should reset
+        ]).tz_localize('America/New_York')
+        data = pd.DataFrame({
+            'high': [1.10, 1.20, 1.15, 1.25],
+            'low': [1.05, 1.15, 1.10, 1.20],
+            'close': [1.08, 1.18, 1.12, 1.22],
+            'volume': [1000, 2000, 1500, 1200]
+        }, index=index)
+        
+        vwap = self.calculator.calculate_vwap(data)
+        
+        tp3 = (1.15 + 1.10 + 1.12) / 3
+        tp4 = (1.25 + 1.20 + 1.22) / 3
+        assert abs(vwap.iloc[2] - tp3) < 0.0001
+        assert abs(vwap.iloc[3] - (tp3 * 1500 + tp4 * 1200) / 2700) < 0.0001
 
 
 class TestSignalCalculatorEMA:
@@ -309,6 +392,54 @@ class TestSignalCalculatorEMA:
         assert ema.name == 'ema_3'
         assert len(ema) == len(data)
         assert ema.index.equals(data.index)
+    
+    def test_calculate_ema_lfilter_matches_pandas_ewm(self):
+        """Test the scipy lfilter EMA matches pandas ewm with adjust=False."""
+        pytest.importorskip("scipy")
+        rng = np.random.default_rng(3)
+        data = pd.DataFrame({'close': 1.1 + np.cumsum(rng.normal(0, 0.001, 500))})
+        
+        ema = self.calculator.calculate_ema(data, length=15)
+        
+        expected = data['close'].ewm(span=15, adjust=False).mean()
+        np.testing.assert_allclose(ema.to_numpy(), expected.to_numpy(), rtol=1e-12)
+    
+    def test_calculate_ema_talib_matches_pandas_ewm(self):
+        """Test the TA-Lib EMA backend keeps adjust=False seeding."""
+        pytest.importorskip("talib")
+        rng = np.random.default_rng(4)
+        data = pd.DataFrame({'close': 1.1 + np.cumsum(rng.normal(0, 0.001, 500))})
+        
+        ema = self.calculator.calculate_ema(data, length=15)
+        
+        expected = data['close'].ewm(span=15, adjust=False).mean()
+        assert not ema.isna().any()
+        np.testing.assert_allclose(ema.to_numpy(), expected.to_numpy(), rtol=1e-12)
+        
+        # The seed must be exactly the first close, or flat markets would
+        # show spurious ZLMA/EMA crossovers
+        flat = pd.DataFrame({'close': [1.23456] * 20})
+        assert (self.calculator.calculate_ema(flat, length=15) == 1.23456).all()
+    
+    def test_calculate_ema_forward_fills_nan(self):
+        """Test EMA forward-fills missing closes and keeps leading NaNs."""
+        data = pd.DataFrame({'close': [np.nan, 1.0, 1.2, np.nan, 1.1, 1.3]})
+        
+        ema = self.calculator.calculate_ema(data, length=3)
+        zlma = self.calculator.calculate_zlma(data, length=3)
+        
+        filled = pd.DataFrame({'close': [1.0, 1.2, 1.2, 1.1, 1.3]}, index=data.index[1:])
+        assert pd.isna(ema.iloc[0])
+        assert pd.isna(zlma.iloc[0])
+        np.testing.assert_allclose(ema.iloc[1:], self.calculator.calculate_ema(filled, length=3), rtol=1e-12)
+        np.testing.assert_allclose(zlma.iloc[1:], self.calculator.calculate_zlma(filled, length=3), rtol=1e-12)
+    
+    def test_calculate_ema_all_nan(self):
+        """Test EMA over an all-NaN close column is all NaN."""
+        data = pd.DataFrame({'close': [np.nan, np.nan, np.nan]})
+        
+        assert self.calculator.calculate_ema(data).isna().all()
+        assert self.calculator.calculate_zlma(data).isna().all()
 
 
 class TestSignalCalculatorZLMA:
@@ -448,6 +579,38 @@ class TestSignalCalculatorZLMA:
         
         # ZLMA should be closer to the target price (more responsive)
         assert zlma_distance < ema_distance, "ZLMA should be more responsive to price changes"
+    
+    def test_fused_kernel_matches_two_pass_formula(self):
+        """Test the fused numba EMA/ZLMA kernel matches the two-pass ewm formula."""
+        pytest.importorskip("numba")
+        from forex_alerts.services.signal_kernels import ema_zlma
+        
+        rng = np.random.default_rng(5)
+        close = pd.Series(1.1 + np.cumsum(rng.normal(0, 0.001, 500)))
+        
+        ema, zlma = ema_zlma(close.to_numpy(), 2.0 / (15 + 1))
+        
+        expected_ema = close.ewm(span=15, adjust=False).mean()
+        expected_zlma = (2 * close - expected_ema).ewm(span=15, adjust=False).mean()
+        np.testing.assert_allclose(ema, expected_ema.to_numpy(), rtol=1e-12)
+        np.testing.assert_allclose(zlma, expected_zlma.to_numpy(), rtol=1e-12)
+    
+    def test_kernels_not_loaded_at_import(self):
+        """Test importing the calculator doesn't import numba or compile kernels."""
+        code = ("import sys; import forex_alerts.services.signal_calculator; "
+                "print('numba' in sys.modules)")
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True,
+                                text=True, check=True)
+        assert result.stdout.strip() == "False"
+    
+    def test_kernels_compiled_for_both_dtypes(self):
+        """Test numba kernels are compiled for both float dtypes once loaded."""
+        pytest.importorskip("numba")
+        from forex_alerts.services.signal_kernels import ema_zlma, ema_zlma_batch
+        
+        for kernel in (ema_zlma, ema_zlma_batch):
+            compiled_dtypes = {str(signature[0].dtype) for signature in kernel.signatures}
+            assert compiled_dtypes == {'float32', 'float64'}
 
 
 class TestSignalCalculatorSignalDetection:
@@ -658,4 +821,296 @@ class TestSignalCalculatorSignalDetection:
             assert isinstance(signal.zlma_value, (int, float))
             assert isinstance(signal.ema_value, (int, float))
             assert isinstance(signal.confidence, (int, float))
-            assert 0.0 <= signal.confidence <= 1.0
\ No newline at end of file
+            assert 0.0 <= signal.confidence <= 1.0
+    
+    def test_detect_signals_matches_bar_by_bar_scan(self):
+        """Test vectorized crossover detection agrees with a bar-by-bar scan."""
+        rng = np.random.default_rng(42)
+        closes = 1.1 + np.cumsum(rng.normal(0, 0.001, 300))
+        data = pd.DataFrame({
+            'close': closes
+        }, index=pd.date_range('2024-01-01', periods=300, freq='h'))
+        
+        signals = self.calculator.detect_signals(data, "EURUSD")
+        
+        ema = self.calculator.calculate_ema(data)
+        zlma = self.calculator.calculate_zlma(data)
+        expected = []
+        for i in range(1, len(data)):
+            if zlma.iloc[i-1] <= ema.iloc[i-1] and zlma.iloc[i] > ema.iloc[i]:
+                expected.append((data.index[i], "BUY"))
+            elif zlma.iloc[i-1] >= ema.iloc[i-1] and zlma.iloc[i] < ema.iloc[i]:
+                expected.append((data.index[i], "SELL"))
+        
+        assert len(expected) > 0
+        assert [(s.timestamp, s.signal_type) for s in signals] == expected
+    
+    def test_detect_signals_skips_pairs_with_nan(self):
+        """Test no crossover is reported across bars with NaN indicators."""
+        data = pd.DataFrame({
+            'close': [np.nan, np.nan, 1.0, 1.2, 0.9, 1.3, 0.8, 1.4]
+        }, index=pd.date_range('2024-01-01', periods=8, freq='h'))
+        
+        signals = self.calculator.detect_signals(data, "EURUSD")
+        
+        ema = self.calculator.calculate_ema(data)
+        zlma = self.calculator.calculate_zlma(data)
+        assert ema.isna().sum() == 2
+        expected = []
+        for i in range(1, len(data)):
+            if pd.isna(zlma.iloc[i]) or pd.isna(ema.iloc[i]) or pd.isna(zlma.iloc[i-1]) or pd.isna(ema.iloc[i-1]):
+                continue
+            if zlma.iloc[i-1] <= ema.iloc[i-1] and zlma.iloc[i] > ema.iloc[i]:
+                expected.append((data.index[i], "BUY"))
+            elif zlma.iloc[i-1] >= ema.iloc[i-1] and zlma.iloc[i] < ema.iloc[i]:
+                expected.append((data.index[i], "SELL"))
+        
+        assert len(expected) > 0
+        assert [(s.timestamp, s.signal_type) for s in signals] == expected
+        assert all(s.timestamp > data.index[2] for s in signals)
+    
+    def test_detect_signals_skips_bars_around_close_gaps(self):
+        """Test no signal fires on, or right after, a bar with a missing close."""
+        rng = np.random.default_rng(7)
+        close = 1.0 + np.cumsum(rng.normal(0, 0.01, 300))
+        close[rng.random(300) < 0.1] = np.nan
+        data = pd.DataFrame({'close': close},
+                            index=pd.date_range('2024-01-01', periods=300, freq='h'))
+        
+        signals = self.calculator.detect_signals(data, "EURUSD")
+        
+        assert len(signals) > 0
+        assert not any(np.isnan(s.price) for s in signals)
+        gap_bars = set(data.index[np.isnan(close)])
+        gap_bars |= set(data.index[1:][np.isnan(close[:-1])])
+        assert not any(s.timestamp in gap_bars for s in signals)
+    
+    def test_detect_signals_keeps_index_timezone(self):
+        """Test signal timestamps are the tz-aware index labels of the crossover bars."""
+        data = pd.DataFrame({
+            'close': [1.0, 1.1, 1.2, 1.1, 0.9, 0.8, 1.0, 1.2, 1.4, 1.2, 1.0, 0.8]
+        }, index=pd.date_range('2024-01-01', periods=12, freq='h', tz='Europe/London'))
+        
+        signals = self.calculator.detect_signals(data, "GBPUSD")
+        
+        assert len(signals) > 0
+        for signal in signals:
+            assert signal.timestamp in data.index
+            assert str(signal.timestamp.tzinfo) == 'Europe/London'
+            assert isinstance(signal.price, float)
+            assert signal.price == data['close'][signal.timestamp]
+    
+    def test_detect_signals_arr_matches_dataframe_path(self):
+        """Test the raw-array entry point matches detect_signals."""
+        rng = np.random.default_rng(21)
+        data = pd.DataFrame({
+            'close': 1.1 + np.cumsum(rng.normal(0, 0.001, 200))
+        }, index=pd.date_range('2024-01-01', periods=200, freq='min'))
+        
+        expected = self.calculator.detect_signals(data, "EURUSD")
+        signals = self.calculator.detect_signals_arr(data['close'].to_numpy(), data.index.asi8, "EURUSD")
+        
+        assert len(expected) > 0
+        assert signals == expected
+    
+    def test_detect_signals_arr_without_index(self):
+        """Test raw-array signals are stamped with UTC now when no index is given."""
+        close = np.array([1.0, 1.1, 1.2, 1.1, 0.9, 0.8, 1.0, 1.2, 1.4, 1.2, 1.0, 0.8])
+        
+        signals = self.calculator.detect_signals_arr(close, None, "EURUSD")
+        
+        assert len(signals) > 0
+        for signal in signals:
+            assert signal.timestamp.tzinfo is timezone.utc
+    
+    def test_detect_signals_arr_insufficient_data(self):
+        """Test the raw-array entry point rejects too-short input."""
+        with pytest.raises(ValueError, match="Insufficient data: need at least 3 periods"):
+            self.calculator.detect_signals_arr(np.array([1.0, 1.1]), None, "EURUSD")
+    
+    def test_confidence_vec_matches_scalar(self):
+        """Test vectorized confidence agrees with the scalar calculation."""
+        cases = np.array([
+            [1.1010, 1.1000, 1.0995, 1.1000],  # Regular bullish crossover
+            [1.0990, 1.1000, 1.1000, 1.1000],  # No previous separation
+            [1.2000, 1.0000, 1.0990, 1.1000],  # Wide separation, capped terms
+            [0.0000, 0.0000, 0.0000, 0.0000],  # Zero prices
+        ])
+        
+        expected = [0.7907314856882247, 0.5909504320145622, 1.0, 0.5]
+        
+        confidences = self.calculator._calculate_signal_confidence_vec(*cases.T)
+        
+        np.testing.assert_allclose(confidences, expected, rtol=1e-12)
+        for row, confidence in zip(cases, expected):
+            assert abs(self.calculator._calculate_signal_confidence(*row) - confidence) < 1e-12
+
+
+class TestSignalCalculatorStreaming:
+    """Test cases for incremental (streaming) signal updates."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.calculator = SignalCalculator(ema_length=5)
+    
+    def _make_data(self, periods: int) -> pd.DataFrame:
+        """Build a random-walk close series with a minute index."""
+        rng = np.random.default_rng(11)
+        close = 1.1 + np.cumsum(rng.normal(0, 0.001, periods))
+        return pd.DataFrame({
+            'close': close
+        }, index=pd.date_range('2024-01-01', periods=periods, freq='min'))
+    
+    def _bar(self, timestamp, close: float) -> MarketData:
+        """Build a flat EURUSD bar closing at the given price."""
+        return MarketData(symbol="EURUSD", timestamp=timestamp, open=close,
+                          high=close, low=close, close=close, volume=100)
+    
+    def test_update_matches_full_recalculation(self):
+        """Test streamed bars produce the same signals as a full backfill."""
+        data = self._make_data(400)
+        backfill = 100
+        
+        expected = [s for s in SignalCalculator(ema_length=5).detect_signals(data, "EURUSD")
+                    if s.timestamp > data.index[backfill - 1]]
+        
+        self.calculator.detect_signals(data.iloc[:backfill], "EURUSD")
+        streamed = []
+        for timestamp, close in data['close'].iloc[backfill:].items():
+            signal = self.calculator.update(self._bar(timestamp, close))
+            if signal is not None:
+                streamed.append(signal)
+        
+        assert len(expected) > 0
+        assert [(s.timestamp, s.signal_type) for s in streamed] == [(s.timestamp, s.signal_type) for s in expected]
+        for got, want in zip(streamed, expected):
+            assert abs(got.zlma_value - want.zlma_value) < 1e-9
+            assert abs(got.ema_value - want.ema_value) < 1e-9
+            assert abs(got.confidence - want.confidence) < 1e-6
+    
+    def test_update_without_state_seeds(self):
+        """Test the first streamed bar for a symbol only seeds the state."""
+        timestamp = datetime(2024, 1, 1, 9, 0)
+        
+        assert self.calculator.update(self._bar(timestamp, 1.1)) is None
+        assert self.calculator._ema_state["EURUSD"] == 1.1
+        assert self.calculator._zlma_state["EURUSD"] == 1.1
+        assert self.calculator._last_index["EURUSD"] == pd.Timestamp(timestamp).value
+    
+    def test_update_ignores_stale_bars(self):
+        """Test bars at or before the last processed timestamp are ignored."""
+        data = self._make_data(50)
+        self.calculator.detect_signals(data, "EURUSD")
+        ema_state = self.calculator._ema_state["EURUSD"]
+        
+        assert self.calculator.update(self._bar(data.index[-1], 2.0)) is None
+        assert self.calculator.update(self._bar(data.index[10], 2.0)) is None
+        assert self.calculator._ema_state["EURUSD"] == ema_state
+    
+    def test_update_after_tz_aware_history(self):
+        """Test naive and tz-aware bars both compare against tz-aware history in UTC."""
+        data = self._make_data(50).tz_localize('America/New_York')
+        self.calculator.detect_signals(data, "EURUSD")
+        ema_state = self.calculator._ema_state["EURUSD"]
+        last_utc = data.index[-1].tz_convert('UTC').tz_localize(None).to_pydatetime()
+        
+        # Same instant as the last bar, given as naive UTC: stale
+        assert self.calculator.update(self._bar(last_utc, 2.0)) is None
+        assert self.calculator._ema_state["EURUSD"] == ema_state
+        
+        # One minute later, naive UTC and tz-aware bars both advance the state
+        self.calculator.update(self._bar(last_utc + timedelta(minutes=1), 2.0))
+        assert self.calculator._ema_state["EURUSD"] != ema_state
+        ema_state = self.calculator._ema_state["EURUSD"]
+        self.calculator.update(self._bar(data.index[-1] + pd.Timedelta(minutes=2), 2.0))
+        assert self.calculator._ema_state["EURUSD"] != ema_state
+
+
+class TestSignalCalculatorBatch:
+    """Test cases for multi-symbol batch EMA/ZLMA calculations."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.calculator = SignalCalculator(ema_length=15)
+        rng = np.random.default_rng(9)
+        self.closes = 1.1 + np.cumsum(rng.normal(0, 0.001, (300, 4)), axis=0)
+    
+    def test_batch_matches_per_symbol(self):
+        """Test each batch column matches the single-symbol calculation."""
+        ema = self.calculator.calculate_ema_batch(self.closes)
+        zlma = self.calculator.calculate_zlma_batch(self.closes)
+        
+        assert ema.shape == self.closes.shape
+        assert zlma.shape == self.closes.shape
+        for j in range(self.closes.shape[1]):
+            data = pd.DataFrame({'close': self.closes[:, j]})
+            np.testing.assert_allclose(ema[:, j], self.calculator.calculate_ema(data).to_numpy(), rtol=1e-12)
+            np.testing.assert_allclose(zlma[:, j], self.calculator.calculate_zlma(data).to_numpy(), rtol=1e-12)
+    
+    def test_batch_with_nan_matches_per_symbol(self):
+        """Test batch input containing NaN matches the single-symbol calculation."""
+        closes = self.closes.copy()
+        closes[50, 2] = np.nan
+        
+        zlma = self.calculator.calculate_zlma_batch(closes)
+        
+        data = pd.DataFrame({'close': closes[:, 2]})
+        np.testing.assert_allclose(zlma[:, 2], self.calculator.calculate_zlma(data).to_numpy(), rtol=1e-12)
+    
+    def test_batch_custom_length(self):
+        """Test batch calculation honours an explicit length."""
+        ema = self.calculator.calculate_ema_batch(self.closes, length=3)
+        
+        data = pd.DataFrame({'close': self.closes[:, 0]})
+        np.testing.assert_allclose(ema[:, 0], self.calculator.calculate_ema(data, length=3).to_numpy(), rtol=1e-12)
+    
+    def test_batch_invalid_input(self):
+        """Test batch calculation rejects malformed input."""
+        with pytest.raises(ValueError, match="2D array"):
+            self.calculator.calculate_ema_batch(self.closes[:, 0])
+        
+        with pytest.raises(ValueError, match="Data cannot be empty"):
+            self.calculator.calculate_zlma_batch(np.empty((0, 3)))
+        
+        with pytest.raises(ValueError, match="EMA length must be positive"):
+            self.calculator.calculate_ema_batch(self.closes, length=0)
+
+
+class TestSignalCalculatorFloat32:
+    """Test cases for single-precision indicator calculation."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.calculator = SignalCalculator(ema_length=15, dtype=np.float32)
+        self.reference = SignalCalculator(ema_length=15)
+        rng = np.random.default_rng(13)
+        self.data = pd.DataFrame({
+            'close': 1.1 + np.cumsum(rng.normal(0, 0.001, 500))
+        }, index=pd.date_range('2024-01-01', periods=500, freq='min'))
+    
+    def test_init_invalid_dtype(self):
+        """Test SignalCalculator rejects non-float dtypes."""
+        with pytest.raises(ValueError, match="Unsupported dtype"):
+            SignalCalculator(ema_length=15, dtype=np.int64)
+    
+    def test_float32_indicators_track_float64(self):
+        """Test float32 EMA/ZLMA stay within single precision of float64."""
+        ema = self.calculator.calculate_ema(self.data)
+        zlma = self.calculator.calculate_zlma(self.data)
+        batch = self.calculator.calculate_zlma_batch(np.column_stack([self.data['close']] * 2))
+        
+        assert ema.dtype == np.float32
+        assert zlma.dtype == np.float32
+        assert batch.dtype == np.float32
+        np.testing.assert_allclose(ema, self.reference.calculate_ema(self.data), rtol=1e-6)
+        np.testing.assert_allclose(zlma, self.reference.calculate_zlma(self.data), rtol=1e-6)
+    
+    def test_float32_signals_are_python_floats(self):
+        """Test float32 signals carry plain float values."""
+        signals = self.calculator.detect_signals(self.data, "EURUSD")
+        
+        assert len(signals) > 0
+        for signal in signals:
+            assert isinstance(signal.zlma_value, float)
+            assert isinstance(signal.ema_value, float)
+            assert isinstance(signal.confidence, float)
\ No newline at end of file